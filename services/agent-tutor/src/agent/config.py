@@ -55,6 +55,22 @@ class _AgentConfig:
     def max_conversation_turns(self) -> int:
         return self._s.max_conversation_turns
 
+    @property
+    def history_keep_turns(self) -> int:
+        return self._s.history_keep_turns
+
+    @property
+    def history_token_budget(self) -> int:
+        return self._s.history_token_budget
+
+    @property
+    def tool_output_token_budget(self) -> int:
+        return self._s.tool_output_token_budget
+
+    @property
+    def checkpoint_durability(self) -> str:
+        return self._s.checkpoint_durability
+
     @property
     def ready_tasks_limit(self) -> int:
         return self._s.ready_tasks_limit
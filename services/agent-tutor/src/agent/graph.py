@@ -14,13 +14,14 @@ Supports two modes:
 
 import json
 import logging
+from collections import OrderedDict
 from collections.abc import Callable
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Literal
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
@@ -28,11 +29,21 @@ from langgraph.graph.state import CompiledStateGraph
 
 # Note: create_react_agent will move to langchain.agents in LangGraph 2.0
 from langgraph.prebuilt import create_react_agent
+from ltt.tools import tool_loader_scope
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agent.config import Config, get_config
-from agent.prompts import build_system_prompt
-from agent.state import AgentState, EpicContext, LearnerProgress, ProjectContext, TaskContext
+from agent.history import TutorAgentState, create_history_hook
+from agent.prompts import build_system_prompt_blocks
+from agent.state import (
+    AgentState,
+    EpicContext,
+    LearnerProgress,
+    ProjectContext,
+    TaskContext,
+    TurnContext,
+)
+from agent.tool_output import tool_output_scope
 from agent.tools import create_tools
 
 if TYPE_CHECKING:
@@ -56,6 +67,33 @@ def create_model(config: Config, model_name: str | None = None) -> ChatAnthropic
     Returns:
         Configured ChatAnthropic instance
     """
+    return ChatAnthropic(**_model_kwargs(config, model_name))
+
+
+# Shared clients keyed by their settings, so HTTP connections are reused
+_models: dict[str, ChatAnthropic] = {}
+
+
+def get_model(config: Config, model_name: str | None = None) -> ChatAnthropic:
+    """
+    Get the process-wide ChatAnthropic client for the configured settings.
+
+    Args:
+        config: Application configuration
+        model_name: Optional model name override
+
+    Returns:
+        Shared ChatAnthropic instance
+    """
+    kwargs = _model_kwargs(config, model_name)
+    key = json.dumps(kwargs, sort_keys=True)
+    model = _models.get(key)
+    if model is None:
+        model = _models[key] = ChatAnthropic(**kwargs)
+    return model
+
+
+def _model_kwargs(config: Config, model_name: str | None) -> dict:
     actual_model = model_name or config.model.tutor_model
 
     # api_key must be passed explicitly because the env var is
@@ -75,7 +113,7 @@ def create_model(config: Config, model_name: str | None = None) -> ChatAnthropic
             "budget_tokens": config.model.thinking_budget_tokens,
         }
 
-    return ChatAnthropic(**model_kwargs)
+    return model_kwargs
 
 
 # =============================================================================
@@ -113,21 +151,128 @@ def create_react_tutor_agent(
     if checkpointer is None:
         checkpointer = MemorySaver()
 
-    # Build default system prompt if not provided
+    # Build default system prompt if not provided (static part prompt-cached)
     if system_prompt is None:
-        system_prompt = build_system_prompt(project_id=project_id)
+        prompt = SystemMessage(content=build_system_prompt_blocks(project_id=project_id))
+    else:
+        prompt = system_prompt
 
     # Create the ReAct agent
     graph = create_react_agent(
         model=model,
         tools=tools,
-        prompt=system_prompt,
+        prompt=prompt,
         checkpointer=checkpointer,
     )
 
     return graph
 
 
+# Upper bound on cached compiled graphs (least recently used evicted first)
+MAX_CACHED_GRAPHS = 32
+
+# Compiled ReAct graphs and their tools, keyed by (project ID, project version,
+# model, session factory, checkpointer, store)
+_graphs: OrderedDict[tuple, tuple[CompiledStateGraph, list]] = OrderedDict()
+
+
+def _turn_prompt(state: dict, config: RunnableConfig) -> list:
+    """
+    Prepend the invocation's system prompt (see TurnContext) to the history.
+
+    The summary of folded turns (see agent.history) goes after the prompt,
+    so it never invalidates the cached static prefix.
+    """
+    turn: TurnContext | None = config.get("configurable", {}).get("turn")
+    system_prompt = turn.system_prompt if turn is not None else ""
+    summary = state.get("history_summary")
+    if summary:
+        summary = f"## Earlier in this conversation\n{summary}"
+        if isinstance(system_prompt, list):
+            system_prompt = [*system_prompt, {"type": "text", "text": summary}]
+        else:
+            system_prompt = f"{system_prompt}\n\n{summary}" if system_prompt else summary
+    if not system_prompt:
+        return state["messages"]
+    return [SystemMessage(content=system_prompt), *state["messages"]]
+
+
+def get_react_graph(
+    project_id: str,
+    project_version: int,
+    model: ChatAnthropic,
+    session_factory: Callable[[], AsyncSession],
+    checkpointer: BaseCheckpointSaver,
+    store: "BaseStore | None" = None,
+) -> tuple[CompiledStateGraph, list]:
+    """
+    Get the shared compiled ReAct graph for a project.
+
+    The graph holds nothing learner-specific: tools and the system prompt
+    read the learner, project and prompt from the TurnContext each
+    invocation passes in ``configurable["turn"]``. Compiled graphs are kept
+    in a bounded LRU; a new project version compiles a new graph.
+
+    Returns:
+        (compiled graph, its tools)
+    """
+    key = (
+        project_id,
+        project_version,
+        id(model),
+        id(session_factory),
+        id(checkpointer),
+        id(store),
+    )
+    cached = _graphs.get(key)
+    if cached is not None:
+        _graphs.move_to_end(key)
+        return cached
+
+    _graphs[key] = compile_react_graph(model, session_factory, checkpointer, store)
+    while len(_graphs) > MAX_CACHED_GRAPHS:
+        _graphs.popitem(last=False)
+    return _graphs[key]
+
+
+def compile_react_graph(
+    model: ChatAnthropic,
+    session_factory: Callable[[], AsyncSession],
+    checkpointer: BaseCheckpointSaver,
+    store: "BaseStore | None" = None,
+) -> tuple[CompiledStateGraph, list]:
+    """
+    Compile a learner-independent ReAct graph (uncached; see get_react_graph).
+
+    The conversation history is bounded before each LLM call (see
+    agent.history).
+
+    Returns:
+        (compiled graph, its tools)
+    """
+    agent_config = get_config().agent
+    tools = create_tools(session_factory, None, None, store=store)
+    graph = create_react_agent(
+        model=model,
+        tools=tools,
+        prompt=RunnableLambda(_turn_prompt),
+        state_schema=TutorAgentState,
+        pre_model_hook=create_history_hook(
+            model,
+            keep_turns=agent_config.history_keep_turns,
+            max_turns=agent_config.max_conversation_turns,
+            token_budget=agent_config.history_token_budget,
+        ),
+        checkpointer=checkpointer,
+    )
+    return graph, tools
+
+
+def clear_graph_cache() -> None:
+    """Drop all cached compiled graphs (e.g. after the checkpointer is replaced)."""
+    _graphs.clear()
+
+
 # =============================================================================
 # Custom Graph (Legacy)
 # =============================================================================
@@ -185,7 +330,7 @@ async def agent_node(
             "description": state.current_epic.description,
         }
 
-    system_prompt = build_system_prompt(
+    system_prompt = build_system_prompt_blocks(
         project_id=state.project_id,
         narrative_context=state.project_context.narrative_context
         if state.project_context
@@ -249,7 +394,7 @@ async def tool_node(
             try:
                 # Execute the tool
                 tool = tools_by_name[tool_name]
-                result = await tool.ainvoke(tool_args)
+                result = await tool.ainvoke(tool_args, config)
 
                 # Update state based on tool results
                 state_updates.update(_extract_state_updates(tool_name, result))
@@ -411,7 +556,9 @@ async def create_agent(
 
     Async to allow eager loading of project context and learner memory
     into the system prompt.  Agent construction itself is still cheap —
-    no LLM calls happen here.
+    no LLM calls happen here.  With a shared checkpointer the compiled
+    ReAct graph and model client are reused across requests and learners
+    (see get_react_graph); only the TurnContext is built per call.
 
     Args:
         learner_id: The learner's ID
@@ -450,14 +597,17 @@ async def create_agent(
     project_context: ProjectContext | None = None
     epic_context: EpicContext | None = None
     project_slug: str | None = None
+    project_version = 0
 
     try:
         from ltt.models import TaskType
-        from ltt.services.progress_service import get_or_create_progress
-        from ltt.services.task_service import get_children, get_task
+        from ltt.services.progress_service import get_statuses
+        from ltt.services.project_snapshot import load_project_snapshot
 
         async with session_factory() as sess:
-            project = await get_task(sess, project_id)
+            snapshot = await load_project_snapshot(sess, project_id)
+            project_version = snapshot.version
+            project = snapshot.project
             if project:
                 workspace_type = getattr(project, "workspace_type", None)
                 tutor_persona = getattr(project, "tutor_persona", None)
@@ -473,19 +623,16 @@ async def create_agent(
                 )
 
                 # Find current epic (in_progress > first open)
-                children = await get_children(sess, project_id, recursive=False)
+                children = snapshot.children_of(project_id)
                 epics = [c for c in children if c.task_type == TaskType.EPIC]
+                statuses = await get_statuses(sess, learner_id, [e.id for e in epics])
                 for epic in epics:
-                    progress = await get_or_create_progress(sess, epic.id, learner_id)
-                    status = progress.status.value if hasattr(progress.status, "value") else progress.status
-                    if status == "in_progress":
+                    if statuses[epic.id] == "in_progress":
                         epic_context = EpicContext(epic_id=epic.id, title=epic.title, description=epic.description)
                         break
                 if epic_context is None:
                     for epic in epics:
-                        progress = await get_or_create_progress(sess, epic.id, learner_id)
-                        status = progress.status.value if hasattr(progress.status, "value") else progress.status
-                        if status in ("open", "in_progress"):
+                        if statuses[epic.id] in ("open", "in_progress"):
                             epic_context = EpicContext(epic_id=epic.id, title=epic.title, description=epic.description)
                             break
     except Exception:
@@ -505,28 +652,16 @@ async def create_agent(
         except Exception:
             logger.debug("Failed to load learner memory", exc_info=True)
 
-    # Create the model with thinking support if enabled
-    model = create_model(config, model_name)
-
-    # Create tools bound to session factory and learner
-    tools = create_tools(
-        session_factory,
-        learner_id,
-        project_id,
-        store=store,
-        project_slug=project_slug,
-    )
-
-    # Create checkpointer if not provided
-    if checkpointer is None:
-        checkpointer = MemorySaver()
+    # Shared client (reuses HTTP connections) with thinking support if enabled
+    model = get_model(config, model_name)
 
     # ── Build system prompt with full context ────────────────────────
     epic_dict = None
     if epic_context:
         epic_dict = {"id": epic_context.epic_id, "title": epic_context.title, "description": epic_context.description}
 
-    system_prompt = build_system_prompt(
+    # Project-level prefix (prompt-cached) + learner-level suffix
+    system_prompt = build_system_prompt_blocks(
         project_id=project_id,
         narrative_context=project_context.narrative_context if project_context else None,
         project_description=project_context.description if project_context else None,
@@ -535,23 +670,37 @@ async def create_agent(
         workspace_type=project_context.workspace_type if project_context else None,
         custom_persona=project_context.tutor_persona if project_context else None,
         include_memory_instructions=store is not None,
+        project_version=project_version,
+        learner_context=memory_block or None,
     )
 
-    if memory_block:
-        system_prompt = system_prompt + "\n\n" + memory_block
+    turn = TurnContext(
+        learner_id=learner_id,
+        project_id=project_id,
+        project_slug=project_slug,
+        system_prompt=system_prompt,
+    )
 
     # Choose agent implementation based on config
     if config.agent.use_react_agent:
-        graph = create_react_agent(
-            model=model,
-            tools=tools,
-            prompt=system_prompt,
-            checkpointer=checkpointer,
-        )
+        if checkpointer is None:
+            # A private in-memory history; not worth caching a graph for
+            graph, tools = compile_react_graph(model, session_factory, MemorySaver(), store)
+        else:
+            graph, tools = get_react_graph(
+                project_id, project_version, model, session_factory, checkpointer, store
+            )
     else:
-        # Use custom graph (legacy)
+        # Use custom graph (legacy) with tools bound to the learner
+        tools = create_tools(
+            session_factory,
+            learner_id,
+            project_id,
+            store=store,
+            project_slug=project_slug,
+        )
         workflow = create_custom_graph()
-        graph = workflow.compile(checkpointer=checkpointer)
+        graph = workflow.compile(checkpointer=checkpointer or MemorySaver())
 
     # Return a configured wrapper
     return AgentWrapper(
@@ -562,6 +711,7 @@ async def create_agent(
         project_id=project_id,
         session_factory=session_factory,
         config=config,
+        turn=turn,
     )
 
 
@@ -581,6 +731,7 @@ class AgentWrapper:
         project_id: str,
         session_factory: Callable[[], AsyncSession],
         config: Config | None = None,
+        turn: TurnContext | None = None,
     ):
         self.graph = graph
         self.model = model
@@ -589,6 +740,7 @@ class AgentWrapper:
         self.project_id = project_id
         self.session_factory = session_factory
         self.config = config or get_config()
+        self.turn = turn or TurnContext(learner_id=learner_id, project_id=project_id)
         self._thread_id = f"{learner_id}-{project_id}"
         self._project_context: ProjectContext | None = None
         self._current_epic: EpicContext | None = None
@@ -635,26 +787,24 @@ class AgentWrapper:
         """
         try:
             from ltt.models import TaskType
-            from ltt.services.progress_service import get_or_create_progress
-            from ltt.services.task_service import get_children
+            from ltt.services.progress_service import get_statuses
+            from ltt.services.project_snapshot import load_project_snapshot
 
             async with self.session_factory() as session:
-                # Get all epics for this project
-                children = await get_children(session, self.project_id, recursive=False)
+                # Get all epics for this project (cached template snapshot)
+                snapshot = await load_project_snapshot(session, self.project_id)
+                children = snapshot.children_of(self.project_id)
                 epics = [c for c in children if c.task_type == TaskType.EPIC]
 
                 if not epics:
                     return None
 
+                # Learner's epic statuses in one read-only query (missing = open)
+                statuses = await get_statuses(session, self.learner_id, [e.id for e in epics])
+
                 # Find epic with in-progress tasks first
                 for epic in epics:
-                    progress = await get_or_create_progress(session, epic.id, self.learner_id)
-                    status = (
-                        progress.status.value
-                        if hasattr(progress.status, "value")
-                        else progress.status
-                    )
-                    if status == "in_progress":
+                    if statuses[epic.id] == "in_progress":
                         self._current_epic = EpicContext(
                             epic_id=epic.id,
                             title=epic.title,
@@ -664,13 +814,7 @@ class AgentWrapper:
 
                 # Fall back to first open epic
                 for epic in epics:
-                    progress = await get_or_create_progress(session, epic.id, self.learner_id)
-                    status = (
-                        progress.status.value
-                        if hasattr(progress.status, "value")
-                        else progress.status
-                    )
-                    if status in ("open", "in_progress"):
+                    if statuses[epic.id] in ("open", "in_progress"):
                         self._current_epic = EpicContext(
                             epic_id=epic.id,
                             title=epic.title,
@@ -696,6 +840,7 @@ class AgentWrapper:
             "configurable": {
                 "model": self.model,
                 "tools": self.tools,
+                "turn": self.turn,
                 "thread_id": thread_id or self._thread_id,
             }
         }
@@ -704,6 +849,7 @@ class AgentWrapper:
         self,
         message: str,
         thread_id: str | None = None,
+        message_id: str | None = None,
     ) -> dict:
         """
         Invoke the agent with a user message.
@@ -711,6 +857,8 @@ class AgentWrapper:
         Args:
             message: The user's message
             thread_id: Optional thread ID for conversation tracking
+            message_id: Optional ID for the user message, to find where this
+                turn starts in the returned messages (see turn_messages)
 
         Returns:
             The agent's response state
@@ -719,7 +867,7 @@ class AgentWrapper:
 
         if self.use_react_agent:
             # ReAct agent uses simpler message format
-            input_state = {"messages": [{"role": "user", "content": message}]}
+            input_state = {"messages": [HumanMessage(content=message, id=message_id)]}
         else:
             # Custom graph needs full state
             project_context = await self._load_project_context()
@@ -728,17 +876,22 @@ class AgentWrapper:
             input_state = {
                 "learner_id": self.learner_id,
                 "project_id": self.project_id,
-                "messages": [HumanMessage(content=message)],
+                "messages": [HumanMessage(content=message, id=message_id)],
                 "project_context": project_context,
                 "current_epic": current_epic,
             }
 
-        return await self.graph.ainvoke(input_state, config)
+        # Tool calls of this turn share one lookup cache and get_context diff
+        with tool_loader_scope(self.learner_id), tool_output_scope():
+            return await self.graph.ainvoke(
+                input_state, config, durability=self.config.agent.checkpoint_durability
+            )
 
     async def astream(
         self,
         message: str,
         thread_id: str | None = None,
+        message_id: str | None = None,
     ):
         """
         Stream the agent's response.
@@ -746,6 +899,7 @@ class AgentWrapper:
         Args:
             message: The user's message
             thread_id: Optional thread ID for conversation tracking
+            message_id: Optional ID for the user message (see ainvoke)
 
         Yields:
             State updates as the agent processes
@@ -754,7 +908,7 @@ class AgentWrapper:
 
         if self.use_react_agent:
             # ReAct agent uses simpler message format
-            input_state = {"messages": [{"role": "user", "content": message}]}
+            input_state = {"messages": [HumanMessage(content=message, id=message_id)]}
         else:
             # Custom graph needs full state
             project_context = await self._load_project_context()
@@ -763,13 +917,20 @@ class AgentWrapper:
             input_state = {
                 "learner_id": self.learner_id,
                 "project_id": self.project_id,
-                "messages": [HumanMessage(content=message)],
+                "messages": [HumanMessage(content=message, id=message_id)],
                 "project_context": project_context,
                 "current_epic": current_epic,
             }
 
-        async for event in self.graph.astream(input_state, config, stream_mode="values"):
-            yield event
+        # Tool calls of this turn share one lookup cache and get_context diff
+        with tool_loader_scope(self.learner_id), tool_output_scope():
+            async for event in self.graph.astream(
+                input_state,
+                config,
+                stream_mode="values",
+                durability=self.config.agent.checkpoint_durability,
+            ):
+                yield event
 
     def get_state(self, thread_id: str | None = None) -> dict | None:
         """Get the current state for a thread."""
@@ -788,6 +949,20 @@ class AgentWrapper:
             return None
 
 
+def turn_messages(messages: list, message_id: str) -> list:
+    """
+    The messages of one turn: its user message (by ID) and everything after.
+
+    Lets callers find a turn's messages in the returned state without
+    loading the thread's state beforehand. Returns all messages if the user
+    message is not found.
+    """
+    for i, message in enumerate(messages):
+        if getattr(message, "id", None) == message_id:
+            return messages[i:]
+    return messages
+
+
 async def create_agent_simple(
     learner_id: str,
     project_id: str,
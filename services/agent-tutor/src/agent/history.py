@@ -0,0 +1,176 @@
+"""
+Bounded conversation history for the ReAct tutor agent.
+
+Without management, every LLM call replays the whole thread, so tokens,
+latency and checkpoint size grow with the length of a session. The
+``pre_model_hook`` built by ``create_history_hook`` runs before each LLM
+call and keeps the history within bounds:
+
+1. Once the history exceeds the token budget, tool results of earlier turns
+   are cut to a short excerpt (they are the bulk of most histories).
+2. When there are more than ``max_turns`` turns, or the history is still
+   over budget, the oldest turns are folded into a rolling summary kept in
+   graph state (``history_summary``) and removed from the thread, leaving
+   the last ``keep_turns`` turns verbatim (fewer if the budget requires).
+
+The current turn is never touched. Folding several turns at once means the
+summarization call runs every few turns rather than on every turn. The
+summary is shown to the model after the cached system prompt prefix (see
+``agent.graph._turn_prompt``).
+
+A turn starts at a learner message and runs until the next one.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import NotRequired
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    RemoveMessage,
+    ToolMessage,
+)
+from langchain_core.messages.utils import count_tokens_approximately
+from langgraph.prebuilt.chat_agent_executor import AgentState as ReactAgentState
+
+logger = logging.getLogger(__name__)
+
+# Characters of an earlier turn's tool result kept after compaction
+TOOL_RESULT_EXCERPT_CHARS = 400
+COMPACTED_MARKER = "\n…[older tool result truncated]"
+
+# Characters of one message shown to the summarizer
+_TRANSCRIPT_MESSAGE_CHARS = 2000
+
+SUMMARY_PROMPT = """You keep a running summary of a tutoring conversation between a tutor \
+and a learner so the tutor can continue it without the full transcript.
+
+Current summary:
+{summary}
+
+Messages to fold into the summary:
+{transcript}
+
+Write the updated summary in at most 250 words. Keep what the tutor needs: tasks \
+started, submitted or completed, the learner's misconceptions and strengths, hints \
+already given, questions still open, and anything the learner said about themselves. \
+Drop greetings and small talk. Reply with the summary only."""
+
+
+class TutorAgentState(ReactAgentState):
+    """ReAct agent state plus the rolling summary of folded turns."""
+
+    history_summary: NotRequired[str]
+
+
+def create_history_hook(
+    model: ChatAnthropic,
+    keep_turns: int,
+    max_turns: int,
+    token_budget: int,
+) -> Callable[[dict], Awaitable[dict]]:
+    """
+    Create the pre-model hook that bounds the conversation history.
+
+    Args:
+        model: Model used to write the rolling summary
+        keep_turns: Turns kept verbatim after folding
+        max_turns: Turns allowed before older ones are folded
+        token_budget: Approximate token budget for the verbatim history
+
+    Returns:
+        Async state -> update function for ``create_react_agent(pre_model_hook=...)``
+    """
+
+    async def manage_history(state: dict) -> dict:
+        turns = split_turns(state["messages"])
+        if len(turns) <= 1:
+            return {"messages": []}
+
+        # 1. Compact tool results of earlier turns
+        compacted: dict[str, ToolMessage] = {}
+        if _count(turns) > token_budget:
+            for turn in turns[:-1]:
+                for message in turn:
+                    excerpt = _compact_tool_result(message)
+                    if excerpt is not None:
+                        compacted[message.id] = excerpt
+            turns = [[compacted.get(m.id, m) for m in turn] for turn in turns]
+
+        # 2. Fold the oldest turns into the summary
+        fold = len(turns) - keep_turns if len(turns) > max_turns else 0
+        sizes = [_count([turn]) for turn in turns]
+        while fold < len(turns) - 1 and sum(sizes[fold:]) > token_budget:
+            fold += 1
+
+        if fold <= 0:
+            return {"messages": list(compacted.values())}
+
+        folded = [message for turn in turns[:fold] for message in turn]
+        try:
+            summary = await summarize(model, state.get("history_summary", ""), folded)
+        except Exception:
+            logger.warning("History summarization failed; keeping turns", exc_info=True)
+            return {"messages": list(compacted.values())}
+
+        folded_ids = {message.id for message in folded}
+        updates: list[BaseMessage] = [
+            message for message in compacted.values() if message.id not in folded_ids
+        ]
+        updates += [RemoveMessage(id=message_id) for message_id in folded_ids]
+        return {"messages": updates, "history_summary": summary}
+
+    return manage_history
+
+
+def split_turns(messages: list[BaseMessage]) -> list[list[BaseMessage]]:
+    """Group messages into turns, each starting at a learner message."""
+    turns: list[list[BaseMessage]] = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return turns
+
+
+async def summarize(model: ChatAnthropic, summary: str, messages: list[BaseMessage]) -> str:
+    """Fold messages into the rolling summary."""
+    prompt = SUMMARY_PROMPT.format(
+        summary=summary or "(none yet)",
+        transcript="\n".join(_transcript_line(message) for message in messages),
+    )
+    response = await model.ainvoke([HumanMessage(content=prompt)])
+    return response.text.strip()
+
+
+def _count(turns: list[list[BaseMessage]]) -> int:
+    return count_tokens_approximately([message for turn in turns for message in turn])
+
+
+def _compact_tool_result(message: BaseMessage) -> ToolMessage | None:
+    """Return a truncated copy of a long tool result, or None to keep it."""
+    if not isinstance(message, ToolMessage) or not isinstance(message.content, str):
+        return None
+    if len(message.content) <= TOOL_RESULT_EXCERPT_CHARS + len(COMPACTED_MARKER):
+        return None
+    content = message.content[:TOOL_RESULT_EXCERPT_CHARS] + COMPACTED_MARKER
+    return message.model_copy(update={"content": content})
+
+
+def _transcript_line(message: BaseMessage) -> str:
+    if isinstance(message, HumanMessage):
+        speaker = "Learner"
+    elif isinstance(message, ToolMessage):
+        speaker = f"Tool result ({message.name})"
+    else:
+        speaker = "Tutor"
+
+    text = message.text
+    if isinstance(message, AIMessage) and message.tool_calls:
+        calls = ", ".join(f"{call['name']}({call['args']})" for call in message.tool_calls)
+        text = f"{text}\n[called {calls}]".strip()
+    return f"{speaker}: {text[:_TRANSCRIPT_MESSAGE_CHARS]}"
@@ -8,6 +8,8 @@ These prompts guide the agent to use Socratic teaching methods:
 - Encourage critical thinking
 """
 
+from functools import lru_cache
+
 # =============================================================================
 # Operational Instructions (shared across all prompts)
 # =============================================================================
@@ -263,6 +265,26 @@ SYSTEM_PROMPT_TEMPLATE = """{persona}
 # Legacy full prompt for backwards compatibility
 SYSTEM_PROMPT = SYSTEM_PROMPT_TEMPLATE
 
+# The template split at the boundary between project-level and learner-level
+# context; STATIC + "\n\n" + DYNAMIC renders exactly like SYSTEM_PROMPT_TEMPLATE.
+STATIC_PROMPT_TEMPLATE = """{persona}
+
+{operational_instructions}
+
+{workspace_guidance}
+
+{project_context}"""
+
+DYNAMIC_PROMPT_TEMPLATE = """{epic_context}
+
+{current_task_context}
+
+{progress_context}
+"""
+
+# Anthropic prompt-cache breakpoint placed after the static block
+CACHE_CONTROL = {"type": "ephemeral"}
+
 PROJECT_CONTEXT_TEMPLATE = """
 ## Current Project
 
@@ -373,6 +395,88 @@ def build_system_prompt(
     Returns:
         Complete formatted system prompt
     """
+    static = build_static_prompt(
+        project_id,
+        narrative_context=narrative_context,
+        project_description=project_description,
+        project_content=project_content,
+        workspace_type=workspace_type,
+        custom_persona=custom_persona,
+        include_memory_instructions=include_memory_instructions,
+    )
+    return static + "\n\n" + build_dynamic_prompt(current_epic, current_task, progress)
+
+
+def build_system_prompt_blocks(
+    project_id: str,
+    narrative_context: str | None = None,
+    project_description: str | None = None,
+    project_content: str | None = None,
+    current_epic: dict | None = None,
+    current_task: dict | None = None,
+    progress: dict | None = None,
+    workspace_type: str | None = None,
+    custom_persona: str | None = None,
+    *,
+    include_memory_instructions: bool = False,
+    project_version: int | None = None,
+    learner_context: str | None = None,
+) -> list[dict]:
+    """
+    Build the system prompt as Anthropic content blocks for prompt caching.
+
+    The first block holds everything that is the same for every learner of
+    a project version (persona, instructions, workspace guidance, project
+    context) and ends with a cache-control breakpoint, so the provider can
+    reuse it across turns and learners. The second block holds the
+    learner's epic, task, progress and ``learner_context`` (e.g. memories).
+
+    Args:
+        Same as build_system_prompt, plus:
+        project_version: Template version of the project (part of the memo key)
+        learner_context: Extra learner-specific text appended to the dynamic block
+
+    Returns:
+        [static block with cache_control, dynamic block]
+    """
+    static = build_static_prompt(
+        project_id,
+        narrative_context=narrative_context,
+        project_description=project_description,
+        project_content=project_content,
+        workspace_type=workspace_type,
+        custom_persona=custom_persona,
+        include_memory_instructions=include_memory_instructions,
+        project_version=project_version,
+    )
+    dynamic = build_dynamic_prompt(current_epic, current_task, progress)
+    if learner_context:
+        dynamic = dynamic + "\n\n" + learner_context
+
+    return [
+        {"type": "text", "text": static, "cache_control": CACHE_CONTROL},
+        {"type": "text", "text": dynamic},
+    ]
+
+
+@lru_cache(maxsize=64)
+def build_static_prompt(
+    project_id: str,
+    *,
+    narrative_context: str | None = None,
+    project_description: str | None = None,
+    project_content: str | None = None,
+    workspace_type: str | None = None,
+    custom_persona: str | None = None,
+    include_memory_instructions: bool = False,
+    project_version: int | None = None,
+) -> str:
+    """
+    Render the project-level part of the system prompt.
+
+    Memoized per project version, persona, workspace type and project text,
+    so every learner of a project gets the identical (cacheable) prefix.
+    """
     # Get persona
     persona = get_persona_for_workspace(workspace_type, custom_persona)
 
@@ -387,6 +491,24 @@ def build_system_prompt(
         project_content=project_content or "",
     )
 
+    ops = OPERATIONAL_INSTRUCTIONS
+    if include_memory_instructions:
+        ops = ops + MEMORY_INSTRUCTIONS
+
+    return STATIC_PROMPT_TEMPLATE.format(
+        persona=persona,
+        operational_instructions=ops,
+        workspace_guidance=workspace_guidance,
+        project_context=project_context,
+    )
+
+
+def build_dynamic_prompt(
+    current_epic: dict | None = None,
+    current_task: dict | None = None,
+    progress: dict | None = None,
+) -> str:
+    """Render the learner-level part of the system prompt (epic, task, progress)."""
     # Epic context
     if current_epic:
         epic_context = EPIC_CONTEXT_TEMPLATE.format(
@@ -450,15 +572,7 @@ def build_system_prompt(
     else:
         progress_context = ""
 
-    ops = OPERATIONAL_INSTRUCTIONS
-    if include_memory_instructions:
-        ops = ops + MEMORY_INSTRUCTIONS
-
-    return SYSTEM_PROMPT_TEMPLATE.format(
-        persona=persona,
-        operational_instructions=ops,
-        workspace_guidance=workspace_guidance,
-        project_context=project_context,
+    return DYNAMIC_PROMPT_TEMPLATE.format(
         epic_context=epic_context,
         current_task_context=task_context,
         progress_context=progress_context,
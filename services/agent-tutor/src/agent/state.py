@@ -56,6 +56,24 @@ class LearnerProgress(BaseModel):
     blocked: int = 0
 
 
+class TurnContext(BaseModel):
+    """
+    Per-invocation context for a shared agent graph.
+
+    Compiled graphs are cached and shared by every learner of a project, so
+    who the turn is for and its system prompt travel in
+    ``config["configurable"]["turn"]`` rather than being built into the graph.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    learner_id: str
+    project_id: str
+    project_slug: str | None = None
+    # Plain text, or Anthropic content blocks (see build_system_prompt_blocks)
+    system_prompt: str | list[dict] = ""
+
+
 class AgentState(BaseModel):
     """
     State for the Socratic Learning Agent.
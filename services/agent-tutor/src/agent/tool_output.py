@@ -0,0 +1,179 @@
+"""
+Token-budgeted rendering of LTT tool results for the model.
+
+Every tool result stays in the thread and is replayed on each later LLM
+call, so the JSON handed to the model is kept small:
+
+1. Long text that is already in the system prompt (project narrative, epic
+   overview) is replaced by a reference to it.
+2. A repeated get_context for a task within one agent turn returns only
+   the fields that changed since the previous call (``full=true`` returns
+   all). The earlier result is then still verbatim in the model's context:
+   history management (agent.history) never compacts or folds the current
+   turn. Turns are delimited by ``tool_output_scope``.
+3. A result still over its tool's budget has its long texts (task content,
+   descriptions, summaries) cut, each with a pointer to show_task.
+
+show_task is the way back to the full text and is never compacted.
+"""
+
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from ltt.tools import ToolError
+from pydantic import BaseModel
+
+# Approximate characters per token, for budgeting without a tokenizer
+CHARS_PER_TOKEN = 4
+
+# Per-tool budgets in tokens, overriding the default (None = unlimited)
+TOOL_OUTPUT_BUDGETS: dict[str, int | None] = {"show_task": None}
+
+# Successively tighter caps on long texts, until a result fits its budget
+TRUNCATION_STEPS = (2000, 1000, 500, 200)
+
+IN_SYSTEM_PROMPT = "(see system prompt)"
+
+# Shorter text is never replaced by a system prompt reference
+_MIN_PROMPT_MATCH_CHARS = 200
+
+# get_context results of the current turn, by task ID
+_turn_contexts: ContextVar[dict[str, dict] | None] = ContextVar(
+    "agent_tool_output_turn", default=None
+)
+
+
+@contextmanager
+def tool_output_scope() -> Iterator[None]:
+    """Diff repeated get_context calls made inside the block (one agent turn)."""
+    token = _turn_contexts.set({})
+    try:
+        yield
+    finally:
+        try:
+            _turn_contexts.reset(token)
+        except ValueError:
+            # Closed from another context (an abandoned async generator)
+            pass
+
+
+class ToolOutputRenderer:
+    """
+    Renders tool results as compact JSON within a per-tool token budget.
+
+    One renderer serves every learner of a graph's tools; get_context
+    results are remembered per turn (see tool_output_scope).
+    """
+
+    def __init__(self, token_budget: int):
+        """
+        Args:
+            token_budget: Default budget per tool result (0 = render results
+                in full, as indented JSON)
+        """
+        self.token_budget = token_budget
+
+    def render(
+        self,
+        tool_name: str,
+        result: BaseModel,
+        *,
+        system_prompt: str | list[dict] = "",
+        full: bool = False,
+    ) -> str:
+        """
+        Render one tool result for the model.
+
+        Args:
+            tool_name: LTT tool that produced the result
+            result: The tool's output model
+            system_prompt: System prompt of the turn (text or content blocks)
+            full: Skip the get_context diff
+
+        Returns:
+            JSON for the ToolMessage
+        """
+        budget = TOOL_OUTPUT_BUDGETS.get(tool_name, self.token_budget)
+        if self.token_budget <= 0 or isinstance(result, ToolError):
+            return result.model_dump_json(indent=2)
+
+        data = result.model_dump(mode="json")
+        if budget is None:
+            return _dumps(data)
+
+        contexts = _turn_contexts.get()
+        if tool_name == "get_context" and contexts is not None:
+            data = _diff_context(contexts, data, full)
+
+        data = _replace_prompt_text(data, _prompt_text(system_prompt))
+
+        rendered = _dumps(data)
+        for cap in TRUNCATION_STEPS:
+            if len(rendered) <= budget * CHARS_PER_TOKEN:
+                break
+            rendered = _dumps(_truncate(data, cap, None))
+        return rendered
+
+
+def _diff_context(contexts: dict[str, dict], data: dict, full: bool) -> dict:
+    """Remember a get_context result; return only what changed since the last one."""
+    task_id = data["current_task"]["id"]
+    previous = contexts.get(task_id)
+    contexts[task_id] = data
+
+    if previous is None or full:
+        return data
+
+    unchanged = [
+        name
+        for name, value in data.items()
+        if name != "current_task" and previous.get(name) == value
+    ]
+    if not unchanged:
+        return data
+    return {
+        **{name: value for name, value in data.items() if name not in unchanged},
+        "unchanged_since_last_call": unchanged,
+    }
+
+
+def _dumps(data) -> str:
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _prompt_text(system_prompt: str | list[dict]) -> str:
+    if isinstance(system_prompt, str):
+        return system_prompt
+    return "\n".join(block.get("text", "") for block in system_prompt)
+
+
+def _replace_prompt_text(value, prompt_text: str):
+    """Replace long strings that appear verbatim in the system prompt."""
+    if isinstance(value, dict):
+        return {name: _replace_prompt_text(item, prompt_text) for name, item in value.items()}
+    if isinstance(value, list):
+        return [_replace_prompt_text(item, prompt_text) for item in value]
+    if (
+        isinstance(value, str)
+        and len(value) >= _MIN_PROMPT_MATCH_CHARS
+        and value.strip() in prompt_text
+    ):
+        return IN_SYSTEM_PROMPT
+    return value
+
+
+def _truncate(value, cap: int, task_id: str | None):
+    """Cut strings longer than cap, pointing at the task they belong to."""
+    if isinstance(value, dict):
+        task_id = value.get("id") or value.get("task_id") or task_id
+        return {name: _truncate(item, cap, task_id) for name, item in value.items()}
+    if isinstance(value, list):
+        return [_truncate(item, cap, task_id) for item in value]
+    if isinstance(value, str) and len(value) > cap:
+        more = f"{len(value) - cap} more chars"
+        if task_id:
+            more += f"; show_task(task_id={task_id!r}) returns the full text"
+        return f"{value[:cap]}…[{more}]"
+    return value
@@ -3,34 +3,29 @@ LangGraph tool wrappers for the Learning Task Tracker tools.
 
 These tools wrap the LTT tools module to work with LangGraph's tool calling.
 Each tool is async and requires a database session and learner_id from context.
+LTT tool calls made by one AI message run as one batch (see ToolCallBatcher),
+and their results are rendered within a token budget (see agent.tool_output).
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Annotated
 
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import StructuredTool
-from ltt.tools import (
-    GetCommentsInput,
-    GetContextInput,
-    GetReadyInput,
-    GoBackInput,
-    RequestHelpInput,
-    StartTaskInput,
-    SubmitInput,
-)
-from ltt.tools import add_comment as ltt_add_comment
-from ltt.tools import get_comments as ltt_get_comments
-from ltt.tools import get_context as ltt_get_context
-from ltt.tools import get_ready as ltt_get_ready
-from ltt.tools import go_back as ltt_go_back
-from ltt.tools import request_help as ltt_request_help
-from ltt.tools import start_task as ltt_start_task
-from ltt.tools import submit as ltt_submit
-from pydantic import BaseModel, Field
+from langgraph.prebuilt import InjectedState
+from ltt.tools import execute_tools_batch
+from pydantic import BaseModel, Field, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from agent.config import get_config
+from agent.state import TurnContext
+from agent.tool_output import ToolOutputRenderer
+
 if TYPE_CHECKING:
     from langgraph.store.base import BaseStore
 
@@ -39,7 +34,15 @@ if TYPE_CHECKING:
 # =============================================================================
 
 
-class GetReadyToolInput(BaseModel):
+class LTTToolInput(BaseModel):
+    """Base of the LTT tool inputs."""
+
+    # Graph state, injected by the tool node and hidden from the model; its
+    # last message holds the tool calls to batch
+    state: Annotated[dict | None, InjectedState] = None
+
+
+class GetReadyToolInput(LTTToolInput):
     """Get tasks that are ready to work on."""
 
     task_type: str | None = Field(
@@ -48,19 +51,28 @@ class GetReadyToolInput(BaseModel):
     limit: int = Field(5, description="Maximum number of tasks to return (1-20)", ge=1, le=20)
 
 
-class GetContextToolInput(BaseModel):
+class GetContextToolInput(LTTToolInput):
     """Get full context for a task."""
 
     task_id: str = Field(..., description="The task ID to get context for")
+    full: bool = Field(
+        False, description="Return every field, even those unchanged since the last call"
+    )
+
+
+class ShowTaskToolInput(LTTToolInput):
+    """Get the full details of a task."""
+
+    task_id: str = Field(..., description="The task ID to show")
 
 
-class StartTaskToolInput(BaseModel):
+class StartTaskToolInput(LTTToolInput):
     """Start working on a task."""
 
     task_id: str = Field(..., description="The task ID to start working on")
 
 
-class SubmitToolInput(BaseModel):
+class SubmitToolInput(LTTToolInput):
     """Submit work for a task."""
 
     task_id: str = Field(..., description="The task ID to submit for")
@@ -71,43 +83,186 @@ class SubmitToolInput(BaseModel):
     )
 
 
-class AddCommentToolInput(BaseModel):
+class AddCommentToolInput(LTTToolInput):
     """Add a comment to a task."""
 
     task_id: str = Field(..., description="The task ID to comment on")
     comment: str = Field(..., description="The comment text")
 
 
-class GetCommentsToolInput(BaseModel):
+class GetCommentsToolInput(LTTToolInput):
     """Get comments on a task."""
 
     task_id: str = Field(..., description="The task ID to get comments for")
     limit: int = Field(10, description="Maximum comments to return", ge=1, le=50)
 
 
-class GoBackToolInput(BaseModel):
+class GoBackToolInput(LTTToolInput):
     """Reopen a closed task."""
 
     task_id: str = Field(..., description="The closed task ID to reopen")
     reason: str = Field(..., description="Reason for reopening the task")
 
 
-class RequestHelpToolInput(BaseModel):
+class RequestHelpToolInput(LTTToolInput):
     """Request help from an instructor."""
 
     task_id: str = Field(..., description="The task ID needing help")
     message: str = Field(..., description="Description of what help is needed")
 
 
+# =============================================================================
+# Batched Execution
+# =============================================================================
+
+# Agent tools backed by an LTT tool: name -> (input schema, LTT tool name)
+_LTT_TOOLS: dict[str, tuple[type[LTTToolInput], str]] = {
+    "get_ready_tasks": (GetReadyToolInput, "get_ready"),
+    "get_context": (GetContextToolInput, "get_context"),
+    "show_task": (ShowTaskToolInput, "show_task"),
+    "start_task": (StartTaskToolInput, "start_task"),
+    "submit": (SubmitToolInput, "submit"),
+    "add_comment": (AddCommentToolInput, "add_comment"),
+    "get_comments": (GetCommentsToolInput, "get_comments"),
+    "go_back": (GoBackToolInput, "go_back"),
+    "request_help": (RequestHelpToolInput, "request_help"),
+}
+
+# Input fields that only affect the agent side, not the LTT call
+_AGENT_ONLY_FIELDS = {"state", "full"}
+
+# Batches remembered per process; a call finding its batch fully claimed
+# (a retry) runs alone instead of running the whole message again
+MAX_RECENT_BATCHES = 256
+
+LTTCall = tuple[str, dict]
+
+
+def _ltt_call(tool_name: str, args: dict, project_id: str | None) -> LTTCall | None:
+    """The LTT call behind an agent tool call (None = other tool or invalid arguments)."""
+    if tool_name not in _LTT_TOOLS:
+        return None
+    schema, ltt_name = _LTT_TOOLS[tool_name]
+    try:
+        params = schema.model_validate(args)
+    except ValidationError:
+        # The tool node rejects these calls without running the tool
+        return None
+    input_data = params.model_dump(exclude=_AGENT_ONLY_FIELDS)
+    if ltt_name == "get_ready":
+        input_data["project_id"] = project_id
+    return ltt_name, input_data
+
+
+def _message_calls(state: dict | None, project_id: str | None) -> tuple[tuple, list[LTTCall]]:
+    """
+    The LTT calls of the AI message a tool node is executing.
+
+    Returns:
+        (the message's tool call IDs, its LTT calls in order); empty when
+        the tool was not called by a tool node
+    """
+    messages = (state or {}).get("messages") or []
+    message = messages[-1] if messages else None
+    if not isinstance(message, AIMessage) or not message.tool_calls:
+        return (), []
+    calls = [_ltt_call(call["name"], call["args"], project_id) for call in message.tool_calls]
+    return (
+        tuple(call["id"] for call in message.tool_calls),
+        [call for call in calls if call is not None],
+    )
+
+
+class _Batch:
+    """LTT calls of one AI message, run by the first of them to arrive."""
+
+    __slots__ = ("calls", "unclaimed", "task")
+
+    def __init__(self, calls: list[LTTCall], task: asyncio.Task):
+        self.calls = calls
+        self.unclaimed = list(range(len(calls)))
+        self.task = task
+
+    def claim(self, call: LTTCall) -> int | None:
+        """Index of the first unclaimed matching call (identical calls in arrival order)."""
+        for position, index in enumerate(self.unclaimed):
+            if self.calls[index] == call:
+                del self.unclaimed[position]
+                return index
+        return None
+
+
+class ToolCallBatcher:
+    """
+    Runs the LTT tool calls of one AI message as one batch.
+
+    The tool node starts every tool call of a message concurrently and
+    passes each one the graph state, whose last message lists all of them.
+    The first LTT call of the message to arrive runs every LTT call in it
+    through ``ltt.tools.execute_tools_batch`` (read-only calls concurrently,
+    mutating calls in order) in the order the model made them; the others
+    wait for that batch and take their own result. Calls made outside a tool
+    node run alone. Tools are shared by every learner of a cached graph, so
+    batches are kept per learner.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self.session_factory = session_factory
+        self._batches: OrderedDict[tuple, _Batch] = OrderedDict()
+
+    async def call(
+        self,
+        learner_id: str,
+        call: LTTCall,
+        message_key: tuple = (),
+        message_calls: Sequence[LTTCall] = (),
+    ) -> BaseModel:
+        """
+        Run one call, batched with the other LTT calls of its message.
+
+        Args:
+            learner_id: Learner the calls run for
+            call: (LTT tool name, input) of this call
+            message_key: Tool call IDs of the message (see _message_calls)
+            message_calls: LTT calls of the message, including this one
+        """
+        key = (learner_id, message_key)
+        batch = self._batches.get(key)
+        if batch is None and call in message_calls:
+            calls = list(message_calls)
+            task = asyncio.ensure_future(self._run(learner_id, calls))
+            batch = self._batches[key] = _Batch(calls, task)
+            while len(self._batches) > MAX_RECENT_BATCHES:
+                self._batches.popitem(last=False)
+
+        index = batch.claim(call) if batch is not None else None
+        if index is None:
+            # Not in the message, or run again after the batch (a retry)
+            [result] = await self._run(learner_id, [call])
+            return result
+
+        # Shielded: a cancelled caller must not cancel the others' batch
+        results = await asyncio.shield(batch.task)
+        return results[index]
+
+    async def _run(self, learner_id: str, calls: list[LTTCall]) -> list[BaseModel]:
+        return await execute_tools_batch(calls, learner_id, self.session_factory)
+
+
 # =============================================================================
 # Tool Factory Functions
 # =============================================================================
 
 
+def _turn(config: RunnableConfig | None) -> TurnContext | None:
+    """The TurnContext an invocation of a shared graph passed, if any."""
+    return ((config or {}).get("configurable") or {}).get("turn")
+
+
 def create_tools(
     session_factory: Callable[[], AsyncSession],
-    learner_id: str,
-    project_id: str,
+    learner_id: str | None,
+    project_id: str | None,
     *,
     store: BaseStore | None = None,
     project_slug: str | None = None,
@@ -119,10 +274,14 @@ def create_tools(
     mismatch issues when tools are executed by create_react_agent in a
     different async context.
 
+    The learner and project of an invocation's TurnContext (see
+    ``agent.state.TurnContext``) take precedence over the bound ones, so one
+    set of tools can serve every learner of a cached graph.
+
     Args:
         session_factory: Callable that returns a fresh AsyncSession
-        learner_id: The learner's ID
-        project_id: The current project ID
+        learner_id: The learner's ID (None = always from the TurnContext)
+        project_id: The current project ID (None = always from the TurnContext)
         store: Optional LangGraph store for memory tools.
         project_slug: Optional stable project slug for project-scoped memories.
 
@@ -130,40 +289,85 @@ def create_tools(
         List of StructuredTool instances ready for LangGraph
     """
 
-    async def get_ready(task_type: str | None = None, limit: int = 5) -> str:
+    batch = ToolCallBatcher(session_factory)
+    renderer = ToolOutputRenderer(get_config().agent.tool_output_token_budget)
+
+    def scope(config: RunnableConfig | None) -> tuple[str, str]:
+        turn = _turn(config)
+        if turn is not None:
+            return turn.learner_id, turn.project_id
+        return learner_id, project_id
+
+    async def run(
+        config: RunnableConfig | None, state: dict | None, tool_name: str, **args
+    ) -> str:
+        learner, project = scope(config)
+        call = _ltt_call(tool_name, args, project)
+        message_key, message_calls = _message_calls(state, project)
+        result = await batch.call(learner, call, message_key, message_calls)
+        turn = _turn(config)
+        return renderer.render(
+            call[0],
+            result,
+            system_prompt=turn.system_prompt if turn is not None else "",
+            full=args.get("full", False),
+        )
+
+    async def get_ready(
+        task_type: str | None = None,
+        limit: int = 5,
+        state: dict | None = None,
+        config: RunnableConfig = None,
+    ) -> str:
         """Get tasks that are unblocked and ready to work on.
 
         Returns a list of tasks prioritized by status (in_progress first) and priority.
         Use this to see what the learner can work on next.
         """
-        async with session_factory() as session:
-            input_data = GetReadyInput(project_id=project_id, task_type=task_type, limit=limit)
-            result = await ltt_get_ready(input=input_data, learner_id=learner_id, session=session)
-            return result.model_dump_json(indent=2)
+        return await run(config, state, "get_ready_tasks", task_type=task_type, limit=limit)
 
-    async def get_context(task_id: str) -> str:
+    async def get_context(
+        task_id: str,
+        full: bool = False,
+        state: dict | None = None,
+        config: RunnableConfig = None,
+    ) -> str:
         """Get full context for a task including hierarchy and progress.
 
         Returns task details, project hierarchy, ready tasks list, and learner progress.
         Use this to understand where a task fits in the bigger picture.
+        Repeated calls for a task in one turn list the fields unchanged since
+        the last call instead of repeating them, unless full is set.
         """
-        async with session_factory() as session:
-            input_data = GetContextInput(task_id=task_id)
-            result = await ltt_get_context(input=input_data, learner_id=learner_id, session=session)
-            return result.model_dump_json(indent=2)
+        return await run(config, state, "get_context", task_id=task_id, full=full)
 
-    async def start_task(task_id: str) -> str:
+    async def show_task(
+        task_id: str, state: dict | None = None, config: RunnableConfig = None
+    ) -> str:
+        """Get the full details of a task.
+
+        Returns the complete description, content and acceptance criteria.
+        Use this when another tool's result was truncated.
+        """
+        return await run(config, state, "show_task", task_id=task_id)
+
+    async def start_task(
+        task_id: str, state: dict | None = None, config: RunnableConfig = None
+    ) -> str:
         """Start working on a task.
 
         Sets the task status to 'in_progress' and returns full context.
         Use this when the learner decides to begin work on a task.
         """
-        async with session_factory() as session:
-            input_data = StartTaskInput(task_id=task_id)
-            result = await ltt_start_task(input=input_data, learner_id=learner_id, session=session)
-            return result.model_dump_json(indent=2)
-
-    async def submit(task_id: str, content: str, submission_type: str = "text") -> str:
+        return await run(config, state, "start_task", task_id=task_id)
+
+    async def submit(
+        task_id: str,
+        content: str,
+        submission_type: str = "text",
+        state: dict | None = None,
+        config: RunnableConfig = None,
+    ) -> str:
         """Submit work for a task and trigger validation.
 
         If validation passes, the task is automatically closed.
@@ -171,60 +375,52 @@ def create_tools(
 
         Submission types: code, sql, text, jupyter_cell, result_set
         """
-        async with session_factory() as session:
-            input_data = SubmitInput(
-                task_id=task_id, content=content, submission_type=submission_type
-            )
-            result = await ltt_submit(input=input_data, learner_id=learner_id, session=session)
-            return result.model_dump_json(indent=2)
-
-    async def add_comment(task_id: str, comment: str) -> str:
+        return await run(
+            config,
+            state,
+            "submit",
+            task_id=task_id,
+            content=content,
+            submission_type=submission_type,
+        )
+
+    async def add_comment(
+        task_id: str, comment: str, state: dict | None = None, config: RunnableConfig = None
+    ) -> str:
         """Add a comment or note to a task.
 
         Use this to record questions, observations, or progress notes.
         """
-        from ltt.tools.schemas import AddCommentInput as CommentInput
+        return await run(config, state, "add_comment", task_id=task_id, comment=comment)
 
-        async with session_factory() as session:
-            input_data = CommentInput(task_id=task_id, comment=comment)
-            result = await ltt_add_comment(input=input_data, learner_id=learner_id, session=session)
-            return result.model_dump_json(indent=2)
-
-    async def get_comments(task_id: str, limit: int = 10) -> str:
+    async def get_comments(
+        task_id: str, limit: int = 10, state: dict | None = None, config: RunnableConfig = None
+    ) -> str:
         """Get comments on a task.
 
         Returns both shared comments and this learner's private comments.
         """
-        async with session_factory() as session:
-            input_data = GetCommentsInput(task_id=task_id, limit=limit)
-            result = await ltt_get_comments(
-                input=input_data, learner_id=learner_id, session=session
-            )
-            return result.model_dump_json(indent=2)
-
-    async def go_back(task_id: str, reason: str) -> str:
+        return await run(config, state, "get_comments", task_id=task_id, limit=limit)
+
+    async def go_back(
+        task_id: str, reason: str, state: dict | None = None, config: RunnableConfig = None
+    ) -> str:
         """Reopen a previously closed task.
 
         Use when the learner wants to revisit or redo a completed task.
         Requires a reason for the audit trail.
         """
-        async with session_factory() as session:
-            input_data = GoBackInput(task_id=task_id, reason=reason)
-            result = await ltt_go_back(input=input_data, learner_id=learner_id, session=session)
-            return result.model_dump_json(indent=2)
+        return await run(config, state, "go_back", task_id=task_id, reason=reason)
 
-    async def request_help(task_id: str, message: str) -> str:
+    async def request_help(
+        task_id: str, message: str, state: dict | None = None, config: RunnableConfig = None
+    ) -> str:
         """Request help from an instructor.
 
         Use when the learner is stuck and needs human assistance.
         This creates a help request that instructors can review.
         """
-        async with session_factory() as session:
-            input_data = RequestHelpInput(task_id=task_id, message=message)
-            result = await ltt_request_help(
-                input=input_data, learner_id=learner_id, session=session
-            )
-            return result.model_dump_json(indent=2)
+        return await run(config, state, "request_help", task_id=task_id, message=message)
 
     async def get_stack() -> str:
         """Get information about the database and development environment.
@@ -264,6 +460,12 @@ def create_tools(
             description="Get full context for a task including hierarchy, progress, and related tasks. Rarely needed.",
             args_schema=GetContextToolInput,
         ),
+        StructuredTool.from_function(
+            coroutine=show_task,
+            name="show_task",
+            description="Get the full details and text of a task. Use when another tool's result was truncated.",
+            args_schema=ShowTaskToolInput,
+        ),
         StructuredTool.from_function(
             coroutine=start_task,
             name="start_task",
@@ -354,20 +556,25 @@ class UpdateProfileInput(BaseModel):
 
 def _create_memory_tools(
     store: BaseStore,
-    learner_id: str,
+    learner_id: str | None,
     project_slug: str | None,
 ) -> list[StructuredTool]:
-    """Create memory tools bound to a store and learner."""
+    """Create memory tools bound to a store and learner (TurnContext wins)."""
     import json
 
     from agent.memory.store import LearnerMemory
 
-    mem = LearnerMemory(store, learner_id, project_slug)
+    def memory(config: RunnableConfig | None) -> tuple[LearnerMemory, str | None]:
+        turn = _turn(config)
+        if turn is None:
+            return LearnerMemory(store, learner_id, project_slug), project_slug
+        return LearnerMemory(store, turn.learner_id, turn.project_slug), turn.project_slug
 
     async def store_memory(
         text: str,
         context: str | None = None,
         scope: str = "project",
+        config: RunnableConfig = None,
     ) -> str:
         """Store a fact about the learner for future sessions.
 
@@ -381,7 +588,8 @@ def _create_memory_tools(
             context: Optional context about when/where this was learned
             scope: 'global' for cross-project facts, 'project' for this project
         """
-        if scope == "global" or project_slug is None:
+        mem, slug = memory(config)
+        if scope == "global" or slug is None:
             key = await mem.add_memory(text, context, source="agent")
         else:
             key = await mem.add_project_memory(text, context, source="agent")
@@ -396,6 +604,7 @@ def _create_memory_tools(
         areas_for_growth: list[str] | None = None,
         interests: list[str] | None = None,
         background: str | None = None,
+        config: RunnableConfig = None,
     ) -> str:
         """Update the learner's profile with structured information.
 
@@ -420,6 +629,7 @@ def _create_memory_tools(
         if not updates:
             return json.dumps({"updated": False, "reason": "No fields provided"})
 
+        mem, _ = memory(config)
         await mem.update_profile(**updates)
         return json.dumps({"updated": True, "fields": list(updates.keys())})
 
@@ -453,6 +663,7 @@ def get_tool_descriptions() -> str:
 ### Navigation
 - **get_ready_tasks**: Get tasks that are unblocked and ready to work on (call ONCE at session start)
 - **get_context**: Get full context including hierarchy and progress (rarely needed)
+- **show_task**: Get a task's full text when another tool's result was truncated
 
 ### Progress
 - **start_task**: Begin working on a task - sets to in_progress AND returns full context (content, acceptance criteria, tutor guidance)
@@ -14,14 +14,20 @@ import os
 import pytest
 from agent.config import get_config
 from agent.graph import create_agent, create_custom_graph
-from agent.prompts import OPERATIONAL_INSTRUCTIONS, SYSTEM_PROMPT, build_system_prompt
-from agent.state import AgentState, LearnerProgress, TaskContext
+from agent.prompts import (
+    OPERATIONAL_INSTRUCTIONS,
+    SYSTEM_PROMPT,
+    build_system_prompt,
+    build_system_prompt_blocks,
+)
+from agent.state import AgentState, LearnerProgress, TaskContext, TurnContext
 from agent.tools import create_tools, get_tool_descriptions
 
 # All tools that should be available
 EXPECTED_TOOLS = {
     "get_ready_tasks",
     "get_context",
+    "show_task",
     "get_stack",
     "start_task",
     "submit",
@@ -75,6 +81,50 @@ class TestToolCreation:
             assert tool.description, f"Tool {tool.name} missing description"
             assert len(tool.description) > 10, f"Tool {tool.name} description too short"
 
+    @pytest.mark.asyncio
+    async def test_tool_calls_of_one_message_run_as_one_batch(self, monkeypatch):
+        """Test the LTT calls of an AI message run together, in the model's order."""
+        import asyncio
+
+        from langchain_core.messages import AIMessage
+        from ltt.tools import ToolError
+
+        batches = []
+
+        async def fake_execute(calls, learner_id, session_factory):
+            batches.append(list(calls))
+            return [ToolError(error_code="NOT_FOUND", message=name) for name, _ in calls]
+
+        monkeypatch.setattr("agent.tools.execute_tools_batch", fake_execute)
+        tools = {
+            t.name: t
+            for t in create_tools(lambda: None, learner_id="test-learner", project_id="proj")
+        }
+        message = AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "show_task", "args": {"task_id": "proj.1"}, "id": "call-1"},
+                {"name": "run_sql", "args": {"query": "SELECT 1"}, "id": "call-2"},
+                {"name": "get_comments", "args": {"task_id": "proj.1"}, "id": "call-3"},
+            ],
+        )
+        state = {"messages": [message]}
+
+        comments, task = await asyncio.gather(
+            tools["get_comments"].coroutine(task_id="proj.1", limit=10, state=state),
+            tools["show_task"].coroutine(task_id="proj.1", state=state),
+        )
+        await tools["show_task"].coroutine(task_id="proj.1")
+
+        assert batches[0] == [
+            ("show_task", {"task_id": "proj.1"}),
+            ("get_comments", {"task_id": "proj.1", "limit": 10}),
+        ]
+        assert '"get_comments"' in comments
+        assert '"show_task"' in task
+        # Without the graph state a call runs alone
+        assert batches[1:] == [[("show_task", {"task_id": "proj.1"})]]
+
     def test_get_tool_descriptions(self):
         """Test that tool descriptions are formatted correctly."""
         descriptions = get_tool_descriptions()
@@ -202,6 +252,44 @@ class TestPrompts:
         assert "10/40" in prompt
         assert "25.0%" in prompt
 
+    def test_build_system_prompt_blocks_split(self):
+        """Test the prompt splits into a cached project block and a learner block."""
+        epic = {"id": "proj-123.1", "title": "Data Cleaning", "description": "Clean it"}
+        progress = {"completed": 10, "total": 40, "percentage": 25.0}
+
+        blocks = build_system_prompt_blocks(
+            project_id="proj-123",
+            narrative_context="Maji Ndogo",
+            current_epic=epic,
+            progress=progress,
+            project_version=2,
+            learner_context="## Learner Memory",
+        )
+
+        static, dynamic = blocks
+        assert static["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in dynamic
+        assert "Maji Ndogo" in static["text"]
+        assert "Data Cleaning" not in static["text"]
+        assert "Data Cleaning" in dynamic["text"]
+        assert "10/40" in dynamic["text"]
+        assert dynamic["text"].endswith("## Learner Memory")
+
+    def test_static_block_shared_across_learners(self):
+        """Test learners of one project version get the identical static prefix."""
+        first = build_system_prompt_blocks(
+            project_id="proj-123", project_version=2, progress={"completed": 1, "total": 4}
+        )
+        second = build_system_prompt_blocks(
+            project_id="proj-123", project_version=2, progress={"completed": 3, "total": 4}
+        )
+
+        assert first[0]["text"] is second[0]["text"]
+        assert first[1]["text"] != second[1]["text"]
+        assert first[0]["text"] + "\n\n" + first[1]["text"] == build_system_prompt(
+            project_id="proj-123", progress={"completed": 1, "total": 4}
+        )
+
 
 class TestGraph:
     """Test graph creation and structure."""
@@ -226,6 +314,69 @@ class TestGraph:
         graph = workflow.compile(checkpointer=checkpointer)
         assert graph is not None
 
+    @pytest.mark.asyncio
+    async def test_learners_share_cached_graph(self, async_session):
+        """Test agents for one project reuse the compiled graph and model."""
+        from contextlib import asynccontextmanager
+
+        from langgraph.checkpoint.memory import MemorySaver
+
+        @asynccontextmanager
+        async def session_factory():
+            yield async_session
+
+        checkpointer = MemorySaver()
+        first = await create_agent(
+            "learner-a", "test-project", session_factory, checkpointer=checkpointer
+        )
+        second = await create_agent(
+            "learner-b", "test-project", session_factory, checkpointer=checkpointer
+        )
+
+        assert second.graph is first.graph
+        assert second.model is first.model
+        assert first._get_config()["configurable"]["turn"].learner_id == "learner-a"
+        assert second._get_config()["configurable"]["turn"].learner_id == "learner-b"
+
+    def test_turn_prompt_prepends_system_prompt(self):
+        """Test the shared graph takes its system prompt from the invocation."""
+        from agent.graph import _turn_prompt
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        messages = [HumanMessage(content="Hi")]
+        turn = TurnContext(learner_id="learner-a", project_id="proj", system_prompt="Be kind")
+
+        prompt = _turn_prompt({"messages": messages}, {"configurable": {"turn": turn}})
+
+        assert prompt == [SystemMessage(content="Be kind"), *messages]
+
+    def test_turn_messages_start_at_marked_user_message(self):
+        """Test a turn's messages are found by its user message ID."""
+        from agent.graph import turn_messages
+        from langchain_core.messages import AIMessage, HumanMessage
+
+        earlier = [HumanMessage(content="Hi", id="m1"), AIMessage(content="Hello", id="a1")]
+        turn = [HumanMessage(content="Next?", id="m2"), AIMessage(content="Task 2", id="a2")]
+
+        assert turn_messages([*earlier, *turn], "m2") == turn
+        assert turn_messages(earlier, "m2") == earlier
+
+    def test_turn_prompt_appends_history_summary(self):
+        """Test the summary of folded turns follows the cached prompt blocks."""
+        from agent.graph import _turn_prompt
+        from langchain_core.messages import HumanMessage
+
+        blocks = build_system_prompt_blocks(
+            project_id="proj", include_memory_instructions=False
+        )
+        turn = TurnContext(learner_id="learner-a", project_id="proj", system_prompt=blocks)
+        state = {"messages": [HumanMessage(content="Hi")], "history_summary": "Did task 1."}
+
+        prompt = _turn_prompt(state, {"configurable": {"turn": turn}})
+
+        assert prompt[0].content[: len(blocks)] == blocks
+        assert "Did task 1." in prompt[0].content[-1]["text"]
+
 
 class TestPromptStructure:
     """Test system prompt structure and content."""
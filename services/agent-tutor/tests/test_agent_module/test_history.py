@@ -0,0 +1,91 @@
+"""
+Tests for bounded conversation history (agent.history).
+"""
+
+import pytest
+from agent.history import COMPACTED_MARKER, create_history_hook, split_turns
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, ToolMessage
+
+
+def _turns(count: int, tool_chars: int = 10) -> list:
+    messages = []
+    for i in range(count):
+        messages += [
+            HumanMessage(content=f"Question {i}", id=f"h{i}"),
+            AIMessage(
+                content="",
+                id=f"c{i}",
+                tool_calls=[{"name": "get_context", "args": {}, "id": f"call{i}"}],
+            ),
+            ToolMessage(
+                content="x" * tool_chars, tool_call_id=f"call{i}", name="get_context", id=f"t{i}"
+            ),
+            AIMessage(content=f"Answer {i}", id=f"a{i}"),
+        ]
+    return messages
+
+
+def _model(*replies: str) -> GenericFakeChatModel:
+    return GenericFakeChatModel(messages=iter([AIMessage(content=r) for r in replies]))
+
+
+def test_split_turns_starts_at_learner_messages():
+    """Test each turn starts at a learner message."""
+    turns = split_turns(_turns(3))
+
+    assert len(turns) == 3
+    assert [turn[0].id for turn in turns] == ["h0", "h1", "h2"]
+    assert all(len(turn) == 4 for turn in turns)
+
+
+@pytest.mark.asyncio
+async def test_short_history_is_left_alone():
+    """Test nothing changes while the history is within bounds."""
+    hook = create_history_hook(_model(), keep_turns=2, max_turns=5, token_budget=10_000)
+
+    assert await hook({"messages": _turns(4)}) == {"messages": []}
+
+
+@pytest.mark.asyncio
+async def test_old_turns_are_folded_into_summary():
+    """Test turns beyond max_turns are summarized, keeping the last keep_turns."""
+    hook = create_history_hook(
+        _model("Asked 4 questions."), keep_turns=2, max_turns=5, token_budget=10_000
+    )
+
+    update = await hook({"messages": _turns(6), "history_summary": "Started."})
+
+    removed = {m.id for m in update["messages"] if isinstance(m, RemoveMessage)}
+    assert update["history_summary"] == "Asked 4 questions."
+    assert removed == {f"{kind}{i}" for kind in "hcta" for i in range(4)}
+
+
+@pytest.mark.asyncio
+async def test_earlier_tool_results_are_compacted_over_budget():
+    """Test long tool results of earlier turns are truncated, not the current turn's."""
+    hook = create_history_hook(_model(), keep_turns=2, max_turns=5, token_budget=2_000)
+
+    update = await hook({"messages": _turns(3, tool_chars=3_000)})
+
+    compacted = {m.id: m for m in update["messages"]}
+    assert set(compacted) == {"t0", "t1"}
+    assert compacted["t0"].content.endswith(COMPACTED_MARKER)
+    assert "history_summary" not in update
+
+
+@pytest.mark.asyncio
+async def test_failed_summary_keeps_turns():
+    """Test a summarization error leaves the history in place."""
+
+    class BrokenModel(GenericFakeChatModel):
+        async def ainvoke(self, *args, **kwargs):
+            raise RuntimeError("model down")
+
+    hook = create_history_hook(
+        BrokenModel(messages=iter([])), keep_turns=2, max_turns=5, token_budget=10_000
+    )
+
+    update = await hook({"messages": _turns(6)})
+
+    assert update == {"messages": []}
@@ -0,0 +1,115 @@
+"""
+Tests for token-budgeted tool output rendering (agent.tool_output).
+"""
+
+import json
+
+from agent.tool_output import IN_SYSTEM_PROMPT, ToolOutputRenderer, tool_output_scope
+from ltt.tools.schemas import GetContextOutput, TaskDetailOutput, TaskSummaryOutput, ToolError
+
+NARRATIVE = "The water services of Maji Ndogo need an audit. " * 10
+
+
+def _detail(content: str) -> TaskDetailOutput:
+    return TaskDetailOutput(
+        id="proj.1",
+        title="Explore the data",
+        description="Get to know the tables.",
+        acceptance_criteria="Run one query per table.",
+        notes="",
+        status="in_progress",
+        task_type="task",
+        priority=1,
+        parent_id="proj",
+        children=[],
+        learning_objectives=[],
+        content=content,
+        tutor_guidance=None,
+        narrative_context=NARRATIVE,
+        blocked_by=[],
+        blocks=[],
+        submission_count=0,
+        latest_validation_passed=None,
+        status_summaries=[],
+    )
+
+
+def _context(progress: dict) -> GetContextOutput:
+    return GetContextOutput(
+        learner_id="learner-1",
+        current_task=TaskSummaryOutput(
+            id="proj.1",
+            title="Explore the data",
+            status="in_progress",
+            task_type="task",
+            priority=1,
+            has_children=False,
+        ),
+        project_id="proj",
+        hierarchy=[{"id": "proj", "title": "Project", "type": "project"}],
+        ready_tasks=[],
+        progress=progress,
+        acceptance_criteria="Run one query per table.",
+        learning_objectives=[],
+        status_summaries=[],
+    )
+
+
+def test_text_in_system_prompt_is_referenced():
+    """Test long text already in the system prompt is not repeated."""
+    renderer = ToolOutputRenderer(token_budget=1500)
+    prompt = [{"type": "text", "text": f"## Project\n{NARRATIVE}"}]
+
+    data = json.loads(renderer.render("start_task", _detail("Short."), system_prompt=prompt))
+
+    assert data["narrative_context"] == IN_SYSTEM_PROMPT
+    assert data["content"] == "Short."
+
+
+def test_long_content_truncated_with_pointer():
+    """Test a result over budget is cut to fit, pointing at show_task."""
+    renderer = ToolOutputRenderer(token_budget=500)
+
+    rendered = renderer.render("start_task", _detail("x" * 10_000))
+
+    assert len(rendered) <= 500 * 4
+    assert "show_task(task_id='proj.1')" in json.loads(rendered)["content"]
+
+
+def test_show_task_is_never_compacted():
+    """Test show_task returns the full text whatever the budget."""
+    renderer = ToolOutputRenderer(token_budget=100)
+
+    data = json.loads(renderer.render("show_task", _detail("x" * 10_000)))
+
+    assert data["content"] == "x" * 10_000
+
+
+def test_repeated_get_context_returns_changes():
+    """Test a second get_context in a turn lists unchanged fields instead."""
+    renderer = ToolOutputRenderer(token_budget=1500)
+    with tool_output_scope():
+        renderer.render("get_context", _context({"completed": 1}))
+        diff = json.loads(renderer.render("get_context", _context({"completed": 2})))
+        full = json.loads(renderer.render("get_context", _context({"completed": 2}), full=True))
+    with tool_output_scope():
+        next_turn = json.loads(renderer.render("get_context", _context({"completed": 2})))
+    outside = json.loads(renderer.render("get_context", _context({"completed": 2})))
+
+    assert diff["progress"] == {"completed": 2}
+    assert diff["current_task"]["id"] == "proj.1"
+    assert "hierarchy" not in diff
+    assert "hierarchy" in diff["unchanged_since_last_call"]
+    assert "hierarchy" in full
+    # Earlier turns may have been compacted by then, so each turn starts afresh
+    assert "unchanged_since_last_call" not in next_turn
+    assert "unchanged_since_last_call" not in outside
+
+
+def test_errors_and_disabled_budget_render_in_full():
+    """Test errors, and every result when the budget is 0, are left as they are."""
+    error = ToolError(error_code="NOT_FOUND", message="Task missing not found")
+    detail = _detail("x" * 10_000)
+
+    assert ToolOutputRenderer(500).render("show_task", error) == error.model_dump_json(indent=2)
+    assert ToolOutputRenderer(0).render("start_task", detail) == detail.model_dump_json(indent=2)
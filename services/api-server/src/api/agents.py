@@ -1,7 +1,9 @@
 """
 Stateless agent management for the API.
 
-Agents are created per-request (cheap — just object construction, no LLM calls).
+Agent wrappers are created per-request.  The compiled ReAct graph and the
+model client behind them are cached per project version and shared by all
+learners; the learner, project and system prompt are passed per invocation.
 Conversation state is persisted in a separate PostgreSQL database via
 LangGraph's ``AsyncPostgresSaver``.  Learner memory (profile + observations)
 is stored via ``AsyncPostgresStore`` in the same database.
@@ -13,15 +15,20 @@ cannot connect.
 
 Thread IDs are recorded in the ``conversation_threads`` table in the main
 database so we can correlate learners, projects, and their chat history.
+Old checkpoints and expired threads are pruned by the checkpoint retention
+job (``ltt db prune-checkpoints``, or in the background when
+``LTT_CHECKPOINT_PRUNE_INTERVAL_HOURS`` is set).
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from typing import TYPE_CHECKING
 
 from agent.config import get_config
-from agent.graph import AgentWrapper, create_agent
+from agent.graph import AgentWrapper, clear_graph_cache, create_agent
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.store.memory import InMemoryStore
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -41,6 +48,8 @@ _checkpoint_pool = None  # psycopg AsyncConnectionPool
 _store: BaseStore | None = None
 _store_pool = None  # psycopg AsyncConnectionPool (separate from checkpointer)
 
+_retention_task: asyncio.Task | None = None
+
 
 async def init_checkpointer() -> None:
     """
@@ -165,6 +174,7 @@ async def close_store() -> None:
         _store_pool = None
 
     _store = None
+    clear_graph_cache()  # Cached graphs hold the closed store
 
 
 async def close_checkpointer() -> None:
@@ -176,6 +186,61 @@ async def close_checkpointer() -> None:
         _checkpoint_pool = None
 
     _checkpointer = None
+    clear_graph_cache()  # Cached graphs hold the closed checkpointer
+
+
+def start_checkpoint_retention() -> None:
+    """
+    Start the background checkpoint retention job (called during startup).
+
+    Runs every ``LTT_CHECKPOINT_PRUNE_INTERVAL_HOURS`` when set and a
+    checkpoint DB is configured. Each API worker runs its own loop; an
+    advisory lock keeps the runs from overlapping.
+    """
+    global _retention_task
+
+    settings = get_settings()
+    if settings.checkpoint_prune_interval_hours <= 0 or not settings.checkpoint_database_url:
+        return
+
+    _retention_task = asyncio.create_task(
+        _run_checkpoint_retention(settings.checkpoint_prune_interval_hours * 3600)
+    )
+
+
+async def stop_checkpoint_retention() -> None:
+    """Stop the background checkpoint retention job (called during shutdown)."""
+    global _retention_task
+
+    if _retention_task is not None:
+        _retention_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _retention_task
+        _retention_task = None
+
+
+async def _run_checkpoint_retention(interval_seconds: float) -> None:
+    from ltt.services.checkpoint_retention import run_checkpoint_retention
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            report = await run_checkpoint_retention()
+        except Exception:
+            logger.exception("Checkpoint retention failed")
+            continue
+
+        if not report.skipped:
+            logger.info(
+                "Checkpoint retention: trimmed %d thread(s), expired %d, "
+                "deleted %d checkpoint(s), %d write(s), %d blob(s) (~%d bytes)",
+                report.threads_trimmed,
+                report.threads_expired,
+                report.checkpoints_deleted,
+                report.writes_deleted,
+                report.blobs_deleted,
+                report.bytes_deleted,
+            )
 
 
 def get_store() -> BaseStore | None:
@@ -200,10 +265,11 @@ async def get_or_create_agent(
     session_factory: async_sessionmaker[AsyncSession],
 ) -> AgentWrapper:
     """
-    Create a fresh agent for a single request.
+    Create an agent wrapper for a single request.
 
     Agent construction is async to allow eager loading of project context
-    and learner memory into the system prompt.  The actual LLM call only
+    and learner memory into the system prompt.  The compiled graph comes
+    from the shared cache in ``agent.graph``.  The actual LLM call only
     happens when ``ainvoke`` / ``astream`` is called later.
     """
     return await create_agent(
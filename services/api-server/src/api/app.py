@@ -18,11 +18,20 @@ from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from ltt.services.validators import shutdown_validator_pool
+from ltt.tools import render_prometheus
 from sqlalchemy import text
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from api.admin_routes import router as admin_router
-from api.agents import close_checkpointer, close_store, init_checkpointer, init_store
+from api.agents import (
+    close_checkpointer,
+    close_store,
+    init_checkpointer,
+    init_store,
+    start_checkpoint_retention,
+    stop_checkpoint_retention,
+)
 from api.database import close_database, get_session_factory, init_database
 from api.frontend_routes import router as frontend_router
 from api.lti.routes import init_lti_storage
@@ -80,7 +89,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Application lifespan manager.
 
     - startup: Initialize database pool IN the event loop
-    - shutdown: Close database connections cleanly
+    - shutdown: Stop validator workers and close database connections cleanly
     """
     # Startup: Initialize database pool in THIS event loop
     await init_database()
@@ -100,13 +109,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize learner memory store (PostgresStore or InMemoryStore)
     await init_store()
 
+    # Prune old checkpoints in the background (if an interval is configured)
+    start_checkpoint_retention()
+
     # Ensure at least one project exists (local dev only)
     if settings.env == "local":
         await ensure_projects_exist()
 
     yield
 
-    # Shutdown: Close store, checkpointer, then database connections
+    # Shutdown: Stop validator workers, close store, checkpointer, then database connections
+    shutdown_validator_pool()
+    await stop_checkpoint_retention()
     await close_store()
     await close_checkpointer()
     await close_database()
@@ -173,6 +187,15 @@ def get_app() -> FastAPI:
             ) from exc
         return {"status": "healthy"}
 
+    # Agent tool latency / SQL statement histograms for this worker, in the
+    # Prometheus text format.
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(
+            content=render_prometheus(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
     return app
 
 
@@ -13,9 +13,19 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from ltt.models import TaskStatus
-from ltt.services.dependency_service import get_ready_work, is_task_blocked
-from ltt.services.progress_service import get_or_create_progress, update_status
-from ltt.services.task_service import TaskNotFoundError, get_children, get_project_by_slug, get_task
+from ltt.services.dependency_service import (
+    get_blockers_for_tasks,
+    get_ready_work,
+    is_task_blocked,
+)
+from ltt.services.progress_service import get_status, get_statuses, update_status
+from ltt.services.project_snapshot import load_project_snapshot
+from ltt.services.task_service import (
+    TaskNotFoundError,
+    get_ancestors,
+    get_project_by_slug,
+    get_task,
+)
 from pydantic import BaseModel, Field
 
 from api.auth import LearnerContext, get_learner_context
@@ -238,19 +248,27 @@ async def get_project_tree(
 
     async with session_factory() as session:
         try:
-            # Get project (root task)
-            project = await get_task(session, project_id)
+            # Whole template hierarchy in a constant number of queries (cached)
+            snapshot = await load_project_snapshot(session, project_id)
+            project = snapshot.project
+            if project is None:
+                raise TaskNotFoundError(f"Task {project_id} not found")
+
+            # Resolve statuses and dependency blockers for every task at once (read-only)
+            task_ids = [task.id for task in snapshot.tasks]
+            statuses = await get_statuses(session, learner_id, task_ids)
+            blockers_by_task = await get_blockers_for_tasks(session, task_ids, learner_id)
 
             # Recursively build tree with progress
             # parent_blocked: if True, this task is blocked because an ancestor is blocked
             async def build_tree(
                 task_id: str, parent_blocked: bool = False
             ) -> tuple[TaskNode, dict]:
-                task = await get_task(session, task_id)
-                progress = await get_or_create_progress(session, task_id, learner_id)
+                task = snapshot.get(task_id)
+                status = statuses[task_id].value
 
                 # Check if task is blocked by its own dependencies
-                blocked_by_deps, _ = await is_task_blocked(session, task_id, learner_id)
+                blocked_by_deps = bool(blockers_by_task.get(task_id))
 
                 # Task is effectively blocked if:
                 # 1. Its parent is blocked (transitive), OR
@@ -258,15 +276,15 @@ async def get_project_tree(
                 is_blocked = parent_blocked or blocked_by_deps
 
                 # Determine effective status
-                if progress.status == TaskStatus.CLOSED.value:
+                if status == TaskStatus.CLOSED.value:
                     effective_status = TaskStatus.CLOSED.value
                 elif is_blocked:
                     effective_status = TaskStatus.BLOCKED.value
                 else:
-                    effective_status = progress.status
+                    effective_status = status
 
                 # Get children - pass down blocked status
-                children = await get_children(session, task_id, recursive=False)
+                children = snapshot.children_of(task_id)
 
                 child_nodes = []
                 stats = {"total": 0, "completed": 0, "in_progress": 0, "blocked": 0}
@@ -283,7 +301,7 @@ async def get_project_tree(
                     stats["blocked"] += child_stats["blocked"]
 
                 # Count this task (if it's a leaf or task type)
-                if task.task_type.value in ("task", "subtask") or not children:
+                if task.task_type in ("task", "subtask") or not children:
                     stats["total"] += 1
                     if effective_status == TaskStatus.CLOSED.value:
                         stats["completed"] += 1
@@ -300,7 +318,7 @@ async def get_project_tree(
                 node = TaskNode(
                     id=task.id,
                     title=task.title,
-                    task_type=task.task_type.value,
+                    task_type=task.task_type,
                     status=effective_status,
                     priority=task.priority,
                     description=task.description,
@@ -342,17 +360,9 @@ async def get_project_tree(
 
 async def is_ancestor_blocked(session, task_id: str, learner_id: str) -> bool:
     """Check if any ancestor of this task is blocked by dependencies."""
-    task = await get_task(session, task_id)
-    current_id = task.parent_id
-
-    while current_id:
-        blocked, _ = await is_task_blocked(session, current_id, learner_id)
-        if blocked:
-            return True
-        parent_task = await get_task(session, current_id)
-        current_id = parent_task.parent_id
-
-    return False
+    ancestors = await get_ancestors(session, task_id)
+    blockers = await get_blockers_for_tasks(session, [a.id for a in ancestors], learner_id)
+    return any(blockers.values())
 
 
 async def get_tasks_blocked_by(session, task_id: str, learner_id: str) -> list:
@@ -387,7 +397,7 @@ async def get_task_details(
     async with session_factory() as session:
         try:
             task = await get_task(session, task_id)
-            progress = await get_or_create_progress(session, task_id, learner_id)
+            status = (await get_status(session, task_id, learner_id)).value
 
             # Check if blocked by direct dependencies
             blocked_by_deps, blockers = await is_task_blocked(session, task_id, learner_id)
@@ -399,12 +409,12 @@ async def get_task_details(
             effectively_blocked = blocked_by_deps or ancestor_blocked
 
             # Determine effective status
-            if progress.status == TaskStatus.CLOSED.value:
+            if status == TaskStatus.CLOSED.value:
                 effective_status = TaskStatus.CLOSED.value
             elif effectively_blocked:
                 effective_status = TaskStatus.BLOCKED.value
             else:
-                effective_status = progress.status
+                effective_status = status
 
             # Get tasks this one blocks
             blocks_tasks = await get_tasks_blocked_by(session, task_id, learner_id)
@@ -477,15 +487,15 @@ async def get_ready_tasks(
                 limit=limit,
             )
 
+            statuses = await get_statuses(session, learner_id, [t.id for t in ready_tasks])
             tasks = []
             for task in ready_tasks:
-                progress = await get_or_create_progress(session, task.id, learner_id)
                 tasks.append(
                     TaskSummaryResponse(
                         id=task.id,
                         title=task.title,
                         task_type=task.task_type.value,
-                        status=progress.status,
+                        status=statuses[task.id].value,
                         priority=task.priority,
                     )
                 )
@@ -535,9 +545,9 @@ async def start_task(
                 )
 
             # Update status
-            progress = await get_or_create_progress(session, task_id, learner_id)
+            status = await get_status(session, task_id, learner_id)
 
-            if progress.status == TaskStatus.CLOSED.value:
+            if status == TaskStatus.CLOSED:
                 return StartTaskResponse(
                     success=False,
                     status="closed",
@@ -97,32 +97,29 @@ async def get_inspector_data(project_id: str) -> InspectorResponse:
 
     # Lazy imports — only needed when debug is on
     from agent.prompts import build_system_prompt
-    from ltt.services.learning.objectives import get_objectives
-    from ltt.services.task_service import TaskNotFoundError, get_ancestors, get_children, get_task
+    from ltt.services.project_snapshot import load_project_snapshot
 
     session_factory = get_session_factory()
 
     async with session_factory() as session:
-        # 1. Load project root
-        try:
-            project = await get_task(session, project_id)
-        except TaskNotFoundError:
+        # 1. Load the whole project template (constant number of queries)
+        snapshot = await load_project_snapshot(session, project_id)
+        project = snapshot.project
+        if project is None:
             raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
 
         # 2. Depth-first walk — collect all leaf nodes with breadcrumbs
         leaves: list[tuple[Any, list[str]]] = []
 
-        async def walk(task_id: str, breadcrumb: list[str]) -> None:
-            children = await get_children(session, task_id, recursive=False)
-            children.sort(key=lambda t: (t.priority, t.id))
+        def walk(task_id: str, breadcrumb: list[str]) -> None:
+            children = sorted(snapshot.children_of(task_id), key=lambda t: (t.priority, t.id))
             if not children:
-                task = await get_task(session, task_id)
-                leaves.append((task, list(breadcrumb)))
+                leaves.append((snapshot.get(task_id), list(breadcrumb)))
             else:
                 for child in children:
-                    await walk(child.id, breadcrumb + [child.title])
+                    walk(child.id, breadcrumb + [child.title])
 
-        await walk(project_id, [])
+        walk(project_id, [])
         total_steps = len(leaves)
 
         if total_steps == 0:
@@ -143,27 +140,18 @@ async def get_inspector_data(project_id: str) -> InspectorResponse:
 
         for i, (task, breadcrumb) in enumerate(leaves):
             # Find epic in ancestors
-            ancestors = await get_ancestors(session, task.id)
             epic: InspectorEpic | None = None
-            for anc in ancestors:
-                if hasattr(anc.task_type, "value"):
-                    tt = anc.task_type.value
-                else:
-                    tt = str(anc.task_type)
-                if tt == "epic":
+            for anc in snapshot.ancestors_of(task.id):
+                if anc.task_type == "epic":
                     epic = InspectorEpic(
                         id=anc.id, title=anc.title, description=anc.description
                     )
                     break
 
             # Learning objectives
-            objectives = await get_objectives(session, task.id)
             obj_list = [
-                {
-                    "level": o.level.value if hasattr(o.level, "value") else str(o.level),
-                    "description": o.description,
-                }
-                for o in objectives
+                {"level": str(o.level), "description": o.description}
+                for o in snapshot.objectives_of(task.id)
             ]
 
             # Simulated progress
@@ -174,7 +162,7 @@ async def get_inspector_data(project_id: str) -> InspectorResponse:
             )
 
             # Task type as string
-            task_type_str = task.task_type.value if hasattr(task.task_type, "value") else str(task.task_type)
+            task_type_str = task.task_type
             subtask_type_str = task.subtask_type if task.subtask_type else None
 
             # System prompt — the exact same function the agent uses
@@ -9,7 +9,9 @@ Provides endpoints for:
 
 import logging
 from collections.abc import AsyncGenerator
+from uuid import uuid4
 
+from agent.graph import turn_messages
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
@@ -301,23 +303,15 @@ async def chat(
         # Build message with workspace context (editor content, results)
         full_message = build_message_with_context(request.message, request.context)
 
-        # Get current message count before invoke (to identify new messages)
-        current_state = await agent.aget_state(thread_id=thread_id)
-        # LangGraph state has .values attribute containing the dict
-        state_values = getattr(current_state, "values", {}) if current_state else {}
-        prev_message_count = len(state_values.get("messages", [])) if state_values else 0
+        # The user message's ID marks where this turn starts in the result
+        message_id = str(uuid4())
+        result = await agent.ainvoke(full_message, thread_id=thread_id, message_id=message_id)
 
-        result = await agent.ainvoke(full_message, thread_id=thread_id)
-
-        # Extract response text and tool calls from NEW messages only
-        messages = result.get("messages", [])
+        # Extract response text and tool calls from this turn's messages only
+        new_messages = turn_messages(result.get("messages", []), message_id)
         response_text = ""
         all_tool_calls = []
 
-        # Only collect tool calls from messages added in this turn
-        new_messages = (
-            messages[prev_message_count:] if prev_message_count < len(messages) else messages
-        )
         for msg in new_messages:
             if hasattr(msg, "tool_calls") and msg.tool_calls:
                 for tc in msg.tool_calls:
@@ -330,7 +324,7 @@ async def chat(
                         all_tool_calls.append({"name": str(tc)})
 
         # Get the final response text (last AI message with content, no tool calls)
-        for msg in reversed(messages):
+        for msg in reversed(new_messages):
             if hasattr(msg, "content") and msg.content:
                 # Skip tool messages
                 if hasattr(msg, "tool_call_id"):
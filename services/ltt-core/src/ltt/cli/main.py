@@ -122,6 +122,40 @@ def project_export(
     typer.echo(f"Exported to {output}")
 
 
+@project_app.command("validate")
+def project_validate(
+    project_id: str = typer.Argument(None, help="Project ID (omit with --all)"),
+    all_projects: bool = typer.Option(False, "--all", help="Validate every project"),
+    concurrency: int = typer.Option(4, "--concurrency", "-c", help="Projects checked at once"),
+):
+    """Check project dependency graphs for cycles."""
+    from ltt.db.connection import get_session_factory
+    from ltt.services.dependency_service import detect_cycles, detect_cycles_in_catalogue
+
+    if not all_projects and not project_id:
+        typer.echo("Error: pass a project ID or --all")
+        raise typer.Exit(1)
+
+    async def _validate():
+        if all_projects:
+            return await detect_cycles_in_catalogue(get_session_factory(), concurrency)
+        async with get_async_session() as session:
+            cycles = await detect_cycles(session, project_id)
+            return {project_id: cycles} if cycles else {}
+
+    results = run_async(_validate())
+
+    if not results:
+        typer.echo("No dependency cycles found.")
+        return
+
+    for pid, cycles in results.items():
+        typer.echo(f"✗ {pid}: {len(cycles)} cycle(s)")
+        for cycle in cycles:
+            typer.echo(f"    {' -> '.join(cycle)}")
+    raise typer.Exit(1)
+
+
 # ============================================================================
 # Ingest Commands
 # ============================================================================
@@ -344,6 +378,25 @@ def learner_progress(
     typer.echo(f"  Objectives: {progress.objectives_achieved}/{progress.total_objectives}")
 
 
+@learner_app.command("rebuild-rollups")
+def learner_rebuild_rollups(
+    project_id: str | None = typer.Option(
+        None, "--project", "-p", help="Only rebuild this project (default: all projects)"
+    ),
+):
+    """Recompute learner progress rollups from task progress (repairs drift)."""
+    from ltt.services.progress_rollup import rebuild_rollups
+
+    async def _rebuild():
+        async with get_async_session() as session:
+            count = await rebuild_rollups(session, project_id)
+            await session.commit()
+            return count
+
+    count = run_async(_rebuild())
+    typer.echo(f"Rebuilt {count} progress rollup(s)")
+
+
 # ============================================================================
 # Database Commands
 # ============================================================================
@@ -424,5 +477,41 @@ def db_ensure_databases():
     typer.echo("Database check complete.")
 
 
+@db_app.command("prune-checkpoints")
+def db_prune_checkpoints(
+    keep: int | None = typer.Option(
+        None, "--keep", "-k", help="Checkpoints kept per thread [LTT_CHECKPOINT_KEEP_LATEST]"
+    ),
+    ttl_days: int | None = typer.Option(
+        None,
+        "--ttl-days",
+        help="Drop threads inactive this many days, 0 = never [LTT_CHECKPOINT_THREAD_TTL_DAYS]",
+    ),
+    vacuum: bool = typer.Option(False, "--vacuum", help="VACUUM the checkpoint tables afterwards"),
+):
+    """Trim conversation checkpoints to the latest per thread and drop expired threads."""
+    from ltt.services.checkpoint_retention import run_checkpoint_retention
+
+    try:
+        report = run_async(run_checkpoint_retention(keep, ttl_days, vacuum))
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Exit(1) from e
+
+    if report.skipped:
+        typer.echo("Another checkpoint retention run is in progress; nothing done")
+        return
+
+    typer.echo(f"Trimmed {report.threads_trimmed} thread(s), expired {report.threads_expired}")
+    typer.echo(
+        f"  Deleted {report.checkpoints_deleted} checkpoint(s), {report.writes_deleted} write(s), "
+        f"{report.blobs_deleted} blob(s) (~{report.bytes_deleted / 1024 / 1024:.1f} MB)"
+    )
+    typer.echo(
+        f"  Checkpoint tables: {report.table_bytes_before / 1024 / 1024:.1f} MB → "
+        f"{report.table_bytes_after / 1024 / 1024:.1f} MB"
+    )
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,68 @@
+"""add_task_closure
+
+Revision ID: 3c8e1f4a9d27
+Revises: f8d4e6a9b1c3
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c8e1f4a9d27"
+down_revision: str | Sequence[str] | None = "f8d4e6a9b1c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create task_closure and backfill it from tasks.parent_id."""
+    op.create_table(
+        "task_closure",
+        sa.Column("ancestor_id", sa.String(), nullable=False),
+        sa.Column("descendant_id", sa.String(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["ancestor_id"],
+            ["tasks.id"],
+            name=op.f("fk_task_closure_ancestor_id_tasks"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["descendant_id"],
+            ["tasks.id"],
+            name=op.f("fk_task_closure_descendant_id_tasks"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("ancestor_id", "descendant_id", name=op.f("pk_task_closure")),
+    )
+    op.create_index(
+        "idx_task_closure_descendant",
+        "task_closure",
+        ["descendant_id", "depth"],
+        unique=False,
+    )
+
+    op.execute("""
+        WITH RECURSIVE chain AS (
+            SELECT id AS ancestor_id, id AS descendant_id, parent_id, 0 AS depth
+            FROM tasks
+
+            UNION ALL
+
+            SELECT t.id, c.descendant_id, t.parent_id, c.depth + 1
+            FROM chain c
+            JOIN tasks t ON t.id = c.parent_id
+        )
+        INSERT INTO task_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM chain
+    """)
+
+
+def downgrade() -> None:
+    """Drop task_closure."""
+    op.drop_index("idx_task_closure_descendant", table_name="task_closure")
+    op.drop_table("task_closure")
@@ -0,0 +1,127 @@
+"""add_learner_project_rollup
+
+Revision ID: 5d2a7c9e4b18
+Revises: 3c8e1f4a9d27
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2a7c9e4b18"
+down_revision: str | Sequence[str] | None = "3c8e1f4a9d27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create learner_project_rollup and backfill it for active learners."""
+    op.create_table(
+        "learner_project_rollup",
+        sa.Column("learner_id", sa.String(), nullable=False),
+        sa.Column("project_id", sa.String(), nullable=False),
+        sa.Column("total_tasks", sa.Integer(), nullable=False),
+        sa.Column("completed_tasks", sa.Integer(), nullable=False),
+        sa.Column("in_progress_tasks", sa.Integer(), nullable=False),
+        sa.Column("blocked_tasks", sa.Integer(), nullable=False),
+        sa.Column("total_objectives", sa.Integer(), nullable=False),
+        sa.Column("objectives_achieved", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["learner_id"],
+            ["learners.id"],
+            name=op.f("fk_learner_project_rollup_learner_id_learners"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["project_id"],
+            ["tasks.id"],
+            name=op.f("fk_learner_project_rollup_project_id_tasks"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "learner_id", "project_id", name=op.f("pk_learner_project_rollup")
+        ),
+    )
+    op.create_index(
+        "idx_learner_project_rollup_project",
+        "learner_project_rollup",
+        ["project_id"],
+        unique=False,
+    )
+
+    op.execute("""
+        WITH target AS (
+            SELECT ltp.learner_id, t.project_id
+            FROM learner_task_progress ltp
+            JOIN tasks t ON t.id = ltp.task_id
+            UNION
+            SELECT s.learner_id, t.project_id
+            FROM submissions s
+            JOIN tasks t ON t.id = s.task_id
+        )
+        INSERT INTO learner_project_rollup (
+            learner_id, project_id, total_tasks, completed_tasks, in_progress_tasks,
+            blocked_tasks, total_objectives, objectives_achieved
+        )
+        SELECT
+            target.learner_id,
+            target.project_id,
+            task_counts.total,
+            task_counts.completed,
+            task_counts.in_progress,
+            task_counts.blocked,
+            objective_counts.total,
+            objective_counts.achieved
+        FROM target
+        CROSS JOIN LATERAL (
+            SELECT
+                COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE ltp.status = 'closed') AS completed,
+                COUNT(*) FILTER (WHERE ltp.status = 'in_progress') AS in_progress,
+                COUNT(*) FILTER (WHERE ltp.status = 'blocked') AS blocked
+            FROM tasks t
+            LEFT JOIN learner_task_progress ltp
+                ON ltp.task_id = t.id AND ltp.learner_id = target.learner_id
+            WHERE t.project_id = target.project_id
+              AND t.task_type IN ('task', 'subtask')
+        ) task_counts
+        CROSS JOIN LATERAL (
+            SELECT
+                COUNT(*) AS total,
+                COUNT(*) FILTER (
+                    WHERE EXISTS (
+                        SELECT 1
+                        FROM submissions s
+                        JOIN validations v ON v.submission_id = s.id
+                        WHERE s.task_id = lo.task_id
+                          AND s.learner_id = target.learner_id
+                          AND v.passed = true
+                    )
+                ) AS achieved
+            FROM learning_objectives lo
+            JOIN tasks t ON t.id = lo.task_id
+            WHERE t.project_id = target.project_id
+        ) objective_counts
+    """)
+
+
+def downgrade() -> None:
+    """Drop learner_project_rollup."""
+    op.drop_index("idx_learner_project_rollup_project", table_name="learner_project_rollup")
+    op.drop_table("learner_project_rollup")
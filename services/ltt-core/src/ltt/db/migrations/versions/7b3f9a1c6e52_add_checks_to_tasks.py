@@ -0,0 +1,32 @@
+"""add_checks_to_tasks
+
+Revision ID: 7b3f9a1c6e52
+Revises: 5d2a7c9e4b18
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "7b3f9a1c6e52"
+down_revision: str | Sequence[str] | None = "5d2a7c9e4b18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add tasks.checks (automated result checks for SQL exercises)."""
+    op.add_column(
+        "tasks",
+        sa.Column("checks", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop tasks.checks."""
+    op.drop_column("tasks", "checks")
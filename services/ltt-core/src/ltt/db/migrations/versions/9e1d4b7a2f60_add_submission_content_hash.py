@@ -0,0 +1,49 @@
+"""add_submission_content_hash
+
+Revision ID: 9e1d4b7a2f60
+Revises: 7b3f9a1c6e52
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e1d4b7a2f60"
+down_revision: str | Sequence[str] | None = "7b3f9a1c6e52"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add submissions.content_hash and validations.validator_version."""
+    op.add_column("submissions", sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.add_column("validations", sa.Column("validator_version", sa.String(), nullable=True))
+
+    # Same normalization as submission_service.hash_content
+    op.execute(r"""
+        UPDATE submissions
+        SET content_hash = encode(
+            sha256(convert_to(btrim(replace(content, E'\r\n', E'\n'), E' \t\r\n'), 'UTF8')),
+            'hex'
+        )
+    """)
+
+    op.create_index(
+        "idx_submissions_task_learner_hash",
+        "submissions",
+        ["task_id", "learner_id", "content_hash"],
+        unique=False,
+    )
+    op.create_index("idx_validations_submission", "validations", ["submission_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the content hash, validator version and their indexes."""
+    op.drop_index("idx_validations_submission", table_name="validations")
+    op.drop_index("idx_submissions_task_learner_hash", table_name="submissions")
+    op.drop_column("validations", "validator_version")
+    op.drop_column("submissions", "content_hash")
@@ -0,0 +1,91 @@
+"""add_latest_validation_to_progress
+
+Revision ID: b6c2e8f1a4d3
+Revises: 9e1d4b7a2f60
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6c2e8f1a4d3"
+down_revision: str | Sequence[str] | None = "9e1d4b7a2f60"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add attempt count and latest-validation pointer to learner_task_progress."""
+    op.add_column(
+        "learner_task_progress",
+        sa.Column("attempt_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "learner_task_progress", sa.Column("latest_submission_id", sa.String(), nullable=True)
+    )
+    op.add_column(
+        "learner_task_progress", sa.Column("latest_validation_passed", sa.Boolean(), nullable=True)
+    )
+    op.add_column(
+        "learner_task_progress", sa.Column("latest_validation_error", sa.Text(), nullable=True)
+    )
+    op.create_foreign_key(
+        op.f("fk_learner_task_progress_latest_submission_id_submissions"),
+        "learner_task_progress",
+        "submissions",
+        ["latest_submission_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+    # Learners who submitted without a progress row get an 'open' one
+    op.execute("""
+        INSERT INTO learner_task_progress (id, task_id, learner_id, status, created_at, updated_at)
+        SELECT 'ltp-' || substr(md5(random()::text || s.task_id || s.learner_id), 1, 8),
+               s.task_id, s.learner_id, 'open', now(), now()
+        FROM (SELECT DISTINCT task_id, learner_id FROM submissions) s
+        ON CONFLICT (task_id, learner_id) DO NOTHING
+    """)
+
+    op.execute("""
+        UPDATE learner_task_progress p
+        SET attempt_count = counts.attempts
+        FROM (
+            SELECT task_id, learner_id, MAX(attempt_number) AS attempts
+            FROM submissions
+            GROUP BY task_id, learner_id
+        ) counts
+        WHERE p.task_id = counts.task_id AND p.learner_id = counts.learner_id
+    """)
+
+    op.execute("""
+        UPDATE learner_task_progress p
+        SET latest_submission_id = latest.submission_id,
+            latest_validation_passed = latest.passed,
+            latest_validation_error = latest.error_message
+        FROM (
+            SELECT DISTINCT ON (s.task_id, s.learner_id)
+                s.task_id, s.learner_id, v.submission_id, v.passed, v.error_message
+            FROM validations v
+            JOIN submissions s ON s.id = v.submission_id
+            ORDER BY s.task_id, s.learner_id, v.validated_at DESC
+        ) latest
+        WHERE p.task_id = latest.task_id AND p.learner_id = latest.learner_id
+    """)
+
+
+def downgrade() -> None:
+    """Drop the attempt count and latest-validation pointer."""
+    op.drop_constraint(
+        op.f("fk_learner_task_progress_latest_submission_id_submissions"),
+        "learner_task_progress",
+        type_="foreignkey",
+    )
+    op.drop_column("learner_task_progress", "latest_validation_error")
+    op.drop_column("learner_task_progress", "latest_validation_passed")
+    op.drop_column("learner_task_progress", "latest_submission_id")
+    op.drop_column("learner_task_progress", "attempt_count")
@@ -0,0 +1,31 @@
+"""add_learner_progress_revision
+
+Revision ID: c7e2a9d4f1b8
+Revises: b6c2e8f1a4d3
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2a9d4f1b8"
+down_revision: str | Sequence[str] | None = "b6c2e8f1a4d3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add learners.progress_revision."""
+    op.add_column(
+        "learners",
+        sa.Column("progress_revision", sa.BigInteger(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop learners.progress_revision."""
+    op.drop_column("learners", "progress_revision")
@@ -0,0 +1,44 @@
+"""add_first_passed_at_to_progress
+
+Revision ID: d3f8b1e6a9c2
+Revises: c7e2a9d4f1b8
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f8b1e6a9c2"
+down_revision: str | Sequence[str] | None = "c7e2a9d4f1b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add learner_task_progress.first_passed_at, set from existing validations."""
+    op.add_column(
+        "learner_task_progress",
+        sa.Column("first_passed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    op.execute("""
+        UPDATE learner_task_progress p
+        SET first_passed_at = passes.first_passed_at
+        FROM (
+            SELECT s.task_id, s.learner_id, MIN(v.validated_at) AS first_passed_at
+            FROM validations v
+            JOIN submissions s ON s.id = v.submission_id
+            WHERE v.passed = true
+            GROUP BY s.task_id, s.learner_id
+        ) passes
+        WHERE p.task_id = passes.task_id AND p.learner_id = passes.learner_id
+    """)
+
+
+def downgrade() -> None:
+    """Drop learner_task_progress.first_passed_at."""
+    op.drop_column("learner_task_progress", "first_passed_at")
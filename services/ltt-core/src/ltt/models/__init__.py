@@ -68,6 +68,7 @@ from .learner import (
 
 # Learner Task Progress
 from .learner_task_progress import (
+    LearnerProjectRollupModel,
     LearnerTaskProgress,
     LearnerTaskProgressBase,
     LearnerTaskProgressCreate,
@@ -110,6 +111,7 @@ from .submission import (
 from .task import (
     Task,
     TaskBase,
+    TaskClosureModel,
     TaskCreate,
     TaskDetail,
     TaskModel,
@@ -143,12 +145,14 @@ __all__ = [
     "TaskType",
     "TaskStatus",
     "TaskModel",
+    "TaskClosureModel",
     "WorkspaceType",
     # Learner Task Progress
     "LearnerTaskProgress",
     "LearnerTaskProgressBase",
     "LearnerTaskProgressCreate",
     "LearnerTaskProgressModel",
+    "LearnerProjectRollupModel",
     # Dependency
     "Dependency",
     "DependencyBase",
@@ -7,7 +7,7 @@ User profile for tracking progress.
 from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import BigInteger, DateTime, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -75,6 +75,10 @@ class LearnerModel(Base):
     id: Mapped[str] = mapped_column(String, primary_key=True)
     learner_metadata: Mapped[str] = mapped_column(Text, default="{}")  # JSON string
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Advanced by every progress status write (see ltt.services.ready_set)
+    progress_revision: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
 
     # Relationships
     submissions: Mapped[list["SubmissionModel"]] = relationship(  # type: ignore
@@ -8,7 +8,16 @@ This is the INSTANCE LAYER that pairs with Task (template layer).
 from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -43,6 +52,9 @@ class LearnerTaskProgress(LearnerTaskProgressBase):
     id: str
     task_id: str
     learner_id: str
+    attempt_count: int = 0
+    latest_submission_id: str | None = None
+    latest_validation_passed: bool | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -74,6 +86,21 @@ class LearnerTaskProgressModel(Base, TimestampMixin):
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     close_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # Submission bookkeeping, maintained by submission_service and
+    # validation_service so the close gate and attempt numbering are point
+    # reads of this row. The latest submission is the one that was validated
+    # most recently.
+    attempt_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    latest_submission_id: Mapped[str | None] = mapped_column(
+        String, ForeignKey("submissions.id", ondelete="SET NULL"), nullable=True
+    )
+    latest_validation_passed: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    latest_validation_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Set once, by the learner's first passing validation (see progress_rollup)
+    first_passed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
     # Relationships
     task: Mapped["TaskModel"] = relationship(  # type: ignore
         "TaskModel", back_populates="learner_progress"
@@ -88,3 +115,32 @@ class LearnerTaskProgressModel(Base, TimestampMixin):
         Index("idx_learner_task_progress_task_learner", "task_id", "learner_id"),
         Index("idx_learner_task_progress_learner_status", "learner_id", "status"),
     )
+
+
+class LearnerProjectRollupModel(Base, TimestampMixin):
+    """
+    SQLAlchemy model for learner_project_rollup table.
+
+    Per-learner progress counts for one project, maintained incrementally by
+    status transitions and passing validations so progress reads are a single
+    primary-key lookup. Task counts cover 'task' and 'subtask' types only.
+    Maintained by ltt.services.progress_rollup.
+    """
+
+    __tablename__ = "learner_project_rollup"
+
+    learner_id: Mapped[str] = mapped_column(
+        String, ForeignKey("learners.id", ondelete="CASCADE"), primary_key=True
+    )
+    project_id: Mapped[str] = mapped_column(
+        String, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    total_tasks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_tasks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    in_progress_tasks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    blocked_tasks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_objectives: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    objectives_achieved: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (Index("idx_learner_project_rollup_project", "project_id"),)
@@ -69,6 +69,15 @@ class TutorGuidance(BaseModel):
     answer_rationale: str | None = None
 
 
+class ResultCheck(BaseModel):
+    """Automated check for a SQL exercise. The learner's result is compared
+    with the result of ``query`` and with the ``expect`` constraints
+    (row_count, min_rows, columns, match_reference)."""
+
+    query: str = Field(..., min_length=1)
+    expect: dict = Field(default_factory=dict)
+
+
 class TutorConfig(BaseModel):
     """Project-level tutor behaviour. Sets defaults for the whole project;
     subtask-level ``tutor_guidance`` overrides for specific situations."""
@@ -94,6 +103,7 @@ class SubtaskSchema(BaseModel):
     estimated_minutes: int | None = Field(default=None, ge=0)
     content: str | None = None
     tutor_guidance: TutorGuidance | None = None
+    checks: list[ResultCheck] = Field(default_factory=list)
     dependencies: list[str] = Field(default_factory=list)
 
     # Nested subtasks (rarely used)
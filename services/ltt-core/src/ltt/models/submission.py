@@ -84,6 +84,8 @@ class SubmissionModel(Base):
 
     submission_type: Mapped[str] = mapped_column(String, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # sha256 of the normalized content (see submission_service.hash_content)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     attempt_number: Mapped[int] = mapped_column(Integer, default=1)
 
     submitted_at: Mapped[datetime] = mapped_column(
@@ -103,5 +105,8 @@ class SubmissionModel(Base):
         cascade="all, delete-orphan",
     )
 
-    # Composite index for efficient lookups
-    __table_args__ = (Index("idx_submissions_task_learner", "task_id", "learner_id"),)
+    # Composite indexes for efficient lookups
+    __table_args__ = (
+        Index("idx_submissions_task_learner", "task_id", "learner_id"),
+        Index("idx_submissions_task_learner_hash", "task_id", "learner_id", "content_hash"),
+    )
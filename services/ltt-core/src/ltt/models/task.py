@@ -11,7 +11,7 @@ from enum import StrEnum
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import ARRAY, Boolean, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import ARRAY, Boolean, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -130,6 +130,12 @@ class TaskBase(BaseModel):
         description="Stable slug from JSON project_id field (project level only)",
     )
 
+    # Automated result checks (SQL exercises)
+    checks: list[dict] | None = Field(
+        default=None,
+        description="Result checks for automated validation: [{query, expect}]",
+    )
+
 
 class TaskCreate(TaskBase):
     """Schema for creating a new task."""
@@ -268,6 +274,7 @@ class TaskModel(Base, TimestampMixin):
     tutor_config: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     max_grade: Mapped[float | None] = mapped_column(Float, nullable=True)
     project_slug: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    checks: Mapped[list | None] = mapped_column(JSONB, nullable=True)
 
     # Relationships
     parent: Mapped[Optional["TaskModel"]] = relationship(
@@ -324,3 +331,26 @@ class TaskModel(Base, TimestampMixin):
         back_populates="depends_on",
         cascade="all, delete-orphan",
     )
+
+
+class TaskClosureModel(Base):
+    """
+    SQLAlchemy model for task_closure table.
+
+    Closure of the parent_id hierarchy: one row per (ancestor, descendant)
+    pair, including the depth-0 self row. Lets ancestor/descendant lookups
+    run as a single indexed query. Maintained by task_service; rows are
+    removed by the FK cascade when a task is deleted.
+    """
+
+    __tablename__ = "task_closure"
+
+    ancestor_id: Mapped[str] = mapped_column(
+        String, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True
+    )
+    descendant_id: Mapped[str] = mapped_column(
+        String, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (Index("idx_task_closure_descendant", "descendant_id", "depth"),)
@@ -8,7 +8,7 @@ from datetime import datetime
 from enum import StrEnum
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -82,6 +82,8 @@ class ValidationModel(Base):
     grade: Mapped[float | None] = mapped_column(Float, nullable=True)
     grader_type: Mapped[str] = mapped_column(String(20), default="auto")
     feedback: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Validator and task-criteria fingerprint the verdict was computed with
+    validator_version: Mapped[str | None] = mapped_column(String, nullable=True)
 
     validated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -91,3 +93,5 @@ class ValidationModel(Base):
     submission: Mapped["SubmissionModel"] = relationship(  # type: ignore
         "SubmissionModel", back_populates="validations"
     )
+
+    __table_args__ = (Index("idx_validations_submission", "submission_id"),)
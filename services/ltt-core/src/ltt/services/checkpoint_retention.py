@@ -0,0 +1,274 @@
+"""
+Retention for the LangGraph checkpoint database.
+
+The tutor's checkpointer (``AsyncPostgresSaver``) stores every graph step
+of every thread in ``checkpoints``, with channel values in
+``checkpoint_blobs`` and pending writes in ``checkpoint_writes``, and never
+deletes any of it. ``prune_checkpoints`` bounds that growth:
+
+- Only the latest ``keep_latest`` checkpoints of each thread are kept (the
+  latest one is all a conversation needs to resume), with the writes and
+  blobs only the deleted ones referenced. Threads with a checkpoint newer
+  than ``min_idle`` are skipped so a run never races a turn in progress.
+- Threads whose ``conversation_threads.updated_at`` is older than
+  ``thread_ttl`` are dropped entirely, checkpoints and thread record both.
+
+The checkpoint tables live in their own database, so the function takes an
+engine for it alongside a session on the main database. Runs are
+serialized with an advisory lock; a run that finds another in progress
+does nothing.
+
+Run from the CLI (``ltt db prune-checkpoints``) or the API's background task
+(LTT_CHECKPOINT_PRUNE_INTERVAL_HOURS).
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+
+from ltt_settings import get_settings
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from ltt.db.connection import get_session
+
+CHECKPOINT_TABLES = ("checkpoints", "checkpoint_blobs", "checkpoint_writes")
+
+# Advisory lock key serializing retention runs across processes
+_LOCK_KEY = 7_318_204_551
+
+_TABLES_SIZE = text(
+    "SELECT coalesce(sum(pg_total_relation_size(to_regclass(name))), 0)"
+    " FROM unnest(CAST(:tables AS text[])) AS name"
+)
+
+# Threads with more than :keep checkpoints and none in the last :idle seconds
+_THREADS_OVER_LIMIT = text("""
+    SELECT thread_id
+    FROM checkpoints
+    GROUP BY thread_id
+    HAVING count(*) > :keep
+       AND max((checkpoint->>'ts')::timestamptz) < now() - make_interval(secs => :idle)
+""")
+
+_DELETE_OLD_CHECKPOINTS = text("""
+    WITH ranked AS (
+        SELECT thread_id, checkpoint_ns, checkpoint_id,
+               row_number() OVER (
+                   PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+               ) AS rank
+        FROM checkpoints
+        WHERE thread_id = ANY(:threads)
+    ), deleted AS (
+        DELETE FROM checkpoints c
+        USING ranked r
+        WHERE c.thread_id = r.thread_id
+          AND c.checkpoint_ns = r.checkpoint_ns
+          AND c.checkpoint_id = r.checkpoint_id
+          AND r.rank > :keep
+        RETURNING pg_column_size(c.*) AS size
+    )
+    SELECT count(*), coalesce(sum(size), 0) FROM deleted
+""")
+
+_DELETE_ORPHAN_WRITES = text("""
+    WITH deleted AS (
+        DELETE FROM checkpoint_writes w
+        WHERE w.thread_id = ANY(:threads)
+          AND NOT EXISTS (
+              SELECT 1 FROM checkpoints c
+              WHERE c.thread_id = w.thread_id
+                AND c.checkpoint_ns = w.checkpoint_ns
+                AND c.checkpoint_id = w.checkpoint_id
+          )
+        RETURNING pg_column_size(w.*) AS size
+    )
+    SELECT count(*), coalesce(sum(size), 0) FROM deleted
+""")
+
+# Blobs hold one version of one channel; live ones are named by a checkpoint
+_DELETE_ORPHAN_BLOBS = text("""
+    WITH deleted AS (
+        DELETE FROM checkpoint_blobs b
+        WHERE b.thread_id = ANY(:threads)
+          AND NOT EXISTS (
+              SELECT 1 FROM checkpoints c
+              WHERE c.thread_id = b.thread_id
+                AND c.checkpoint_ns = b.checkpoint_ns
+                AND c.checkpoint->'channel_versions'->>b.channel = b.version
+          )
+        RETURNING pg_column_size(b.*) AS size
+    )
+    SELECT count(*), coalesce(sum(size), 0) FROM deleted
+""")
+
+# Tables holding each kind of row, keyed as in CheckpointPruneReport
+_EXPIRED_TABLES = {
+    "checkpoints": "checkpoints",
+    "writes": "checkpoint_writes",
+    "blobs": "checkpoint_blobs",
+}
+
+_DELETE_THREADS = {
+    kind: text(f"""
+        WITH deleted AS (
+            DELETE FROM {table} t WHERE t.thread_id = ANY(:threads)
+            RETURNING pg_column_size(t.*) AS size
+        )
+        SELECT count(*), coalesce(sum(size), 0) FROM deleted
+    """)
+    for kind, table in _EXPIRED_TABLES.items()
+}
+
+
+@dataclass
+class CheckpointPruneReport:
+    """What a retention run deleted."""
+
+    threads_trimmed: int = 0  # Threads cut down to their latest checkpoints
+    threads_expired: int = 0  # Threads dropped after the TTL
+    checkpoints_deleted: int = 0
+    writes_deleted: int = 0
+    blobs_deleted: int = 0
+    bytes_deleted: int = 0  # Approximate size of the deleted rows
+    table_bytes_before: int = 0
+    table_bytes_after: int = 0  # Freed pages are only released by a vacuum
+    skipped: bool = False  # Another run held the lock
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        """Disk space returned by the tables (after vacuum)."""
+        return max(self.table_bytes_before - self.table_bytes_after, 0)
+
+    def _add(self, kind: str, row) -> None:
+        count, size = row
+        setattr(self, f"{kind}_deleted", getattr(self, f"{kind}_deleted") + count)
+        self.bytes_deleted += size
+
+
+async def prune_checkpoints(
+    checkpoint_engine: AsyncEngine,
+    session: AsyncSession,
+    keep_latest: int,
+    thread_ttl: timedelta | None = None,
+    min_idle: timedelta = timedelta(minutes=10),
+    vacuum: bool = False,
+) -> CheckpointPruneReport:
+    """
+    Trim and expire conversation checkpoints.
+
+    The checkpoint deletions are committed here; deleting the expired
+    ``conversation_threads`` rows is left to the caller's commit.
+
+    Args:
+        checkpoint_engine: Engine on the checkpoint database
+        session: Session on the main database
+        keep_latest: Checkpoints kept per thread (at least 1)
+        thread_ttl: Drop threads not updated for this long (None = keep all)
+        min_idle: Leave threads with a checkpoint newer than this alone
+        vacuum: VACUUM the checkpoint tables afterwards so the space is
+            reusable and the size report reflects the deletions
+
+    Returns:
+        What was deleted
+    """
+    keep_latest = max(keep_latest, 1)
+    report = CheckpointPruneReport()
+
+    expired: list[str] = []
+    if thread_ttl is not None:
+        result = await session.execute(
+            text(
+                "SELECT thread_id FROM conversation_threads"
+                " WHERE updated_at < now() - make_interval(secs => :ttl)"
+            ),
+            {"ttl": thread_ttl.total_seconds()},
+        )
+        expired = list(result.scalars())
+
+    async with checkpoint_engine.begin() as conn:
+        locked = await conn.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _LOCK_KEY}
+        )
+        if not locked:
+            report.skipped = True
+            return report
+
+        report.table_bytes_before = await conn.scalar(
+            _TABLES_SIZE, {"tables": list(CHECKPOINT_TABLES)}
+        )
+
+        if expired:
+            for kind, statement in _DELETE_THREADS.items():
+                report._add(kind, (await conn.execute(statement, {"threads": expired})).one())
+            report.threads_expired = len(expired)
+
+        result = await conn.execute(
+            _THREADS_OVER_LIMIT, {"keep": keep_latest, "idle": min_idle.total_seconds()}
+        )
+        threads = list(result.scalars())
+        if threads:
+            params = {"threads": threads}
+            result = await conn.execute(_DELETE_OLD_CHECKPOINTS, {**params, "keep": keep_latest})
+            report._add("checkpoints", result.one())
+            report._add("writes", (await conn.execute(_DELETE_ORPHAN_WRITES, params)).one())
+            report._add("blobs", (await conn.execute(_DELETE_ORPHAN_BLOBS, params)).one())
+            report.threads_trimmed = len(threads)
+
+    if expired:
+        await session.execute(
+            text("DELETE FROM conversation_threads WHERE thread_id = ANY(:threads)"),
+            {"threads": expired},
+        )
+
+    async with checkpoint_engine.connect() as conn:
+        if vacuum:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text(f"VACUUM {', '.join(CHECKPOINT_TABLES)}"))
+        report.table_bytes_after = await conn.scalar(
+            _TABLES_SIZE, {"tables": list(CHECKPOINT_TABLES)}
+        )
+
+    return report
+
+
+def create_checkpoint_engine(url: str) -> AsyncEngine:
+    """Create an engine on the checkpoint database from its psycopg URL."""
+    _, location = url.split("://", 1)
+    return create_async_engine(f"postgresql+asyncpg://{location}", poolclass=NullPool)
+
+
+async def run_checkpoint_retention(
+    keep_latest: int | None = None,
+    thread_ttl_days: int | None = None,
+    vacuum: bool = False,
+) -> CheckpointPruneReport:
+    """
+    Run prune_checkpoints against the configured databases.
+
+    Args:
+        keep_latest: Override LTT_CHECKPOINT_KEEP_LATEST
+        thread_ttl_days: Override LTT_CHECKPOINT_THREAD_TTL_DAYS (0 = keep all)
+        vacuum: VACUUM the checkpoint tables afterwards
+
+    Raises:
+        ValueError: If LTT_CHECKPOINT_DATABASE_URL is not set
+    """
+    settings = get_settings()
+    if not settings.checkpoint_database_url:
+        raise ValueError("LTT_CHECKPOINT_DATABASE_URL is not set")
+
+    if keep_latest is None:
+        keep_latest = settings.checkpoint_keep_latest
+    if thread_ttl_days is None:
+        thread_ttl_days = settings.checkpoint_thread_ttl_days
+    thread_ttl = timedelta(days=thread_ttl_days) if thread_ttl_days > 0 else None
+
+    engine = create_checkpoint_engine(settings.checkpoint_database_url)
+    try:
+        async with get_session() as session:
+            return await prune_checkpoints(
+                engine, session, keep_latest, thread_ttl, vacuum=vacuum
+            )
+    finally:
+        await engine.dispose()
@@ -5,20 +5,27 @@ Manages task dependencies, blocking logic, and ready work detection.
 All blocking queries are learner-scoped per ADR-001.
 """
 
+import asyncio
 import json
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any
 
-from sqlalchemy import select, text
+from sqlalchemy import bindparam, insert, select, text
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
 
 from ltt.models import (
     Dependency,
     DependencyModel,
     DependencyType,
+    LearnerTaskProgressModel,
     Task,
     TaskModel,
 )
+from ltt.services.project_graph import get_project_graph, invalidate_project_graph
+from ltt.services.project_snapshot import invalidate_project_snapshot
 
 # ============================================================================
 # Exceptions
@@ -55,6 +62,9 @@ class TaskNotFoundError(DependencyError):
 
 BLOCKING_TYPES = {DependencyType.BLOCKS, DependencyType.PARENT_CHILD}
 
+# Rows fetched per round-trip when streaming edges for cycle detection
+CYCLE_SCAN_BATCH_SIZE = 1000
+
 
 # ============================================================================
 # CRUD Operations
@@ -102,6 +112,8 @@ async def add_dependency(
     if not depends_on:
         raise TaskNotFoundError(f"Task {depends_on_id} does not exist")
 
+    project_id = task.project_id
+
     # 2. Check not already exists
     existing_result = await session.execute(
         select(DependencyModel)
@@ -133,6 +145,9 @@ async def add_dependency(
         await session.rollback()
         raise DuplicateError(f"Dependency already exists: {e}") from e
 
+    invalidate_project_graph(project_id)
+    invalidate_project_snapshot(project_id)
+
     # Map dep_metadata to metadata for Pydantic model
     return Dependency(
         task_id=dep.task_id,
@@ -144,6 +159,128 @@ async def add_dependency(
     )
 
 
+async def add_dependencies_bulk(
+    session: AsyncSession,
+    edges: Iterable[tuple[str, str]],
+    dependency_type: DependencyType = DependencyType.BLOCKS,
+    actor: str = "system",
+) -> list[Dependency]:
+    """
+    Create many dependency relationships at once.
+
+    The whole batch is validated in memory against one read of the existing
+    graph (existence, duplicates, acyclicity) and then written with a single
+    multi-row INSERT. Nothing is committed: the rows become part of the
+    caller's transaction, and nothing is written if any edge is invalid.
+    After committing, callers must call ``invalidate_project_graph`` and
+    ``invalidate_project_snapshot`` for the projects of the dependent tasks.
+
+    Args:
+        session: Database session
+        edges: (task_id, depends_on_id) pairs, validated in order
+        dependency_type: Type of relationship for every edge
+        actor: Who created these dependencies
+
+    Returns:
+        Created dependencies, in input order
+
+    Raises:
+        TaskNotFoundError: If any referenced task doesn't exist
+        CycleError: If an edge would create a circular dependency
+        DuplicateError: If an edge already exists (or repeats in the batch)
+    """
+    edges = list(edges)
+    if not edges:
+        return []
+
+    endpoint_ids = {task_id for edge in edges for task_id in edge}
+
+    # 1. Check all tasks exist
+    task_result = await session.execute(select(TaskModel.id).where(TaskModel.id.in_(endpoint_ids)))
+    found = set(task_result.scalars())
+    for task_id, depends_on_id in edges:
+        for endpoint in (task_id, depends_on_id):
+            if endpoint not in found:
+                raise TaskNotFoundError(f"Task {endpoint} does not exist")
+
+    # 2. Load every existing edge reachable from the batch's endpoints
+    blocking_types = [t.value for t in BLOCKING_TYPES]
+    query = text("""
+        WITH RECURSIVE reachable AS (
+            SELECT id AS task_id FROM tasks WHERE id IN :endpoint_ids
+            UNION
+            SELECT d.depends_on_id
+            FROM dependencies d
+            JOIN reachable r ON d.task_id = r.task_id
+            WHERE d.dependency_type IN :blocking_types
+        )
+        SELECT d.task_id, d.depends_on_id, d.dependency_type
+        FROM dependencies d
+        JOIN reachable r ON d.task_id = r.task_id
+    """).bindparams(
+        bindparam("endpoint_ids", expanding=True),
+        bindparam("blocking_types", expanding=True),
+    )
+    result = await session.execute(
+        query, {"endpoint_ids": list(endpoint_ids), "blocking_types": blocking_types}
+    )
+
+    existing: set[tuple[str, str]] = set()
+    graph: dict[str, list[str]] = defaultdict(list)
+    for task_id, depends_on_id, existing_type in result.all():
+        existing.add((task_id, depends_on_id))
+        if existing_type in blocking_types:
+            graph[task_id].append(depends_on_id)
+
+    # 3. Validate each new edge against the graph including earlier batch edges
+    for task_id, depends_on_id in edges:
+        if (task_id, depends_on_id) in existing:
+            raise DuplicateError(f"Dependency {task_id} -> {depends_on_id} already exists")
+        existing.add((task_id, depends_on_id))
+
+        if dependency_type in BLOCKING_TYPES:
+            path = _find_path(graph, depends_on_id, task_id)
+            if path is not None:
+                raise CycleError(
+                    f"Adding dependency {task_id} -> {depends_on_id} would create a cycle",
+                    cycle=[task_id, *path],
+                )
+            graph[task_id].append(depends_on_id)
+
+    # 4. Insert the whole batch in one statement
+    insert_result = await session.execute(
+        insert(DependencyModel)
+        .values(
+            [
+                {
+                    "task_id": task_id,
+                    "depends_on_id": depends_on_id,
+                    "dependency_type": dependency_type.value,
+                    "dep_metadata": "{}",
+                    "created_by": actor,
+                }
+                for task_id, depends_on_id in edges
+            ]
+        )
+        .returning(
+            DependencyModel.task_id, DependencyModel.depends_on_id, DependencyModel.created_at
+        )
+    )
+    created_at = {(row[0], row[1]): row[2] for row in insert_result.all()}
+
+    return [
+        Dependency(
+            task_id=task_id,
+            depends_on_id=depends_on_id,
+            dependency_type=dependency_type,
+            metadata={},
+            created_at=created_at[(task_id, depends_on_id)],
+            created_by=actor,
+        )
+        for task_id, depends_on_id in edges
+    ]
+
+
 async def remove_dependency(
     session: AsyncSession,
     task_id: str,
@@ -170,9 +307,15 @@ async def remove_dependency(
     if not dep:
         raise DependencyNotFoundError(f"Dependency {task_id} -> {depends_on_id} does not exist")
 
+    task = await session.get(TaskModel, task_id)
+    project_id = task.project_id if task else None
+
     await session.delete(dep)
     await session.commit()
 
+    invalidate_project_graph(project_id)
+    invalidate_project_snapshot(project_id)
+
 
 async def get_dependencies(
     session: AsyncSession,
@@ -271,27 +414,61 @@ async def get_blocking_tasks(
     Returns:
         List of blocking tasks (not closed by learner)
     """
+    blockers = await get_blockers_for_tasks(session, [task_id], learner_id)
+    return blockers[task_id]
+
+
+async def get_blockers_for_tasks(
+    session: AsyncSession,
+    task_ids: Iterable[str],
+    learner_id: str,
+) -> dict[str, list[Task]]:
+    """
+    Get the current blockers of many tasks for a learner in one query.
+
+    Same semantics as get_blocking_tasks: 'blocks' and 'parent_child'
+    dependencies whose target is not closed by this learner.
+
+    Args:
+        session: Database session
+        task_ids: Tasks to check
+        learner_id: Learner whose progress to check
+
+    Returns:
+        Mapping of every requested task ID to its blocking tasks
+        (empty list if unblocked)
+    """
+    blockers: dict[str, list[Task]] = {task_id: [] for task_id in task_ids}
+    if not blockers:
+        return blockers
+
     query = text("""
-        SELECT DISTINCT t.*
-        FROM tasks t
-        JOIN dependencies d ON d.depends_on_id = t.id
+        SELECT d.task_id AS blocked_task_id, t.*
+        FROM dependencies d
+        JOIN tasks t ON t.id = d.depends_on_id
         LEFT JOIN learner_task_progress ltp
           ON ltp.task_id = t.id AND ltp.learner_id = :learner_id
-        WHERE d.task_id = :task_id
+        WHERE d.task_id IN :task_ids
           AND d.dependency_type IN ('blocks', 'parent_child')
           AND COALESCE(ltp.status, 'open') != 'closed'
-    """)
+    """).bindparams(bindparam("task_ids", expanding=True))
 
     result = await session.execute(
         query,
-        {"task_id": task_id, "learner_id": learner_id},
+        {"task_ids": list(blockers), "learner_id": learner_id},
     )
 
-    tasks = []
+    # A blocker shared by several tasks is materialized once
+    tasks_by_id: dict[str, Task] = {}
     for row in result.mappings():
-        tasks.append(Task.model_validate(dict(row)))
+        row = dict(row)
+        blocked_task_id = row.pop("blocked_task_id")
+        task = tasks_by_id.get(row["id"])
+        if task is None:
+            task = tasks_by_id[row["id"]] = Task.model_validate(row)
+        blockers[blocked_task_id].append(task)
 
-    return tasks
+    return blockers
 
 
 async def is_task_blocked(
@@ -385,9 +562,12 @@ async def get_ready_work(
 
     Ordering:
     - In-progress tasks first
+    - Hierarchy level (project → epic → task → subtask)
     - Priority (lower first: P0, P1, P2...)
-    - Hierarchy depth (parents before children)
-    - Creation date (older first)
+    - Hierarchical ID (parents before children)
+
+    The project's task/dependency structure comes from the compiled graph
+    cache (see project_graph), so this costs one progress query per call.
 
     Args:
         session: Database session
@@ -399,73 +579,18 @@ async def get_ready_work(
     Returns:
         List of ready tasks with learner's progress
     """
-    # Build the task_type filter conditionally
-    task_type_filter = "AND t.task_type = :task_type" if task_type else ""
+    graph = await get_project_graph(session, project_id)
+    if not graph.task_ids:
+        return []
 
-    query = text(f"""
-        WITH RECURSIVE
-        -- Tasks directly blocked by 'blocks' dependencies
-        blocked_directly AS (
-            SELECT DISTINCT d.task_id
-            FROM dependencies d
-            LEFT JOIN learner_task_progress ltp_blocker
-              ON ltp_blocker.task_id = d.depends_on_id
-              AND ltp_blocker.learner_id = :learner_id
-            WHERE d.dependency_type = 'blocks'
-              AND COALESCE(ltp_blocker.status, 'open') != 'closed'
-        ),
-        -- Propagate blocking to children via parent_id hierarchy
-        blocked_with_children AS (
-            SELECT task_id FROM blocked_directly
-            UNION
-            SELECT t.id
-            FROM blocked_with_children bwc
-            JOIN tasks t ON t.parent_id = bwc.task_id
-        )
-        SELECT
-          t.*
-        FROM tasks t
-        LEFT JOIN learner_task_progress ltp
-          ON ltp.task_id = t.id AND ltp.learner_id = :learner_id
-        WHERE t.project_id = :project_id
-          AND COALESCE(ltp.status, 'open') IN ('open', 'in_progress')
-          {task_type_filter}
-          AND NOT EXISTS (
-            SELECT 1 FROM blocked_with_children bwc WHERE bwc.task_id = t.id
-          )
-        ORDER BY
-          CASE COALESCE(ltp.status, 'open')
-            WHEN 'in_progress' THEN 0
-            WHEN 'open' THEN 1
-          END,
-          -- Hierarchy: project → epic → task → subtask
-          CASE t.task_type
-            WHEN 'project' THEN 0
-            WHEN 'epic' THEN 1
-            WHEN 'task' THEN 2
-            WHEN 'subtask' THEN 3
-            ELSE 4
-          END,
-          t.priority ASC,
-          t.id ASC  -- Hierarchical IDs sort naturally (parent before child)
-        LIMIT :limit
-    """)
-
-    params = {
-        "project_id": project_id,
-        "learner_id": learner_id,
-        "limit": limit,
-    }
-    if task_type:
-        params["task_type"] = task_type
-
-    result = await session.execute(query, params)
-
-    tasks = []
-    for row in result.mappings():
-        tasks.append(Task.model_validate(dict(row)))
+    result = await session.execute(
+        select(LearnerTaskProgressModel.task_id, LearnerTaskProgressModel.status)
+        .where(LearnerTaskProgressModel.learner_id == learner_id)
+        .where(LearnerTaskProgressModel.task_id.in_(graph.task_ids))
+    )
+    statuses = {task_id: status for task_id, status in result.all()}
 
-    return tasks
+    return graph.ready_tasks(statuses, task_type=task_type, limit=limit)
 
 
 async def get_blocked_tasks(
@@ -499,14 +624,10 @@ async def get_blocked_tasks(
         {"project_id": project_id, "learner_id": learner_id},
     )
 
-    blocked_tasks_with_blockers = []
-
-    for row in result.mappings():
-        task = Task.model_validate(dict(row))
-        blockers = await get_blocking_tasks(session, task.id, learner_id)
-        blocked_tasks_with_blockers.append((task, blockers))
+    blocked_tasks = [Task.model_validate(dict(row)) for row in result.mappings()]
+    blockers = await get_blockers_for_tasks(session, [t.id for t in blocked_tasks], learner_id)
 
-    return blocked_tasks_with_blockers
+    return [(task, blockers[task.id]) for task in blocked_tasks]
 
 
 # ============================================================================
@@ -572,70 +693,183 @@ async def detect_cycles(
     project_id: str,
 ) -> list[list[str]]:
     """
-    Detect all cycles in the dependency graph using Tarjan's algorithm.
+    Detect all cycles in a project's dependency graph using Tarjan's algorithm.
+
+    The project's own blocking edges are streamed from the database. Edges
+    may lead into other projects (add_dependency allows them), so the scan
+    then follows the blocking edges of those outside tasks, hop by hop,
+    until it is back inside the project or out of edges. A cycle through
+    several projects is therefore found from each of them.
 
     Args:
         session: Database session
         project_id: Scope to project
 
     Returns:
-        List of cycles, each a list of task IDs in the cycle
+        List of cycles passing through the project's tasks, each a list of
+        task IDs in the cycle
     """
-    # Get all tasks in project
-    tasks_result = await session.execute(
-        select(TaskModel.id).where(TaskModel.project_id == project_id)
+    blocking = [t.value for t in BLOCKING_TYPES]
+    dependent = aliased(TaskModel)
+    dependency = aliased(TaskModel)
+    query = (
+        select(DependencyModel.task_id, DependencyModel.depends_on_id, dependency.project_id)
+        .join(dependent, dependent.id == DependencyModel.task_id)
+        .join(dependency, dependency.id == DependencyModel.depends_on_id)
+        .where(dependent.project_id == project_id)
+        .where(DependencyModel.dependency_type.in_(blocking))
+        .execution_options(yield_per=CYCLE_SCAN_BATCH_SIZE)
     )
-    all_tasks = {row[0] for row in tasks_result.fetchall()}
 
-    # Get all dependencies (blocking types only)
-    deps_result = await session.execute(
-        select(DependencyModel.task_id, DependencyModel.depends_on_id).where(
-            DependencyModel.dependency_type.in_(["blocks", "parent_child"])
+    graph: dict[str, list[str]] = defaultdict(list)
+    outside: set[str] = set()
+    result = await session.stream(query)
+    async for task_id, depends_on_id, target_project_id in result:
+        graph[task_id].append(depends_on_id)
+        if target_project_id != project_id:
+            outside.add(depends_on_id)
+    own = set(graph)
+
+    # Follow edges leaving the project; a cycle may come back through them
+    visited: set[str] = set()
+    while outside:
+        visited |= outside
+        result = await session.execute(
+            select(DependencyModel.task_id, DependencyModel.depends_on_id, TaskModel.project_id)
+            .join(TaskModel, TaskModel.id == DependencyModel.depends_on_id)
+            .where(DependencyModel.task_id.in_(outside))
+            .where(DependencyModel.dependency_type.in_(blocking))
         )
-    )
-    edges = [(row[0], row[1]) for row in deps_result.fetchall()]
-
-    # Build adjacency list
-    graph: dict[str, list[str]] = {t: [] for t in all_tasks}
-    for task_id, depends_on_id in edges:
-        if task_id in graph:
+        outside = set()
+        for task_id, depends_on_id, target_project_id in result:
             graph[task_id].append(depends_on_id)
+            if target_project_id != project_id and depends_on_id not in visited:
+                outside.add(depends_on_id)
 
-    # Tarjan's SCC algorithm
-    index_counter = [0]
-    stack: list[str] = []
-    lowlinks: dict[str, int] = {}
+    return [cycle for cycle in _strongly_connected_cycles(graph) if not own.isdisjoint(cycle)]
+
+
+async def detect_cycles_in_catalogue(
+    session_factory: async_sessionmaker[AsyncSession],
+    max_concurrency: int = 4,
+) -> dict[str, list[list[str]]]:
+    """
+    Validate every project in the catalogue for dependency cycles.
+
+    Projects are checked concurrently, each in its own session, with at most
+    ``max_concurrency`` checks in flight. A cycle through several projects
+    is reported under each of them (see detect_cycles).
+
+    Args:
+        session_factory: Factory used to open one session per project check
+        max_concurrency: Maximum number of projects checked at the same time
+
+    Returns:
+        Mapping of project ID to its cycles (only projects that have cycles)
+    """
+    async with session_factory() as session:
+        result = await session.execute(
+            select(TaskModel.id).where(TaskModel.task_type == "project").order_by(TaskModel.id)
+        )
+        project_ids = list(result.scalars().all())
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def check(project_id: str) -> list[list[str]]:
+        async with semaphore, session_factory() as session:
+            return await detect_cycles(session, project_id)
+
+    cycles = await asyncio.gather(*(check(project_id) for project_id in project_ids))
+
+    return {project_id: found for project_id, found in zip(project_ids, cycles) if found}
+
+
+def _find_path(graph: dict[str, list[str]], start: str, target: str) -> list[str] | None:
+    """
+    Find a path from start to target in an adjacency list (iterative DFS).
+
+    Returns:
+        Node IDs from start to target inclusive, or None if unreachable
+    """
+    if start == target:
+        return [start]
+
+    previous: dict[str, str] = {}
+    visited = {start}
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        for neighbour in graph.get(node, ()):
+            if neighbour in visited:
+                continue
+            previous[neighbour] = node
+            if neighbour == target:
+                path = [target]
+                while path[-1] != start:
+                    path.append(previous[path[-1]])
+                return path[::-1]
+            visited.add(neighbour)
+            stack.append(neighbour)
+
+    return None
+
+
+def _strongly_connected_cycles(graph: dict[str, list[str]]) -> list[list[str]]:
+    """
+    Iterative Tarjan SCC over an adjacency list.
+
+    Uses an explicit work stack so arbitrarily deep dependency chains do not
+    hit Python's recursion limit.
+
+    Returns:
+        Strongly connected components with more than one node
+    """
+    counter = 0
     index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    stack: list[str] = []
     on_stack: set[str] = set()
     sccs: list[list[str]] = []
 
-    def strongconnect(node: str) -> None:
-        index[node] = index_counter[0]
-        lowlinks[node] = index_counter[0]
-        index_counter[0] += 1
-        stack.append(node)
-        on_stack.add(node)
-
-        for neighbor in graph.get(node, []):
-            if neighbor not in index:
-                strongconnect(neighbor)
-                lowlinks[node] = min(lowlinks[node], lowlinks[neighbor])
-            elif neighbor in on_stack:
-                lowlinks[node] = min(lowlinks[node], index[neighbor])
-
-        if lowlinks[node] == index[node]:
-            scc = []
-            while True:
-                w = stack.pop()
-                on_stack.remove(w)
-                scc.append(w)
-                if w == node:
+    for root in list(graph):
+        if root in index:
+            continue
+
+        # Each frame is (node, iterator over its neighbours)
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+
+        while work:
+            node, neighbours = work[-1]
+            for neighbour in neighbours:
+                if neighbour not in index:
+                    index[neighbour] = lowlink[neighbour] = counter
+                    counter += 1
+                    stack.append(neighbour)
+                    on_stack.add(neighbour)
+                    work.append((neighbour, iter(graph.get(neighbour, ()))))
                     break
-            if len(scc) > 1:  # Only cycles have > 1 node
-                sccs.append(scc)
-
-    for node in all_tasks:
-        if node not in index:
-            strongconnect(node)
+                if neighbour in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbour])
+            else:
+                # All neighbours visited: pop the frame
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    scc = []
+                    while True:
+                        w = stack.pop()
+                        on_stack.remove(w)
+                        scc.append(w)
+                        if w == node:
+                            break
+                    if len(scc) > 1:  # Only cycles have > 1 node
+                        sccs.append(scc)
 
     return sccs
@@ -9,9 +9,8 @@ import json
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ltt.models import DependencyType, TaskType
-from ltt.services.dependency_service import get_dependencies
-from ltt.services.learning import get_objectives
-from ltt.services.task_service import get_children, get_task
+from ltt.services.project_snapshot import ProjectSnapshot, TaskRecord, load_project_snapshot
+from ltt.services.task_service import TaskNotFoundError, get_task
 
 
 async def export_project(session: AsyncSession, project_id: str, format: str = "json") -> str:
@@ -30,8 +29,11 @@ async def export_project(session: AsyncSession, project_id: str, format: str = "
         ValueError: If format is unknown
         TaskNotFoundError: If project doesn't exist
     """
-    project = await get_task(session, project_id)
-    objectives = await get_objectives(session, project_id)
+    snapshot = await load_project_snapshot(session, project_id)
+    project = snapshot.project
+    if project is None:
+        raise TaskNotFoundError(f"Task {project_id} not found")
+    objectives = snapshot.objectives_of(project_id)
 
     data = {
         "title": project.title,
@@ -61,10 +63,8 @@ async def export_project(session: AsyncSession, project_id: str, format: str = "
             data[key] = value
 
     # Get epics (direct children)
-    children = await get_children(session, project_id)
-    for child in children:
-        child_data = await export_task_tree(session, child.id)
-        data["epics"].append(child_data)
+    for child in snapshot.children_of(project_id):
+        data["epics"].append(_export_record(snapshot, child))
 
     if format == "json":
         return json.dumps(data, indent=2)
@@ -89,10 +89,21 @@ async def export_task_tree(session: AsyncSession, task_id: str) -> dict:
 
     Returns:
         Nested dict structure
+
+    Raises:
+        TaskNotFoundError: If task doesn't exist
     """
     task = await get_task(session, task_id)
-    objectives = await get_objectives(session, task_id)
-    dependencies = await get_dependencies(session, task_id)
+    snapshot = await load_project_snapshot(session, task.project_id)
+    record = snapshot.get(task_id)
+    if record is None:
+        raise TaskNotFoundError(f"Task {task_id} not found")
+    return _export_record(snapshot, record)
+
+
+def _export_record(snapshot: ProjectSnapshot, task: TaskRecord) -> dict:
+    """Serialize one snapshot record and its subtree (no database access)."""
+    objectives = snapshot.objectives_of(task.id)
 
     # Build base data
     data = {
@@ -120,27 +131,27 @@ async def export_task_tree(session: AsyncSession, task_id: str) -> dict:
     # max_grade on tasks
     if task.max_grade is not None:
         optional_fields["max_grade"] = task.max_grade
+    # Automated result checks on exercises
+    if task.checks:
+        optional_fields["checks"] = task.checks
 
     data.update(optional_fields)
 
     # Add dependencies (export as titles for readability)
     # Note: We only export blocking dependencies, not parent_child (implicit in hierarchy)
-    dep_titles = []
-    for dep in dependencies:
-        if dep.dependency_type == DependencyType.BLOCKS:
-            dep_task = await get_task(session, dep.depends_on_id)
-            dep_titles.append(dep_task.title)
+    dep_titles = [
+        dep.depends_on_title
+        for dep in snapshot.dependencies_of(task.id)
+        if dep.dependency_type == DependencyType.BLOCKS
+    ]
     if dep_titles:
         data["dependencies"] = dep_titles
 
     # Get children recursively
-    children = await get_children(session, task_id)
+    children = snapshot.children_of(task.id)
     if children:
         # Determine child key based on task type
         child_key = "tasks" if task.task_type == TaskType.EPIC else "subtasks"
-        data[child_key] = []
-        for child in children:
-            child_data = await export_task_tree(session, child.id)
-            data[child_key].append(child_data)
+        data[child_key] = [_export_record(snapshot, child) for child in children]
 
     return data
@@ -13,13 +13,21 @@ from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ltt.models import BloomLevel, DependencyType, TaskCreate, TaskType, WorkspaceType
-from ltt.services.dependency_service import add_dependency
+from ltt.services.dependency_service import add_dependencies_bulk
 from ltt.services.learning import attach_objective
 from ltt.services.learning.llm_summarization import (
     generate_epic_summary,
     generate_task_summary,
 )
-from ltt.services.task_service import create_task, get_project_by_slug, update_task_summary
+from ltt.services.progress_rollup import refresh_project_rollups
+from ltt.services.project_graph import invalidate_project_graph
+from ltt.services.project_snapshot import invalidate_project_snapshot
+from ltt.services.task_service import (
+    backfill_task_closure,
+    create_task,
+    get_project_by_slug,
+    update_task_summary,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -165,6 +173,8 @@ async def ingest_project_data(
             tutor_config=data.get("tutor_config"),
             project_slug=data.get("project_id"),
         ),
+        update_closure=False,
+        refresh_rollups=False,
     )
 
     # Add project objectives
@@ -175,11 +185,13 @@ async def ingest_project_data(
             task_id=project.id,
             description=obj["description"],
             level=BloomLevel(obj.get("level", "apply")),
+            refresh_rollups=False,
         )
         obj_count += 1
 
-    # Track tasks by title for dependency resolution
+    # Track tasks by title for dependency resolution; edges are inserted in bulk at the end
     dependency_map: dict[str, str] = {data["title"]: project.id}
+    dependency_edges: list[tuple[str, str]] = []
 
     # Process epics (sequentially to maintain dependency order)
     task_count = 1  # Count project itself
@@ -190,12 +202,26 @@ async def ingest_project_data(
             parent_id=project.id,
             project_id=project.id,
             dependency_map=dependency_map,
+            dependency_edges=dependency_edges,
             project_ctx=project_ctx,
             use_llm_summaries=use_llm_summaries,
         )
         task_count += epic_count
         obj_count += epic_obj_count
 
+    # Hierarchy index for the whole project in one statement
+    await backfill_task_closure(session, project.id)
+
+    # Validate and insert all dependencies in one batch
+    await add_dependencies_bulk(session, dependency_edges, DependencyType.BLOCKS)
+
+    # Learner rollups for the project's final task and objective counts
+    await refresh_project_rollups(session, project.id)
+    await session.commit()
+
+    invalidate_project_graph(project.id)
+    invalidate_project_snapshot(project.id)
+
     return IngestResult(
         project_id=project.id, task_count=task_count, objective_count=obj_count, errors=[]
     )
@@ -238,6 +264,7 @@ async def ingest_epic(
     parent_id: str,
     project_id: str,
     dependency_map: dict[str, str],
+    dependency_edges: list[tuple[str, str]],
     project_ctx: ProjectContext,
     use_llm_summaries: bool = True,
 ) -> tuple[int, int]:
@@ -250,6 +277,7 @@ async def ingest_epic(
         parent_id: Parent task ID
         project_id: Root project ID
         dependency_map: Title -> ID mapping for dependency resolution
+        dependency_edges: Collected (task_id, depends_on_id) pairs to insert
         project_ctx: Project context for summarization
         use_llm_summaries: Whether to use LLM for summary generation
 
@@ -276,15 +304,17 @@ async def ingest_epic(
             estimated_minutes=data.get("estimated_minutes"),
             priority=data.get("priority", 2),
         ),
+        update_closure=False,
+        refresh_rollups=False,
     )
 
     # Track for dependency resolution
     dependency_map[data["title"]] = epic.id
 
-    # Add dependencies (by title reference) - same as tasks
+    # Collect dependencies (by title reference) - same as tasks
     for dep_title in data.get("dependencies", []):
         if dep_title in dependency_map:
-            await add_dependency(session, epic.id, dependency_map[dep_title], DependencyType.BLOCKS)
+            dependency_edges.append((epic.id, dependency_map[dep_title]))
 
     # Add objectives
     obj_count = 0
@@ -294,6 +324,7 @@ async def ingest_epic(
             task_id=epic.id,
             description=obj["description"],
             level=BloomLevel(obj.get("level", "apply")),
+            refresh_rollups=False,
         )
         obj_count += 1
 
@@ -310,6 +341,7 @@ async def ingest_epic(
             parent_id=epic.id,
             project_id=project_id,
             dependency_map=dependency_map,
+            dependency_edges=dependency_edges,
             project_ctx=project_ctx,
             epic_ctx=epic_ctx,
             use_llm_summaries=use_llm_summaries,
@@ -365,6 +397,7 @@ async def ingest_task(
     parent_id: str,
     project_id: str,
     dependency_map: dict[str, str],
+    dependency_edges: list[tuple[str, str]],
     project_ctx: ProjectContext,
     epic_ctx: EpicContext,
     use_llm_summaries: bool = True,
@@ -378,6 +411,7 @@ async def ingest_task(
         parent_id: Parent task ID
         project_id: Root project ID
         dependency_map: Title -> ID mapping for dependency resolution
+        dependency_edges: Collected (task_id, depends_on_id) pairs to insert
         project_ctx: Project context for summarization
         epic_ctx: Epic context for summarization
         use_llm_summaries: Whether to use LLM for summary generation
@@ -406,7 +440,10 @@ async def ingest_task(
             estimated_minutes=data.get("estimated_minutes"),
             subtask_type=data.get("subtask_type", "exercise"),
             max_grade=data.get("max_grade"),
+            checks=data.get("checks"),
         ),
+        update_closure=False,
+        refresh_rollups=False,
     )
 
     # Track for dependency resolution
@@ -420,13 +457,14 @@ async def ingest_task(
             task_id=task.id,
             description=obj["description"],
             level=BloomLevel(obj.get("level", "apply")),
+            refresh_rollups=False,
         )
         obj_count += 1
 
-    # Add dependencies (by title reference)
+    # Collect dependencies (by title reference)
     for dep_title in data.get("dependencies", []):
         if dep_title in dependency_map:
-            await add_dependency(session, task.id, dependency_map[dep_title], DependencyType.BLOCKS)
+            dependency_edges.append((task.id, dependency_map[dep_title]))
 
     # Process subtasks recursively
     task_count = 1
@@ -439,6 +477,7 @@ async def ingest_task(
             parent_id=task.id,
             project_id=project_id,
             dependency_map=dependency_map,
+            dependency_edges=dependency_edges,
             project_ctx=project_ctx,
             epic_ctx=epic_ctx,
             use_llm_summaries=use_llm_summaries,
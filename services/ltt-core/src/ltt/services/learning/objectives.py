@@ -14,6 +14,8 @@ from ltt.models import (
     ObjectiveTaxonomy,
     TaskModel,
 )
+from ltt.services.progress_rollup import refresh_project_rollups
+from ltt.services.project_snapshot import invalidate_project_snapshot
 from ltt.services.task_service import get_ancestors, get_children
 from ltt.utils.ids import PREFIX_OBJECTIVE, generate_entity_id
 
@@ -45,6 +47,7 @@ async def attach_objective(
     description: str,
     level: BloomLevel,
     taxonomy: ObjectiveTaxonomy = ObjectiveTaxonomy.BLOOM,
+    refresh_rollups: bool = True,
 ) -> LearningObjective:
     """
     Attach a learning objective to a task.
@@ -55,6 +58,8 @@ async def attach_objective(
         description: What the learner should achieve
         level: Bloom's taxonomy level
         taxonomy: Which taxonomy (default: bloom)
+        refresh_rollups: Recompute the project's learner rollups now. Bulk
+            loaders pass False and call refresh_project_rollups once at the end.
 
     Returns:
         Created learning objective
@@ -79,10 +84,15 @@ async def attach_objective(
         description=description,
     )
     session.add(objective)
+    await session.flush()
+    if refresh_rollups:
+        await refresh_project_rollups(session, task.project_id)
 
     await session.commit()
     await session.refresh(objective)
 
+    invalidate_project_snapshot(task.project_id)
+
     return LearningObjective.model_validate(objective)
 
 
@@ -173,5 +183,12 @@ async def remove_objective(
     if not objective:
         raise LearningObjectiveNotFoundError(f"Learning objective {objective_id} does not exist")
 
+    task = await session.get(TaskModel, objective.task_id)
     await session.delete(objective)
+    if task:
+        await session.flush()
+        await refresh_project_rollups(session, task.project_id)
     await session.commit()
+
+    if task:
+        invalidate_project_snapshot(task.project_id)
@@ -8,6 +8,7 @@ from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ltt.models import BloomLevel, LearnerProgress, TaskModel
+from ltt.services.progress_rollup import compute_rollup, get_rollup
 
 # ============================================================================
 # Progress Calculation
@@ -22,9 +23,10 @@ async def get_progress(
     """
     Get comprehensive progress for a learner in a project.
 
-    Per ADR-001: Task status is per-learner, so we query learner_task_progress,
-    not tasks.status. Uses COALESCE to default to 'open' for tasks without
-    a progress record yet (lazy initialization).
+    Per ADR-001: Task status is per-learner. Counts come from the learner's
+    learner_project_rollup row (one primary-key read), which status
+    transitions and passing validations keep current. A learner who has not
+    touched the project yet has no row; their counts are computed read-only.
 
     Args:
         session: Database session
@@ -34,52 +36,30 @@ async def get_progress(
     Returns:
         Comprehensive progress metrics
     """
-    # Verify project exists
-    project_result = await session.execute(select(TaskModel).where(TaskModel.id == project_id))
-    project = project_result.scalar_one_or_none()
-
-    if not project:
-        raise ValueError(f"Project {project_id} does not exist")
-
-    # Task counts - join with learner_task_progress for per-learner status
-    task_stats = await session.execute(
-        text("""
-        SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN COALESCE(ltp.status, 'open') = 'closed' THEN 1 ELSE 0 END) as completed,
-            SUM(CASE WHEN COALESCE(ltp.status, 'open') = 'in_progress' THEN 1 ELSE 0 END) as in_progress,
-            SUM(CASE WHEN COALESCE(ltp.status, 'open') = 'blocked' THEN 1 ELSE 0 END) as blocked
-        FROM tasks t
-        LEFT JOIN learner_task_progress ltp
-            ON ltp.task_id = t.id AND ltp.learner_id = :learner_id
-        WHERE t.project_id = :project_id
-          AND t.task_type IN ('task', 'subtask')
-    """),
-        {"project_id": project_id, "learner_id": learner_id},
-    )
-    stats = task_stats.fetchone()
-
-    # Objective counts
-    # Achievement is based on passing validations
-    obj_stats = await session.execute(
-        text("""
-        SELECT
-            COUNT(DISTINCT lo.id) as total,
-            COUNT(DISTINCT CASE WHEN v.passed = true THEN lo.id END) as achieved
-        FROM learning_objectives lo
-        JOIN tasks t ON lo.task_id = t.id
-        LEFT JOIN submissions s
-            ON s.task_id = t.id AND s.learner_id = :learner_id
-        LEFT JOIN validations v
-            ON v.submission_id = s.id AND v.passed = true
-        WHERE t.project_id = :project_id
-    """),
-        {"project_id": project_id, "learner_id": learner_id},
-    )
-    obj_result = obj_stats.fetchone()
-
-    total_tasks = stats.total or 0
-    completed_tasks = stats.completed or 0
+    rollup = await get_rollup(session, learner_id, project_id)
+
+    if rollup:
+        total_tasks = rollup.total_tasks
+        completed_tasks = rollup.completed_tasks
+        in_progress_tasks = rollup.in_progress_tasks
+        blocked_tasks = rollup.blocked_tasks
+        total_objectives = rollup.total_objectives
+        objectives_achieved = rollup.objectives_achieved
+    else:
+        # Verify project exists
+        project_result = await session.execute(
+            select(TaskModel.id).where(TaskModel.id == project_id)
+        )
+        if project_result.scalar_one_or_none() is None:
+            raise ValueError(f"Project {project_id} does not exist")
+
+        stats = await compute_rollup(session, learner_id, project_id)
+        total_tasks = stats.total
+        completed_tasks = stats.completed
+        in_progress_tasks = stats.in_progress
+        blocked_tasks = stats.blocked
+        total_objectives = stats.total_objectives
+        objectives_achieved = stats.objectives_achieved
 
     # Calculate completion percentage
     completion_percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
@@ -89,11 +69,11 @@ async def get_progress(
         project_id=project_id,
         total_tasks=total_tasks,
         completed_tasks=completed_tasks,
-        in_progress_tasks=stats.in_progress or 0,
-        blocked_tasks=stats.blocked or 0,
+        in_progress_tasks=in_progress_tasks,
+        blocked_tasks=blocked_tasks,
         completion_percentage=completion_percentage,
-        total_objectives=obj_result.total or 0,
-        objectives_achieved=obj_result.achieved or 0,
+        total_objectives=total_objectives,
+        objectives_achieved=objectives_achieved,
         total_time_spent_minutes=None,  # Future: calculate from timestamps
     )
 
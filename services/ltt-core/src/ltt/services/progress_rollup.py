@@ -0,0 +1,334 @@
+"""
+Per-learner project progress rollups for the Learning Task Tracker.
+
+learner_project_rollup holds, per (learner, project), the task counts by
+status and the number of achieved objectives. Writers keep it current in
+the same transaction as the change:
+
+- status transitions (progress_service) apply count deltas
+- passing validations (validation_service) add the task's objectives the
+  first time the learner passes it, as marked by
+  ``learner_task_progress.first_passed_at``
+- template changes (task_service, objectives) recompute the project's rows
+
+A learner's row is built from the full aggregate the first time one of
+their changes touches the project, so progress reads are a primary-key
+lookup. ``rebuild_rollups`` recomputes rows from scratch to repair drift.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ltt.models import LearnerProjectRollupModel, TaskStatus
+from ltt.utils.ids import PREFIX_LEARNER_TASK_PROGRESS, generate_entity_id
+
+# Task types counted in a project's task totals
+COUNTED_TASK_TYPES = ("task", "subtask")
+
+# Status columns that hold a count (open tasks are total minus the rest)
+_STATUS_COLUMNS = {
+    TaskStatus.CLOSED.value: "completed",
+    TaskStatus.IN_PROGRESS.value: "in_progress",
+    TaskStatus.BLOCKED.value: "blocked",
+}
+
+
+async def get_rollup(
+    session: AsyncSession, learner_id: str, project_id: str
+) -> LearnerProjectRollupModel | None:
+    """
+    Read a learner's rollup row for a project.
+
+    Args:
+        session: Database session
+        learner_id: Learner ID
+        project_id: Project ID
+
+    Returns:
+        Rollup row, or None if none of the learner's changes touched the project yet
+    """
+    result = await session.execute(
+        select(LearnerProjectRollupModel)
+        .where(
+            LearnerProjectRollupModel.learner_id == learner_id,
+            LearnerProjectRollupModel.project_id == project_id,
+        )
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+async def compute_rollup(session: AsyncSession, learner_id: str, project_id: str) -> Row:
+    """
+    Compute a learner's rollup from the progress tables without storing it.
+
+    Args:
+        session: Database session
+        learner_id: Learner ID
+        project_id: Project ID
+
+    Returns:
+        Row with total, completed, in_progress, blocked, total_objectives and
+        objectives_achieved
+    """
+    result = await session.execute(
+        text(_ROLLUP_SELECT.format(targets=_SINGLE_TARGET)),
+        {"learner_id": learner_id, "project_id": project_id},
+    )
+    return result.one()
+
+
+async def apply_status_changes(
+    session: AsyncSession,
+    learner_id: str,
+    project_id: str,
+    changes: Iterable[tuple[str, str]],
+) -> None:
+    """
+    Apply status transitions of counted tasks to the learner's rollup.
+
+    Call after the transitions are written and before the commit.
+
+    Args:
+        session: Database session
+        learner_id: Learner ID
+        project_id: Project the tasks belong to
+        changes: (old_status, new_status) pairs, one per task
+    """
+    delta: Counter[str] = Counter()
+    for old_status, new_status in changes:
+        delta[old_status] -= 1
+        delta[new_status] += 1
+
+    params = {column: delta[status] for status, column in _STATUS_COLUMNS.items()}
+    if not any(params.values()):
+        return
+
+    params.update(learner_id=learner_id, project_id=project_id)
+    await _apply_or_build(session, _STATUS_DELTA_SQL, params)
+
+
+async def apply_passing_validation(
+    session: AsyncSession,
+    learner_id: str,
+    project_id: str,
+    task_id: str,
+) -> None:
+    """
+    Count a task's objectives as achieved after the learner's first pass.
+
+    Call after the passing validation is flushed and before the commit. The
+    first pass is claimed by setting ``first_passed_at`` on the learner's
+    progress row; concurrent first passes serialize on that row and only
+    the one that sets it adds the objectives.
+
+    Args:
+        session: Database session
+        learner_id: Learner ID
+        project_id: Project the task belongs to
+        task_id: Validated task
+    """
+    result = await session.execute(
+        _FIRST_PASS_SQL,
+        {
+            "id": generate_entity_id(PREFIX_LEARNER_TASK_PROGRESS),
+            "learner_id": learner_id,
+            "task_id": task_id,
+        },
+    )
+    if result.first() is None:
+        # Passed before
+        return
+
+    await _apply_or_build(
+        session,
+        _OBJECTIVES_DELTA_SQL,
+        {"learner_id": learner_id, "project_id": project_id, "task_id": task_id},
+    )
+
+
+async def refresh_project_rollups(session: AsyncSession, project_id: str) -> None:
+    """
+    Recompute every existing rollup of a project after a template change.
+
+    Call before committing the change.
+
+    Args:
+        session: Database session
+        project_id: Project whose tasks or objectives changed
+    """
+    await session.execute(
+        text(_ROLLUP_UPSERT.format(targets=_PROJECT_TARGETS)), {"project_id": project_id}
+    )
+
+
+async def rebuild_rollups(session: AsyncSession, project_id: str | None = None) -> int:
+    """
+    Rebuild rollups from the progress tables, repairing any drift.
+
+    Covers every learner with progress, submissions or an existing rollup in
+    the project(s). Does not commit.
+
+    Args:
+        session: Database session
+        project_id: Project to rebuild (None = all projects)
+
+    Returns:
+        Number of rollup rows written
+    """
+    result = await session.execute(
+        text(_ROLLUP_UPSERT.format(targets=_ACTIVE_TARGETS)), {"project_id": project_id}
+    )
+    return result.rowcount
+
+
+async def _apply_or_build(session: AsyncSession, delta_sql, params: dict) -> None:
+    """Run a delta UPDATE, building the learner's row first if it is missing."""
+    result = await session.execute(delta_sql, params)
+    if result.rowcount:
+        return
+
+    built = await session.execute(
+        _BUILD_ONE_SQL, {"learner_id": params["learner_id"], "project_id": params["project_id"]}
+    )
+    if built.first() is None:
+        # Built concurrently by a transaction that could not see this change
+        await session.execute(delta_sql, params)
+
+
+# Aggregates one rollup per (learner_id, project_id) produced by {targets}
+_ROLLUP_SELECT = """
+    SELECT
+        target.learner_id,
+        target.project_id,
+        task_counts.total,
+        task_counts.completed,
+        task_counts.in_progress,
+        task_counts.blocked,
+        objective_counts.total AS total_objectives,
+        objective_counts.achieved AS objectives_achieved
+    FROM ({targets}) target
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE ltp.status = 'closed') AS completed,
+            COUNT(*) FILTER (WHERE ltp.status = 'in_progress') AS in_progress,
+            COUNT(*) FILTER (WHERE ltp.status = 'blocked') AS blocked
+        FROM tasks t
+        LEFT JOIN learner_task_progress ltp
+            ON ltp.task_id = t.id AND ltp.learner_id = target.learner_id
+        WHERE t.project_id = target.project_id
+          AND t.task_type IN ('task', 'subtask')
+    ) task_counts
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (
+                WHERE EXISTS (
+                    SELECT 1
+                    FROM submissions s
+                    JOIN validations v ON v.submission_id = s.id
+                    WHERE s.task_id = lo.task_id
+                      AND s.learner_id = target.learner_id
+                      AND v.passed = true
+                )
+            ) AS achieved
+        FROM learning_objectives lo
+        JOIN tasks t ON t.id = lo.task_id
+        WHERE t.project_id = target.project_id
+    ) objective_counts
+"""
+
+_ROLLUP_INSERT = (
+    """
+    INSERT INTO learner_project_rollup (
+        learner_id, project_id, total_tasks, completed_tasks, in_progress_tasks,
+        blocked_tasks, total_objectives, objectives_achieved, created_at, updated_at
+    )
+    SELECT
+        learner_id, project_id, total, completed, in_progress,
+        blocked, total_objectives, objectives_achieved, now(), now()
+    FROM ("""
+    + _ROLLUP_SELECT
+    + """) rollup
+"""
+)
+
+_ROLLUP_UPSERT = (
+    _ROLLUP_INSERT
+    + """
+    ON CONFLICT (learner_id, project_id) DO UPDATE SET
+        total_tasks = EXCLUDED.total_tasks,
+        completed_tasks = EXCLUDED.completed_tasks,
+        in_progress_tasks = EXCLUDED.in_progress_tasks,
+        blocked_tasks = EXCLUDED.blocked_tasks,
+        total_objectives = EXCLUDED.total_objectives,
+        objectives_achieved = EXCLUDED.objectives_achieved,
+        updated_at = now()
+"""
+)
+
+_SINGLE_TARGET = """
+    SELECT CAST(:learner_id AS VARCHAR) AS learner_id, CAST(:project_id AS VARCHAR) AS project_id
+"""
+
+_PROJECT_TARGETS = """
+    SELECT learner_id, project_id FROM learner_project_rollup WHERE project_id = :project_id
+"""
+
+_ACTIVE_TARGETS = """
+    SELECT ltp.learner_id, t.project_id
+    FROM learner_task_progress ltp
+    JOIN tasks t ON t.id = ltp.task_id
+    WHERE CAST(:project_id AS VARCHAR) IS NULL OR t.project_id = :project_id
+    UNION
+    SELECT s.learner_id, t.project_id
+    FROM submissions s
+    JOIN tasks t ON t.id = s.task_id
+    WHERE CAST(:project_id AS VARCHAR) IS NULL OR t.project_id = :project_id
+    UNION
+    SELECT learner_id, project_id
+    FROM learner_project_rollup
+    WHERE CAST(:project_id AS VARCHAR) IS NULL OR project_id = :project_id
+"""
+
+_BUILD_ONE_SQL = text(
+    _ROLLUP_INSERT.format(targets=_SINGLE_TARGET)
+    + """
+    ON CONFLICT (learner_id, project_id) DO NOTHING
+    RETURNING learner_id
+"""
+)
+
+_STATUS_DELTA_SQL = text("""
+    UPDATE learner_project_rollup
+    SET completed_tasks = completed_tasks + :completed,
+        in_progress_tasks = in_progress_tasks + :in_progress,
+        blocked_tasks = blocked_tasks + :blocked,
+        updated_at = now()
+    WHERE learner_id = :learner_id AND project_id = :project_id
+""")
+
+# Marks the learner's first pass of a task; returns a row only for that one
+_FIRST_PASS_SQL = text("""
+    INSERT INTO learner_task_progress (
+        id, task_id, learner_id, status, attempt_count, first_passed_at, created_at, updated_at
+    )
+    VALUES (:id, :task_id, :learner_id, 'open', 0, now(), now(), now())
+    ON CONFLICT (task_id, learner_id) DO UPDATE SET first_passed_at = now()
+    WHERE learner_task_progress.first_passed_at IS NULL
+    RETURNING id
+""")
+
+# Adds the task's objective count (only applied on the first pass)
+_OBJECTIVES_DELTA_SQL = text("""
+    UPDATE learner_project_rollup
+    SET objectives_achieved = objectives_achieved
+            + (SELECT COUNT(*) FROM learning_objectives WHERE task_id = :task_id),
+        updated_at = now()
+    WHERE learner_id = :learner_id AND project_id = :project_id
+""")
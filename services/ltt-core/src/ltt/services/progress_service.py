@@ -5,9 +5,10 @@ Handles learner-specific task progress and status transitions.
 Works with the INSTANCE LAYER (learner_task_progress table).
 """
 
-from datetime import datetime
+from collections.abc import Iterable
 
-from sqlalchemy import select
+from sqlalchemy import func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ltt.models import (
@@ -16,6 +17,8 @@ from ltt.models import (
     TaskModel,
     TaskStatus,
 )
+from ltt.services.progress_rollup import COUNTED_TASK_TYPES, apply_status_changes
+from ltt.services.ready_set import advance_progress_revision, record_status_change
 from ltt.utils.ids import PREFIX_LEARNER_TASK_PROGRESS, generate_entity_id
 
 # Valid status transitions
@@ -43,6 +46,55 @@ class TaskNotFoundError(Exception):
     pass
 
 
+async def get_statuses(
+    session: AsyncSession, learner_id: str, task_ids: Iterable[str]
+) -> dict[str, TaskStatus]:
+    """
+    Get a learner's status for many tasks in one read-only query.
+
+    Tasks without a progress record are reported as open (ADR-001); no rows
+    are created. Use this on read paths instead of get_or_create_progress.
+
+    Args:
+        session: Database session
+        learner_id: Learner ID
+        task_ids: Task IDs to look up
+
+    Returns:
+        Mapping of every requested task ID to its status
+    """
+    statuses = dict.fromkeys(task_ids, TaskStatus.OPEN)
+    if not statuses:
+        return statuses
+
+    result = await session.execute(
+        select(LearnerTaskProgressModel.task_id, LearnerTaskProgressModel.status).where(
+            LearnerTaskProgressModel.learner_id == learner_id,
+            LearnerTaskProgressModel.task_id.in_(list(statuses)),
+        )
+    )
+    for task_id, status in result.all():
+        statuses[task_id] = TaskStatus(status)
+
+    return statuses
+
+
+async def get_status(session: AsyncSession, task_id: str, learner_id: str) -> TaskStatus:
+    """
+    Get a learner's status for one task without creating a progress record.
+
+    Args:
+        session: Database session
+        task_id: Task ID
+        learner_id: Learner ID
+
+    Returns:
+        Current status ('open' if the learner has no record yet)
+    """
+    statuses = await get_statuses(session, learner_id, [task_id])
+    return statuses[task_id]
+
+
 async def get_or_create_progress(
     session: AsyncSession, task_id: str, learner_id: str
 ) -> LearnerTaskProgressModel:
@@ -50,6 +102,7 @@ async def get_or_create_progress(
     Get or create progress record for a learner on a task.
 
     Implements lazy initialization: if no record exists, create one with status='open'.
+    Only for write paths - read paths should use get_statuses/get_status.
 
     Args:
         session: Database session
@@ -100,10 +153,12 @@ async def get_progress(
         Progress record or None if it doesn't exist
     """
     result = await session.execute(
-        select(LearnerTaskProgressModel).where(
+        select(LearnerTaskProgressModel)
+        .where(
             LearnerTaskProgressModel.task_id == task_id,
             LearnerTaskProgressModel.learner_id == learner_id,
         )
+        .execution_options(populate_existing=True)
     )
     progress = result.scalar_one_or_none()
 
@@ -123,6 +178,13 @@ async def update_status(
     """
     Update the status of a task for a specific learner.
 
+    The transition costs two round-trips: one query reads the task, the
+    learner's current status and (when closing) the first unclosed child and
+    latest validation; one upsert applies the change only if the status is
+    still the one that was read (compare-and-set), so concurrent requests for
+    the same task cannot both apply conflicting transitions. The learner's
+    project rollup is adjusted in the same transaction.
+
     Args:
         session: Database session
         task_id: Task ID
@@ -137,14 +199,47 @@ async def update_status(
         TaskNotFoundError: If task does not exist
         InvalidStatusTransitionError: If transition is not allowed
     """
-    # Verify task exists
-    task = await session.get(TaskModel, task_id)
-    if not task:
+    progress = await apply_status(session, task_id, learner_id, new_status, close_reason)
+
+    await session.commit()
+
+    record_status_change(learner_id, task_id, new_status.value)
+
+    return LearnerTaskProgress.model_validate(progress)
+
+
+async def apply_status(
+    session: AsyncSession,
+    task_id: str,
+    learner_id: str,
+    new_status: TaskStatus,
+    close_reason: str | None = None,
+) -> LearnerTaskProgressModel:
+    """
+    Apply a status transition without committing (see update_status).
+
+    For callers that compose a transition into a larger transaction. After
+    committing they must call ``record_status_change`` for the task.
+
+    Returns:
+        Updated progress row
+
+    Raises:
+        TaskNotFoundError: If task does not exist
+        InvalidStatusTransitionError: If transition is not allowed
+    """
+    from ltt.services.validation_service import _get_requires_submission, close_requirement_error
+
+    closing = new_status == TaskStatus.CLOSED
+    result = await session.execute(
+        _TRANSITION_STATE_SQL,
+        {"task_id": task_id, "learner_id": learner_id, "closing": closing},
+    )
+    state = result.one_or_none()
+    if state is None:
         raise TaskNotFoundError(f"Task {task_id} not found")
 
-    # Get or create progress record
-    progress = await get_or_create_progress(session, task_id, learner_id)
-    current_status = TaskStatus(progress.status)
+    current_status = TaskStatus(state.status)
 
     # Validate transition
     if new_status not in VALID_TRANSITIONS.get(current_status, []):
@@ -153,45 +248,130 @@ async def update_status(
         )
 
     # Additional validation for closing
-    if new_status == TaskStatus.CLOSED:
+    if closing:
         # Check validation requirements (subtasks must have passing validation)
-        from ltt.services.validation_service import can_close_task as can_close_validation
-
-        can_close, reason = await can_close_validation(session, task_id, learner_id)
-        if not can_close:
+        reason = close_requirement_error(
+            _get_requires_submission(state), state.validation_passed, state.validation_error
+        )
+        if reason:
             raise InvalidStatusTransitionError(reason)
 
         # Check that all children are closed FOR THIS LEARNER
-        result = await session.execute(select(TaskModel).where(TaskModel.parent_id == task_id))
-        children = result.scalars().all()
+        if state.open_child_id is not None:
+            raise InvalidStatusTransitionError(
+                f"Cannot close task: child {state.open_child_id} is still {state.open_child_status}"
+            )
+
+    await advance_progress_revision(session, learner_id)
+    progress = await _apply_transition(
+        session, task_id, learner_id, current_status, new_status, close_reason
+    )
+    if progress is None:
+        # Another request changed the status between our read and write
+        progress = await _get_progress_model(session, task_id, learner_id)
+        if progress is None or progress.status != new_status.value:
+            raise InvalidStatusTransitionError(
+                f"Task {task_id} changed concurrently (expected status {current_status.value})"
+            )
+    elif state.task_type in COUNTED_TASK_TYPES:
+        await apply_status_changes(
+            session, learner_id, state.project_id, [(current_status.value, new_status.value)]
+        )
+
+    return progress
+
 
-        for child in children:
-            child_progress = await get_or_create_progress(session, child.id, learner_id)
-            if child_progress.status != TaskStatus.CLOSED.value:
-                raise InvalidStatusTransitionError(
-                    f"Cannot close task: child {child.id} is still {child_progress.status}"
-                )
+# Reads everything a transition needs in one round-trip. The child lookup
+# only runs when closing; the latest validation is kept on the progress row.
+_TRANSITION_STATE_SQL = text("""
+    SELECT
+        t.task_type,
+        t.project_id,
+        t.requires_submission,
+        COALESCE(p.status, 'open') AS status,
+        child.id AS open_child_id,
+        child.status AS open_child_status,
+        p.latest_validation_passed AS validation_passed,
+        p.latest_validation_error AS validation_error
+    FROM tasks t
+    LEFT JOIN learner_task_progress p
+        ON p.task_id = t.id AND p.learner_id = :learner_id
+    LEFT JOIN LATERAL (
+        SELECT c.id, COALESCE(cp.status, 'open') AS status
+        FROM tasks c
+        LEFT JOIN learner_task_progress cp
+            ON cp.task_id = c.id AND cp.learner_id = :learner_id
+        WHERE c.parent_id = t.id
+          AND COALESCE(cp.status, 'open') <> 'closed'
+        ORDER BY c.id
+        LIMIT 1
+    ) child ON CAST(:closing AS BOOLEAN)
+    WHERE t.id = :task_id
+""")
+
+
+async def _apply_transition(
+    session: AsyncSession,
+    task_id: str,
+    learner_id: str,
+    expected: TaskStatus,
+    new_status: TaskStatus,
+    close_reason: str | None,
+) -> LearnerTaskProgressModel | None:
+    """
+    Upsert the learner's progress row if its status is still ``expected``.
 
-    # Update status
-    progress.status = new_status.value
+    Returns the updated row, or None if the status changed concurrently.
+    Identity-map instances of the row are refreshed with the new values.
+    """
+    table = LearnerTaskProgressModel
+    changes: dict = {"status": new_status.value, "updated_at": func.now()}
+    inserted: dict = {"started_at": None, "completed_at": None, "close_reason": None}
 
     # Update timestamps based on status
-    if new_status == TaskStatus.IN_PROGRESS and not progress.started_at:
-        progress.started_at = datetime.utcnow()
+    if new_status == TaskStatus.IN_PROGRESS:
+        changes["started_at"] = func.coalesce(table.started_at, func.now())
+        inserted["started_at"] = func.now()
     elif new_status == TaskStatus.CLOSED:
-        progress.completed_at = datetime.utcnow()
-        progress.close_reason = close_reason
+        changes["completed_at"] = inserted["completed_at"] = func.now()
+        changes["close_reason"] = inserted["close_reason"] = close_reason
     elif new_status == TaskStatus.OPEN:
         # Reopening - clear completion timestamp
-        progress.completed_at = None
-        progress.close_reason = None
-
-    progress.updated_at = datetime.utcnow()
+        changes["completed_at"] = None
+        changes["close_reason"] = None
+
+    stmt = (
+        pg_insert(table)
+        .values(
+            id=generate_entity_id(PREFIX_LEARNER_TASK_PROGRESS),
+            task_id=task_id,
+            learner_id=learner_id,
+            status=new_status.value,
+            **inserted,
+        )
+        .on_conflict_do_update(
+            index_elements=[table.task_id, table.learner_id],
+            set_=changes,
+            where=table.status == expected.value,
+        )
+        .returning(table)
+    )
+    result = await session.scalars(stmt, execution_options={"populate_existing": True})
+    return result.one_or_none()
 
-    await session.commit()
-    await session.refresh(progress)
 
-    return LearnerTaskProgress.model_validate(progress)
+async def _get_progress_model(
+    session: AsyncSession, task_id: str, learner_id: str
+) -> LearnerTaskProgressModel | None:
+    result = await session.execute(
+        select(LearnerTaskProgressModel)
+        .where(
+            LearnerTaskProgressModel.task_id == task_id,
+            LearnerTaskProgressModel.learner_id == learner_id,
+        )
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
 
 
 async def start_task(session: AsyncSession, task_id: str, learner_id: str) -> LearnerTaskProgress:
@@ -250,11 +430,13 @@ async def try_auto_close_ancestors(
     """
     After a task closes, check if parent(s) can auto-close.
 
-    Climbs up the task hierarchy. For each parent:
-    1. Check if parent requires submission (if yes, stop)
-    2. Check if all children are closed (if no, stop)
-    3. Auto-close the parent
-    4. Continue to grandparent
+    An ancestor can auto-close when it is in progress, does not require a
+    submission, and all of its children are closed (counting the ancestors
+    below it that close in the same pass). One query over the task closure
+    finds the longest such prefix of the ancestor chain. It is then closed
+    bottom-up, each ancestor guarded on the status that was read; the climb
+    stops at the first one that changed concurrently, since every ancestor
+    above it now has an open child.
 
     Args:
         session: Database session
@@ -264,53 +446,115 @@ async def try_auto_close_ancestors(
     Returns:
         List of task IDs that were auto-closed (bottom-up order)
     """
-    from ltt.services.validation_service import _get_requires_submission
+    auto_closed = await apply_auto_close_ancestors(session, task_id, learner_id)
 
-    auto_closed = []
+    await session.commit()
 
-    # Get the task that just closed
-    task = await session.get(TaskModel, task_id)
-    if not task or not task.parent_id:
-        return auto_closed
+    for ancestor_id in auto_closed:
+        record_status_change(learner_id, ancestor_id, TaskStatus.CLOSED.value)
 
-    current_parent_id = task.parent_id
+    return auto_closed
 
-    while current_parent_id:
-        parent = await session.get(TaskModel, current_parent_id)
-        if not parent:
-            break
 
-        # Check if parent requires submission
-        if _get_requires_submission(parent):
-            break  # Parent needs explicit submission, stop climbing
+async def apply_auto_close_ancestors(
+    session: AsyncSession,
+    task_id: str,
+    learner_id: str,
+) -> list[str]:
+    """
+    Auto-close eligible ancestors without committing (see try_auto_close_ancestors).
+
+    After committing, callers must call ``record_status_change`` for each
+    returned task.
 
-        # Check if all children are closed
-        result = await session.execute(
-            select(TaskModel).where(TaskModel.parent_id == current_parent_id)
-        )
-        children = result.scalars().all()
-
-        all_closed = True
-        for child in children:
-            child_progress = await get_or_create_progress(session, child.id, learner_id)
-            if child_progress.status != TaskStatus.CLOSED.value:
-                all_closed = False
-                break
-
-        if not all_closed:
-            break  # Not all children closed, stop climbing
-
-        # Try to auto-close this parent
-        try:
-            await close_task(
-                session, current_parent_id, learner_id, "Auto-closed: all children complete"
+    Returns:
+        List of task IDs that were auto-closed (bottom-up order)
+    """
+    result = await session.execute(
+        _AUTO_CLOSE_CHAIN_SQL, {"task_id": task_id, "learner_id": learner_id}
+    )
+    chain = result.all()
+    if not chain:
+        return []
+
+    await advance_progress_revision(session, learner_id, len(chain))
+    table = LearnerTaskProgressModel
+    closed = []
+    for row in chain:
+        result = await session.scalars(
+            update(table)
+            .where(
+                table.learner_id == learner_id,
+                table.task_id == row.id,
+                table.status == TaskStatus.IN_PROGRESS.value,
             )
-            auto_closed.append(current_parent_id)
-            current_parent_id = parent.parent_id  # Continue climbing
-        except InvalidStatusTransitionError:
-            break  # Can't close, stop climbing
+            .values(
+                status=TaskStatus.CLOSED.value,
+                completed_at=func.now(),
+                close_reason="Auto-closed: all children complete",
+                updated_at=func.now(),
+            )
+            .returning(table.task_id),
+            execution_options={"synchronize_session": False, "populate_existing": True},
+        )
+        if result.first() is None:
+            # Changed concurrently: it stays open, so its ancestors must too
+            break
+        closed.append(row)
+
+    counted = [row for row in closed if row.task_type in COUNTED_TASK_TYPES]
+    if counted:
+        await apply_status_changes(
+            session,
+            learner_id,
+            counted[0].project_id,
+            [(TaskStatus.IN_PROGRESS.value, TaskStatus.CLOSED.value)] * len(counted),
+        )
 
-    return auto_closed
+    return [row.id for row in closed]
+
+
+# Ancestors of :task_id (nearest first) that can auto-close for the learner,
+# cut at the first one that can't. Only in_progress tasks may transition to
+# closed; children that are themselves in the chain are not counted as open.
+_AUTO_CLOSE_CHAIN_SQL = text("""
+    WITH chain AS (
+        SELECT
+            t.id,
+            t.task_type,
+            t.project_id,
+            tc.depth,
+            COALESCE(p.status, 'open') = 'in_progress'
+                AND NOT COALESCE(t.requires_submission, t.task_type = 'subtask')
+                AS can_close
+        FROM task_closure tc
+        JOIN tasks t ON t.id = tc.ancestor_id
+        LEFT JOIN learner_task_progress p
+            ON p.task_id = t.id AND p.learner_id = :learner_id
+        WHERE tc.descendant_id = :task_id AND tc.depth > 0
+    ),
+    eligible AS (
+        SELECT
+            a.id,
+            a.task_type,
+            a.project_id,
+            a.depth,
+            a.can_close AND NOT EXISTS (
+                SELECT 1
+                FROM tasks c
+                LEFT JOIN learner_task_progress cp
+                    ON cp.task_id = c.id AND cp.learner_id = :learner_id
+                WHERE c.parent_id = a.id
+                  AND COALESCE(cp.status, 'open') <> 'closed'
+                  AND c.id NOT IN (SELECT id FROM chain)
+            ) AS ok
+        FROM chain a
+    )
+    SELECT id, task_type, project_id
+    FROM eligible
+    WHERE depth < COALESCE((SELECT MIN(depth) FROM eligible WHERE NOT ok), 2147483647)
+    ORDER BY depth
+""")
 
 
 async def get_learner_tasks_by_status(
@@ -0,0 +1,281 @@
+"""
+Compiled project graph cache for the Learning Task Tracker.
+
+The template layer (tasks, parent_id edges, 'blocks' dependencies) does not
+change for a given project version, so it is compiled once into flat
+adjacency arrays and kept in memory. Learner-scoped questions such as
+"what is ready next?" then only need the learner's progress rows plus an
+in-process walk over the compiled graph.
+
+Cache entries are keyed by project ID and carry the template revision they
+were compiled from: the count and latest update of the project's tasks and
+of their dependencies. Every lookup reads the revision (one small aggregate
+query) and recompiles on a mismatch, so template writes committed by other
+processes are picked up. In-process mutations (task_service /
+dependency_service) also call ``invalidate_project_graph`` after committing.
+"""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ltt.models import DependencyModel, DependencyType, Task, TaskModel, TaskStatus
+
+# Hierarchy rank used by the ready-work ordering: project → epic → task → subtask
+TASK_TYPE_RANK = {"project": 0, "epic": 1, "task": 2, "subtask": 3}
+
+# Upper bound on cached projects (oldest entries are evicted first)
+MAX_CACHED_GRAPHS = 128
+
+# (task count, latest task update, dependency count, latest dependency creation)
+GraphRevision = tuple[int, datetime | None, int, datetime | None]
+
+_REVISION_SQL = text("""
+    SELECT t.count, t.latest, d.count, d.latest
+    FROM (
+        SELECT count(*) AS count, max(updated_at) AS latest
+        FROM tasks
+        WHERE project_id = :project_id
+    ) t, (
+        SELECT count(*) AS count, max(dep.created_at) AS latest
+        FROM dependencies dep
+        JOIN tasks task ON task.id = dep.task_id
+        WHERE task.project_id = :project_id
+    ) d
+""")
+
+
+@dataclass(frozen=True)
+class ProjectGraph:
+    """
+    Immutable, array-based view of a project's template layer.
+
+    Nodes are addressed by integer index. Every task of the project is a node;
+    blockers that live outside the project are appended as extra nodes
+    (``tasks[i] is None``) so their per-learner status can still be checked.
+    """
+
+    project_id: str
+    revision: GraphRevision
+    task_ids: tuple[str, ...]
+    index: Mapping[str, int]
+    tasks: tuple[Task | None, ...]
+    parent: tuple[int, ...]  # -1 when the parent is not part of the graph
+    children: tuple[tuple[int, ...], ...]
+    blockers: tuple[tuple[int, ...], ...]  # 'blocks' targets per node
+    dependents: tuple[tuple[int, ...], ...]  # reverse of blockers
+    depth_order: tuple[int, ...]  # project nodes, parents before children
+    ready_order: tuple[int, ...]  # project nodes by (type rank, priority, id)
+    ready_rank: tuple[int, ...]  # position of each node in ready_order
+
+    def has_children(self, task_id: str) -> bool:
+        """Whether a task of this project has child tasks."""
+        i = self.index.get(task_id)
+        return i is not None and len(self.children[i]) > 0
+
+    def blocked_flags(self, statuses: Mapping[str, str]) -> list[bool]:
+        """
+        Compute which nodes are blocked for a learner.
+
+        A node is blocked if any of its 'blocks' dependencies is not closed,
+        or if any ancestor (via parent_id) is blocked.
+
+        Args:
+            statuses: task_id -> status for the learner (missing = 'open')
+
+        Returns:
+            Blocked flag per node index
+        """
+        closed = TaskStatus.CLOSED.value
+        status = [statuses.get(task_id, TaskStatus.OPEN.value) for task_id in self.task_ids]
+        blocked = [False] * len(self.task_ids)
+
+        for i in self.depth_order:
+            parent = self.parent[i]
+            if parent >= 0 and blocked[parent]:
+                blocked[i] = True
+            else:
+                blocked[i] = any(status[b] != closed for b in self.blockers[i])
+
+        return blocked
+
+    def ready_tasks(
+        self,
+        statuses: Mapping[str, str],
+        task_type: str | None = None,
+        limit: int = 10,
+    ) -> list[Task]:
+        """
+        Walk the graph and return ready tasks for a learner.
+
+        Ordering matches the historical SQL: in-progress first, then
+        hierarchy level, priority and hierarchical ID.
+
+        Args:
+            statuses: task_id -> status for the learner (missing = 'open')
+            task_type: Optional task type filter
+            limit: Maximum results
+
+        Returns:
+            Ready tasks (shared cached instances - treat as read-only)
+        """
+        blocked = self.blocked_flags(statuses)
+
+        in_progress: list[Task] = []
+        open_tasks: list[Task] = []
+        for i in self.ready_order:
+            task = self.tasks[i]
+            if blocked[i] or task is None:
+                continue
+            if task_type and task.task_type != task_type:
+                continue
+
+            status = statuses.get(task.id, TaskStatus.OPEN.value)
+            if status == TaskStatus.IN_PROGRESS.value:
+                in_progress.append(task)
+            elif status == TaskStatus.OPEN.value:
+                open_tasks.append(task)
+
+        return (in_progress + open_tasks)[:limit]
+
+
+_graphs: OrderedDict[str, ProjectGraph] = OrderedDict()
+
+
+async def get_project_graph(session: AsyncSession, project_id: str) -> ProjectGraph:
+    """
+    Get the compiled graph for a project, compiling it if missing or stale.
+
+    Args:
+        session: Database session
+        project_id: Project ID
+
+    Returns:
+        Compiled project graph (empty if the project does not exist)
+    """
+    graph = _graphs.get(project_id)
+    if graph is not None and graph.revision == await get_graph_revision(session, project_id):
+        _graphs.move_to_end(project_id)
+        return graph
+
+    graph = await compile_project_graph(session, project_id)
+    _graphs[project_id] = graph
+    while len(_graphs) > MAX_CACHED_GRAPHS:
+        _graphs.popitem(last=False)
+
+    return graph
+
+
+def invalidate_project_graph(project_id: str | None = None) -> None:
+    """
+    Drop a cached project graph.
+
+    Args:
+        project_id: Project to invalidate (None = drop every cached graph)
+    """
+    if project_id is None:
+        _graphs.clear()
+    else:
+        _graphs.pop(project_id, None)
+
+
+async def get_graph_revision(session: AsyncSession, project_id: str) -> GraphRevision:
+    """Read the current template revision of a project."""
+    result = await session.execute(_REVISION_SQL, {"project_id": project_id})
+    return tuple(result.one())
+
+
+async def compile_project_graph(session: AsyncSession, project_id: str) -> ProjectGraph:
+    """
+    Build a project graph from the database (three queries).
+
+    Args:
+        session: Database session
+        project_id: Project ID
+
+    Returns:
+        Freshly compiled project graph
+    """
+    # Read first: a write committed while compiling only makes the entry stale
+    revision = await get_graph_revision(session, project_id)
+
+    task_result = await session.execute(select(TaskModel).where(TaskModel.project_id == project_id))
+    task_models = task_result.scalars().all()
+
+    dep_result = await session.execute(
+        select(DependencyModel.task_id, DependencyModel.depends_on_id)
+        .join(TaskModel, TaskModel.id == DependencyModel.task_id)
+        .where(TaskModel.project_id == project_id)
+        .where(DependencyModel.dependency_type == DependencyType.BLOCKS.value)
+    )
+    edges = dep_result.all()
+
+    task_ids = [t.id for t in task_models]
+    tasks: list[Task | None] = [Task.model_validate(t) for t in task_models]
+    index = {task_id: i for i, task_id in enumerate(task_ids)}
+
+    # Blockers outside the project become status-only nodes
+    for _, depends_on_id in edges:
+        if depends_on_id not in index:
+            index[depends_on_id] = len(task_ids)
+            task_ids.append(depends_on_id)
+            tasks.append(None)
+
+    parent = [-1] * len(task_ids)
+    children: list[list[int]] = [[] for _ in task_ids]
+    for i, model in enumerate(task_models):
+        if model.parent_id is not None:
+            parent[i] = index.get(model.parent_id, -1)
+            if parent[i] >= 0:
+                children[parent[i]].append(i)
+
+    blockers: list[list[int]] = [[] for _ in task_ids]
+    dependents: list[list[int]] = [[] for _ in task_ids]
+    for task_id, depends_on_id in edges:
+        blockers[index[task_id]].append(index[depends_on_id])
+        dependents[index[depends_on_id]].append(index[task_id])
+
+    depth = [-1] * len(task_ids)
+    for i in range(len(task_models)):
+        chain = []
+        node = i
+        while node >= 0 and depth[node] < 0:
+            chain.append(node)
+            node = parent[node]
+        base = depth[node] if node >= 0 else -1
+        for offset, n in enumerate(reversed(chain), start=1):
+            depth[n] = base + offset
+
+    project_nodes = range(len(task_models))
+    depth_order = sorted(project_nodes, key=lambda i: depth[i])
+    ready_order = sorted(
+        project_nodes,
+        key=lambda i: (
+            TASK_TYPE_RANK.get(task_models[i].task_type, 4),
+            task_models[i].priority,
+            task_ids[i],
+        ),
+    )
+
+    ready_rank = [len(task_ids)] * len(task_ids)
+    for rank, i in enumerate(ready_order):
+        ready_rank[i] = rank
+
+    return ProjectGraph(
+        project_id=project_id,
+        revision=revision,
+        task_ids=tuple(task_ids),
+        index=index,
+        tasks=tuple(tasks),
+        parent=tuple(parent),
+        children=tuple(tuple(c) for c in children),
+        blockers=tuple(tuple(b) for b in blockers),
+        dependents=tuple(tuple(d) for d in dependents),
+        depth_order=tuple(depth_order),
+        ready_order=tuple(ready_order),
+        ready_rank=tuple(ready_rank),
+    )
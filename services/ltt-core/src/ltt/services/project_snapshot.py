@@ -0,0 +1,412 @@
+"""
+Whole-project template snapshots for the Learning Task Tracker.
+
+Read-heavy endpoints (project tree, inspector, export, agent context) walk
+the same template hierarchy over and over. ``load_project_snapshot`` loads
+every task, dependency, learning objective and acceptance criterion of a
+project in four queries and keeps the result as an immutable structure of
+slotted records, so template reads become in-memory lookups.
+
+Snapshots are cached per (project ID, revision) in a bounded LRU. The
+revision extends the project graph's (see ``ltt.services.project_graph``)
+with the count and latest creation of the project's learning objectives
+and acceptance criteria; every lookup reads it (one small aggregate query)
+so template writes committed by other processes are picked up. In-process
+template mutations (task_service, dependency_service, objectives) also
+call ``invalidate_project_snapshot``, mirroring the project graph cache.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from ltt.models import (
+    AcceptanceCriterionModel,
+    DependencyModel,
+    LearningObjectiveModel,
+    Task,
+    TaskModel,
+)
+
+# Upper bound on cached snapshots (least recently used evicted first)
+MAX_CACHED_SNAPSHOTS = 64
+
+# Graph revision (task and dependency count and latest change) followed by
+# the count and latest creation of the project's learning objectives and of
+# its acceptance criteria; neither of those is ever updated in place
+SnapshotRevision = tuple[
+    int, datetime | None, int, datetime | None, int, datetime | None, int, datetime | None
+]
+
+_REVISION_SQL = text("""
+    SELECT t.count, t.latest, d.count, d.latest, o.count, o.latest, c.count, c.latest
+    FROM (
+        SELECT count(*) AS count, max(updated_at) AS latest
+        FROM tasks
+        WHERE project_id = :project_id
+    ) t, (
+        SELECT count(*) AS count, max(dep.created_at) AS latest
+        FROM dependencies dep
+        JOIN tasks task ON task.id = dep.task_id
+        WHERE task.project_id = :project_id
+    ) d, (
+        SELECT count(*) AS count, max(lo.created_at) AS latest
+        FROM learning_objectives lo
+        JOIN tasks task ON task.id = lo.task_id
+        WHERE task.project_id = :project_id
+    ) o, (
+        SELECT count(*) AS count, max(ac.created_at) AS latest
+        FROM acceptance_criteria ac
+        JOIN tasks task ON task.id = ac.task_id
+        WHERE task.project_id = :project_id
+    ) c
+""")
+
+
+@dataclass(frozen=True, slots=True)
+class TaskRecord:
+    """
+    Template fields of one task.
+
+    Values are the raw column values (``task_type`` is a plain string, which
+    compares equal to the matching ``TaskType`` member).
+    """
+
+    id: str
+    parent_id: str | None
+    project_id: str
+    title: str
+    description: str
+    acceptance_criteria: str
+    notes: str
+    task_type: str
+    priority: int
+    estimated_minutes: int | None
+    content: str | None
+    content_refs: list[str] | None
+    tutor_guidance: dict | None
+    narrative_context: str | None
+    summary: str | None
+    version: int
+    version_tag: str | None
+    requires_submission: bool | None
+    workspace_type: str | None
+    tutor_persona: str | None
+    subtask_type: str
+    narrative: bool
+    tutor_config: dict | None
+    max_grade: float | None
+    project_slug: str | None
+    checks: list[dict] | None
+    created_at: datetime
+    updated_at: datetime
+
+    def to_task(self) -> Task:
+        """Convert to the Pydantic Task model used by the service layer."""
+        return Task.model_validate(self)
+
+
+@dataclass(frozen=True, slots=True)
+class DependencyRecord:
+    """Outgoing dependency of a task, with the target's title resolved."""
+
+    task_id: str
+    depends_on_id: str
+    dependency_type: str
+    depends_on_title: str
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectiveRecord:
+    """Learning objective attached to a task."""
+
+    id: str
+    task_id: str
+    taxonomy: str
+    level: str | None
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class CriterionRecord:
+    """Structured acceptance criterion attached to a task."""
+
+    id: str
+    task_id: str
+    criterion_type: str
+    description: str
+
+
+_TASK_COLUMNS = tuple(f.name for f in fields(TaskRecord))
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectSnapshot:
+    """
+    Immutable template view of one project.
+
+    Tasks are stored in hierarchy pre-order (parents before children,
+    siblings by creation order) and addressed by integer index.
+    """
+
+    project_id: str
+    version: int
+    revision: SnapshotRevision
+    tasks: tuple[TaskRecord, ...]
+    index: Mapping[str, int]
+    parent: tuple[int, ...]  # -1 for the project root
+    children: tuple[tuple[int, ...], ...]
+    dependencies: tuple[tuple[DependencyRecord, ...], ...]
+    objectives: tuple[tuple[ObjectiveRecord, ...], ...]
+    criteria: tuple[tuple[CriterionRecord, ...], ...]
+
+    @property
+    def project(self) -> TaskRecord | None:
+        """The project root record (None if the project does not exist)."""
+        i = self.index.get(self.project_id)
+        return self.tasks[i] if i is not None else None
+
+    def get(self, task_id: str) -> TaskRecord | None:
+        """Look up a task of this project by ID."""
+        i = self.index.get(task_id)
+        return self.tasks[i] if i is not None else None
+
+    def children_of(self, task_id: str) -> list[TaskRecord]:
+        """Direct children of a task, in creation order."""
+        i = self.index.get(task_id)
+        if i is None:
+            return []
+        return [self.tasks[c] for c in self.children[i]]
+
+    def ancestors_of(self, task_id: str) -> list[TaskRecord]:
+        """Ancestors of a task, nearest first (project last)."""
+        i = self.index.get(task_id)
+        ancestors = []
+        while i is not None and self.parent[i] >= 0:
+            i = self.parent[i]
+            ancestors.append(self.tasks[i])
+        return ancestors
+
+    def objectives_of(self, task_id: str) -> tuple[ObjectiveRecord, ...]:
+        """Learning objectives attached to a task."""
+        i = self.index.get(task_id)
+        return self.objectives[i] if i is not None else ()
+
+    def criteria_of(self, task_id: str) -> tuple[CriterionRecord, ...]:
+        """Structured acceptance criteria attached to a task."""
+        i = self.index.get(task_id)
+        return self.criteria[i] if i is not None else ()
+
+    def dependencies_of(self, task_id: str) -> tuple[DependencyRecord, ...]:
+        """Outgoing dependencies of a task."""
+        i = self.index.get(task_id)
+        return self.dependencies[i] if i is not None else ()
+
+    def walk(self, task_id: str | None = None) -> Iterator[TaskRecord]:
+        """
+        Iterate a subtree in pre-order.
+
+        Args:
+            task_id: Subtree root (default: the project root)
+
+        Yields:
+            Task records, parents before children
+        """
+        root = self.index.get(task_id or self.project_id)
+        if root is None:
+            return
+        stack = [root]
+        while stack:
+            i = stack.pop()
+            yield self.tasks[i]
+            stack.extend(reversed(self.children[i]))
+
+
+_snapshots: OrderedDict[tuple[str, SnapshotRevision], ProjectSnapshot] = OrderedDict()
+_revisions: dict[str, SnapshotRevision] = {}
+
+
+async def get_snapshot_revision(session: AsyncSession, project_id: str) -> SnapshotRevision:
+    """Read the current snapshot revision of a project."""
+    result = await session.execute(_REVISION_SQL, {"project_id": project_id})
+    return tuple(result.one())
+
+
+async def load_project_snapshot(session: AsyncSession, project_id: str) -> ProjectSnapshot:
+    """
+    Get the template snapshot of a project, loading it if missing or stale.
+
+    Args:
+        session: Database session
+        project_id: Project ID
+
+    Returns:
+        Project snapshot (empty if the project does not exist)
+    """
+    key = (project_id, await get_snapshot_revision(session, project_id))
+    snapshot = _snapshots.get(key)
+    if snapshot is not None:
+        _snapshots.move_to_end(key)
+        return snapshot
+
+    snapshot = await build_project_snapshot(session, project_id)
+    if snapshot.project is None:
+        return snapshot
+
+    # Keep only the latest revision of each project
+    previous = _revisions.pop(project_id, None)
+    if previous is not None:
+        _snapshots.pop((project_id, previous), None)
+    _revisions[project_id] = snapshot.revision
+    _snapshots[(project_id, snapshot.revision)] = snapshot
+    while len(_snapshots) > MAX_CACHED_SNAPSHOTS:
+        (evicted_id, _), _ = _snapshots.popitem(last=False)
+        _revisions.pop(evicted_id, None)
+
+    return snapshot
+
+
+def invalidate_project_snapshot(project_id: str | None = None) -> None:
+    """
+    Drop a cached project snapshot.
+
+    Args:
+        project_id: Project to invalidate (None = drop every cached snapshot)
+    """
+    if project_id is None:
+        _snapshots.clear()
+        _revisions.clear()
+        return
+
+    revision = _revisions.pop(project_id, None)
+    if revision is not None:
+        _snapshots.pop((project_id, revision), None)
+
+
+async def build_project_snapshot(session: AsyncSession, project_id: str) -> ProjectSnapshot:
+    """
+    Build a project snapshot from the database (five queries).
+
+    Args:
+        session: Database session
+        project_id: Project ID
+
+    Returns:
+        Freshly loaded project snapshot
+    """
+    # Read first: a write committed while loading only makes the entry stale
+    revision = await get_snapshot_revision(session, project_id)
+
+    task_result = await session.execute(
+        select(*(TaskModel.__table__.c[name] for name in _TASK_COLUMNS)).where(
+            TaskModel.project_id == project_id
+        )
+    )
+    loaded = [TaskRecord(*row) for row in task_result.all()]
+
+    target = aliased(TaskModel)
+    dep_result = await session.execute(
+        select(
+            DependencyModel.task_id,
+            DependencyModel.depends_on_id,
+            DependencyModel.dependency_type,
+            target.title,
+        )
+        .join(TaskModel, TaskModel.id == DependencyModel.task_id)
+        .join(target, target.id == DependencyModel.depends_on_id)
+        .where(TaskModel.project_id == project_id)
+        .order_by(DependencyModel.created_at, DependencyModel.depends_on_id)
+    )
+    dep_rows = dep_result.all()
+
+    task_ids = select(TaskModel.id).where(TaskModel.project_id == project_id)
+    objective_result = await session.execute(
+        select(
+            LearningObjectiveModel.id,
+            LearningObjectiveModel.task_id,
+            LearningObjectiveModel.taxonomy,
+            LearningObjectiveModel.level,
+            LearningObjectiveModel.description,
+        )
+        .where(LearningObjectiveModel.task_id.in_(task_ids))
+        .order_by(LearningObjectiveModel.created_at, LearningObjectiveModel.id)
+    )
+    objective_rows = objective_result.all()
+
+    criterion_result = await session.execute(
+        select(
+            AcceptanceCriterionModel.id,
+            AcceptanceCriterionModel.task_id,
+            AcceptanceCriterionModel.criterion_type,
+            AcceptanceCriterionModel.description,
+        )
+        .where(AcceptanceCriterionModel.task_id.in_(task_ids))
+        .order_by(AcceptanceCriterionModel.created_at, AcceptanceCriterionModel.id)
+    )
+    criterion_rows = criterion_result.all()
+
+    # Order tasks in pre-order so that index order doubles as display order
+    by_parent: dict[str | None, list[TaskRecord]] = {}
+    for record in loaded:
+        by_parent.setdefault(record.parent_id, []).append(record)
+    for siblings in by_parent.values():
+        siblings.sort(key=_sibling_key)
+
+    ordered: list[TaskRecord] = []
+    known = {record.id for record in loaded}
+    roots = [r for r in loaded if r.parent_id is None or r.parent_id not in known]
+    stack = list(reversed(sorted(roots, key=_sibling_key)))
+    while stack:
+        record = stack.pop()
+        ordered.append(record)
+        stack.extend(reversed(by_parent.get(record.id, [])))
+
+    index = {record.id: i for i, record in enumerate(ordered)}
+    parent = tuple(index.get(r.parent_id, -1) if r.parent_id else -1 for r in ordered)
+    children: list[list[int]] = [[] for _ in ordered]
+    for i, p in enumerate(parent):
+        if p >= 0:
+            children[p].append(i)
+
+    dependencies: list[list[DependencyRecord]] = [[] for _ in ordered]
+    for task_id, depends_on_id, dependency_type, title in dep_rows:
+        dependencies[index[task_id]].append(
+            DependencyRecord(task_id, depends_on_id, dependency_type, title)
+        )
+
+    objectives: list[list[ObjectiveRecord]] = [[] for _ in ordered]
+    for row in objective_rows:
+        objectives[index[row.task_id]].append(ObjectiveRecord(*row))
+
+    criteria: list[list[CriterionRecord]] = [[] for _ in ordered]
+    for row in criterion_rows:
+        criteria[index[row.task_id]].append(CriterionRecord(*row))
+
+    root = index.get(project_id)
+    version = ordered[root].version if root is not None else 1
+
+    return ProjectSnapshot(
+        project_id=project_id,
+        version=version,
+        revision=revision,
+        tasks=tuple(ordered),
+        index=index,
+        parent=parent,
+        children=tuple(tuple(c) for c in children),
+        dependencies=tuple(tuple(d) for d in dependencies),
+        objectives=tuple(tuple(o) for o in objectives),
+        criteria=tuple(tuple(c) for c in criteria),
+    )
+
+
+def _sibling_key(record: TaskRecord) -> tuple:
+    """Order siblings by their numeric ID suffix (creation order), then by ID."""
+    suffix = record.id.rsplit(".", 1)[-1]
+    if suffix.isdigit() and "." in record.id:
+        return (0, int(suffix), record.id)
+    return (1, 0, record.id)
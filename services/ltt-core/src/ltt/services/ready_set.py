@@ -0,0 +1,297 @@
+"""
+Incremental ready-set engine for the Learning Task Tracker.
+
+Keeps, per (learner, project), the number of unmet 'blocks' dependencies of
+every task and the resulting ready frontier. Status transitions recorded by
+progress_service update the frontier in O(affected dependents + subtrees)
+instead of recomputing ready work from scratch.
+
+Consistency across processes: every status write advances the learner's
+progress revision (``learners.progress_revision``, see
+``advance_progress_revision``) in its own transaction. The UPDATE holds the
+learner row until commit, so one learner's status writes commit in
+revision order and each committed write moves the revision. Each entry
+remembers the revision it was built at; reads compare it with one point
+query and rebuild the entry if another process changed the learner's
+progress in the meantime. Transitions this process applied itself move the
+revision too; the entry counts them until the next read, which adopts the
+new revision only if they account for the whole difference.
+"""
+
+from collections import OrderedDict
+from itertools import islice
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ltt.models import LearnerModel, LearnerTaskProgressModel, Task, TaskStatus
+from ltt.services.project_graph import ProjectGraph, get_project_graph
+
+# Upper bound on learners with cached ready sets (least recently used evicted)
+MAX_CACHED_LEARNERS = 4096
+
+_ACTIVE_STATUSES = (TaskStatus.OPEN.value, TaskStatus.IN_PROGRESS.value)
+
+
+class LearnerReadySet:
+    """Ready frontier of one learner within one compiled project graph."""
+
+    __slots__ = (
+        "graph",
+        "status",
+        "unmet",
+        "blocked",
+        "frontier",
+        "revision",
+        "own_writes",
+        "_ordered",
+    )
+
+    def __init__(self, graph: ProjectGraph, statuses: dict[str, str], revision: int):
+        closed = TaskStatus.CLOSED.value
+        self.graph = graph
+        self.status = [statuses.get(task_id, TaskStatus.OPEN.value) for task_id in graph.task_ids]
+        self.unmet = [sum(self.status[b] != closed for b in bs) for bs in graph.blockers]
+        self.blocked = [False] * len(graph.task_ids)
+        self.frontier: set[int] = set()
+        self.revision = revision
+        # Transitions recorded by this process since the revision
+        self.own_writes = 0
+        self._ordered: list[int] | None = None
+
+        for i in graph.depth_order:
+            parent = graph.parent[i]
+            self.blocked[i] = self.unmet[i] > 0 or (parent >= 0 and self.blocked[parent])
+            self._update_membership(i)
+
+    def apply(self, task_id: str, new_status: str) -> None:
+        """
+        Apply a status transition for one task.
+
+        Args:
+            task_id: Task whose status changed
+            new_status: New status value
+        """
+        i = self.graph.index.get(task_id)
+        if i is None:
+            return
+
+        closed = TaskStatus.CLOSED.value
+        old_status = self.status[i]
+        self.status[i] = new_status
+        self._update_membership(i)
+
+        was_closed = old_status == closed
+        is_closed = new_status == closed
+        if was_closed != is_closed:
+            delta = -1 if is_closed else 1
+            for dependent in self.graph.dependents[i]:
+                before = self.unmet[dependent]
+                self.unmet[dependent] = before + delta
+                if (before == 0) != (self.unmet[dependent] == 0):
+                    self._refresh_subtree(dependent)
+
+        self._ordered = None
+
+    def ready(self, task_type: str | None = None, limit: int = 10) -> list[Task]:
+        """
+        Read the ready frontier.
+
+        Ordering matches get_ready_work: in-progress first, then hierarchy
+        level, priority and hierarchical ID.
+
+        Args:
+            task_type: Optional task type filter
+            limit: Maximum results
+
+        Returns:
+            Ready tasks (shared cached instances - treat as read-only)
+        """
+        if self._ordered is None:
+            in_progress = TaskStatus.IN_PROGRESS.value
+            rank = self.graph.ready_rank
+            self._ordered = sorted(
+                self.frontier, key=lambda i: (self.status[i] != in_progress, rank[i])
+            )
+
+        tasks = self.graph.tasks
+        if task_type is None:
+            return [tasks[i] for i in self._ordered[:limit]]
+
+        matching = (tasks[i] for i in self._ordered if tasks[i].task_type == task_type)
+        return list(islice(matching, limit))
+
+    def status_of(self, task_id: str) -> str:
+        """Current status of a task for this learner (missing = 'open')."""
+        i = self.graph.index.get(task_id)
+        return self.status[i] if i is not None else TaskStatus.OPEN.value
+
+    def _refresh_subtree(self, root: int) -> None:
+        """Recompute blocked flags below a node whose own blockers changed."""
+        graph = self.graph
+        stack = [root]
+        while stack:
+            i = stack.pop()
+            parent = graph.parent[i]
+            blocked = self.unmet[i] > 0 or (parent >= 0 and self.blocked[parent])
+            if blocked == self.blocked[i] and i != root:
+                continue
+            self.blocked[i] = blocked
+            self._update_membership(i)
+            stack.extend(graph.children[i])
+
+    def _update_membership(self, i: int) -> None:
+        if (
+            self.graph.tasks[i] is not None
+            and not self.blocked[i]
+            and self.status[i] in _ACTIVE_STATUSES
+        ):
+            self.frontier.add(i)
+        else:
+            self.frontier.discard(i)
+        self._ordered = None
+
+
+_ready_sets: OrderedDict[str, dict[str, LearnerReadySet]] = OrderedDict()
+
+
+async def get_ready_tasks(
+    session: AsyncSession,
+    project_id: str,
+    learner_id: str,
+    task_type: str | None = None,
+    limit: int = 10,
+) -> list[Task]:
+    """
+    Get ready tasks for a learner from the incremental ready set.
+
+    Drop-in replacement for dependency_service.get_ready_work. The first call
+    for a (learner, project) builds the ready set from one progress query;
+    later calls only verify the learner's progress revision.
+
+    Args:
+        session: Database session
+        project_id: Scope to project
+        learner_id: Learner to get ready work for
+        task_type: Filter by type (task, subtask, etc.)
+        limit: Maximum results
+
+    Returns:
+        List of ready tasks
+    """
+    ready_set = await get_ready_set(session, project_id, learner_id)
+    return ready_set.ready(task_type=task_type, limit=limit)
+
+
+async def get_ready_set(session: AsyncSession, project_id: str, learner_id: str) -> LearnerReadySet:
+    """
+    Get (building or rebuilding if stale) the ready set of a learner.
+
+    Args:
+        session: Database session
+        project_id: Project ID
+        learner_id: Learner ID
+
+    Returns:
+        Up-to-date ready set
+    """
+    graph = await get_project_graph(session, project_id)
+    revision = await _get_progress_revision(session, learner_id)
+
+    projects = _ready_sets.get(learner_id)
+    if projects is not None:
+        _ready_sets.move_to_end(learner_id)
+        ready_set = projects.get(project_id)
+        if (
+            ready_set is not None
+            and ready_set.graph is graph
+            and ready_set.revision + ready_set.own_writes == revision
+        ):
+            ready_set.revision = revision
+            ready_set.own_writes = 0
+            return ready_set
+
+    statuses = {}
+    if graph.task_ids:
+        result = await session.execute(
+            select(LearnerTaskProgressModel.task_id, LearnerTaskProgressModel.status)
+            .where(LearnerTaskProgressModel.learner_id == learner_id)
+            .where(LearnerTaskProgressModel.task_id.in_(graph.task_ids))
+        )
+        statuses = {task_id: status for task_id, status in result.all()}
+
+    ready_set = LearnerReadySet(graph, statuses, revision)
+    _ready_sets.setdefault(learner_id, {})[project_id] = ready_set
+    _ready_sets.move_to_end(learner_id)
+    while len(_ready_sets) > MAX_CACHED_LEARNERS:
+        _ready_sets.popitem(last=False)
+
+    return ready_set
+
+
+def record_status_change(learner_id: str, task_id: str, new_status: str) -> None:
+    """
+    Apply a committed status transition to the learner's cached ready sets.
+
+    Called by progress_service after every status update. Every cached project
+    containing the task is updated, including projects where it is only an
+    external blocker. Every cached project of the learner counts the write,
+    so its next read can tell it apart from other processes' writes.
+
+    Args:
+        learner_id: Learner ID
+        task_id: Task whose status changed
+        new_status: New status value
+    """
+    projects = _ready_sets.get(learner_id)
+    if not projects:
+        return
+
+    for ready_set in projects.values():
+        if task_id in ready_set.graph.index:
+            ready_set.apply(task_id, new_status)
+        ready_set.own_writes += 1
+
+
+def invalidate_ready_sets(learner_id: str | None = None) -> None:
+    """
+    Drop cached ready sets.
+
+    Args:
+        learner_id: Learner to invalidate (None = drop every ready set)
+    """
+    if learner_id is None:
+        _ready_sets.clear()
+    else:
+        _ready_sets.pop(learner_id, None)
+
+
+async def advance_progress_revision(
+    session: AsyncSession, learner_id: str, writes: int = 1
+) -> None:
+    """
+    Advance the learner's progress revision for status writes (no commit).
+
+    Every status write calls this in its transaction before touching any
+    progress row, so the learner row is always locked first. A call that
+    ends up writing fewer rows than it counted only costs readers a rebuild.
+
+    Args:
+        session: Database session
+        learner_id: Learner ID
+        writes: Number of status writes to count (0 = only take the lock,
+            for transactions that write progress rows before their status)
+    """
+    await session.execute(
+        update(LearnerModel)
+        .where(LearnerModel.id == learner_id)
+        .values(progress_revision=LearnerModel.progress_revision + writes)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _get_progress_revision(session: AsyncSession, learner_id: str) -> int:
+    result = await session.execute(
+        select(LearnerModel.progress_revision).where(LearnerModel.id == learner_id)
+    )
+    return result.scalar_one_or_none() or 0
@@ -4,17 +4,23 @@ Submission service for the Learning Task Tracker.
 Manages learner submissions and tracks attempt history.
 """
 
-from sqlalchemy import func, select
+import hashlib
+from dataclasses import dataclass, field
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ltt.models import (
+    LearnerTaskProgressModel,
     Submission,
     SubmissionModel,
     SubmissionType,
     TaskModel,
     TaskStatus,
+    Validation,
 )
-from ltt.utils.ids import PREFIX_SUBMISSION, generate_entity_id
+from ltt.utils.ids import PREFIX_LEARNER_TASK_PROGRESS, PREFIX_SUBMISSION, generate_entity_id
 
 # ============================================================================
 # Exceptions
@@ -37,6 +43,17 @@ class TaskNotFoundError(SubmissionError):
     """Referenced task does not exist."""
 
 
+@dataclass(frozen=True)
+class SubmitResult:
+    """Outcome of submit_and_validate."""
+
+    submission: Submission
+    validation: Validation
+    status: TaskStatus  # Learner's task status after the submit
+    close_error: str | None = None  # Why a passing submission could not close the task
+    auto_closed: list[str] = field(default_factory=list)  # Ancestors closed, bottom-up
+
+
 # ============================================================================
 # Submission Operations
 # ============================================================================
@@ -52,7 +69,7 @@ async def create_submission(
     """
     Create a submission for a task.
 
-    Automatically calculates attempt number based on previous submissions.
+    The attempt number comes from the learner's progress row counter.
 
     Args:
         session: Database session
@@ -82,33 +99,168 @@ async def create_submission(
     if progress and progress.status == TaskStatus.CLOSED:
         raise InvalidStateError(f"Task '{task_id}' is already closed for this learner")
 
-    # 3. Calculate attempt number
-    count_result = await session.execute(
-        select(func.count())
-        .select_from(SubmissionModel)
-        .where(SubmissionModel.task_id == task_id)
-        .where(SubmissionModel.learner_id == learner_id)
-    )
-    attempt_number = (count_result.scalar() or 0) + 1
-
-    # 4. Create submission
-    submission_id = generate_entity_id(PREFIX_SUBMISSION)
-    submission = SubmissionModel(
-        id=submission_id,
-        task_id=task_id,
-        learner_id=learner_id,
-        submission_type=submission_type.value,
-        content=content,
-        attempt_number=attempt_number,
+    # 3. Create submission with the next attempt number
+    submission = await _insert_submission(
+        session, task_id, learner_id, content, submission_type
     )
-    session.add(submission)
 
     await session.commit()
-    await session.refresh(submission)
 
     return Submission.model_validate(submission)
 
 
+async def submit_and_validate(
+    session: AsyncSession,
+    task_id: str,
+    learner_id: str,
+    content: str,
+    submission_type: SubmissionType,
+) -> SubmitResult:
+    """
+    Submit work, validate it and close the task in one transaction.
+
+    Attempt numbering, the submission and validation inserts, closing the
+    task on a passing validation and auto-closing eligible ancestors all
+    run before a single commit, so a submit is atomic for the learner.
+    Inserts use RETURNING instead of refreshing after commit.
+
+    Args:
+        session: Database session
+        task_id: Task being submitted for
+        learner_id: Who is submitting
+        content: The submission content
+        submission_type: Type of content
+
+    Returns:
+        Submission, validation and the resulting status changes
+
+    Raises:
+        TaskNotFoundError: If task doesn't exist
+        InvalidStateError: If task is closed
+    """
+    from ltt.services.progress_service import (
+        InvalidStatusTransitionError,
+        apply_auto_close_ancestors,
+        apply_status,
+    )
+    from ltt.services.ready_set import advance_progress_revision, record_status_change
+    from ltt.services.validation_service import apply_validation
+
+    result = await session.execute(
+        select(TaskModel, LearnerTaskProgressModel.status)
+        .outerjoin(
+            LearnerTaskProgressModel,
+            (LearnerTaskProgressModel.task_id == TaskModel.id)
+            & (LearnerTaskProgressModel.learner_id == learner_id),
+        )
+        .where(TaskModel.id == task_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise TaskNotFoundError(f"Task {task_id} does not exist")
+
+    task, status = row
+    if status == TaskStatus.CLOSED.value:
+        raise InvalidStateError(f"Task '{task_id}' is already closed for this learner")
+
+    # Lock the learner before the progress row, like every status write
+    await advance_progress_revision(session, learner_id, writes=0)
+    submission = await _insert_submission(session, task_id, learner_id, content, submission_type)
+    validation = await apply_validation(session, submission, task)
+
+    closed = False
+    close_error = None
+    auto_closed: list[str] = []
+    if validation.passed:
+        try:
+            await apply_status(
+                session, task_id, learner_id, TaskStatus.CLOSED, close_reason="Passed validation"
+            )
+            closed = True
+            auto_closed = await apply_auto_close_ancestors(session, task_id, learner_id)
+        except InvalidStatusTransitionError as e:
+            close_error = str(e)
+
+    await session.commit()
+
+    if closed:
+        for closed_id in [task_id, *auto_closed]:
+            record_status_change(learner_id, closed_id, TaskStatus.CLOSED.value)
+
+    return SubmitResult(
+        submission=Submission.model_validate(submission),
+        validation=Validation.model_validate(validation),
+        status=TaskStatus.CLOSED if closed else TaskStatus(status or TaskStatus.OPEN.value),
+        close_error=close_error,
+        auto_closed=auto_closed,
+    )
+
+
+async def _insert_submission(
+    session: AsyncSession,
+    task_id: str,
+    learner_id: str,
+    content: str,
+    submission_type: SubmissionType,
+) -> SubmissionModel:
+    """
+    Insert a submission numbered after the learner's previous attempts.
+
+    The attempt counter on the learner's progress row is incremented in the
+    same statement (creating an 'open' row if needed). The upsert locks the
+    row, so concurrent submissions get distinct attempt numbers.
+    """
+    table = LearnerTaskProgressModel
+    attempt = (
+        pg_insert(table)
+        .values(
+            id=generate_entity_id(PREFIX_LEARNER_TASK_PROGRESS),
+            task_id=task_id,
+            learner_id=learner_id,
+            status=TaskStatus.OPEN.value,
+            attempt_count=1,
+        )
+        .on_conflict_do_update(
+            index_elements=[table.task_id, table.learner_id],
+            set_={"attempt_count": table.attempt_count + 1, "updated_at": func.now()},
+        )
+        .returning(table.attempt_count)
+        .cte("attempt")
+    )
+    attempt_number = select(attempt.c.attempt_count).scalar_subquery()
+    result = await session.scalars(
+        insert(SubmissionModel)
+        .values(
+            id=generate_entity_id(PREFIX_SUBMISSION),
+            task_id=task_id,
+            learner_id=learner_id,
+            submission_type=submission_type.value,
+            content=content,
+            content_hash=hash_content(content),
+            attempt_number=attempt_number,
+        )
+        .returning(SubmissionModel)
+    )
+    return result.one()
+
+
+def hash_content(content: str) -> str:
+    """
+    Hash submission content for detecting resubmissions.
+
+    Line endings are normalized and surrounding whitespace is ignored, so a
+    resubmitted answer hashes the same after a copy/paste round trip.
+
+    Args:
+        content: Submission content
+
+    Returns:
+        Hex sha256 digest of the normalized content
+    """
+    normalized = content.replace("\r\n", "\n").strip(" \t\r\n")
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
 async def get_submission(
     session: AsyncSession,
     submission_id: str,
@@ -205,6 +357,8 @@ async def get_attempt_count(
     """
     Get number of attempts for a task.
 
+    Reads the counter on the learner's progress row.
+
     Args:
         session: Database session
         task_id: Task ID
@@ -214,9 +368,9 @@ async def get_attempt_count(
         Number of attempts
     """
     result = await session.execute(
-        select(func.count())
-        .select_from(SubmissionModel)
-        .where(SubmissionModel.task_id == task_id)
-        .where(SubmissionModel.learner_id == learner_id)
+        select(LearnerTaskProgressModel.attempt_count).where(
+            LearnerTaskProgressModel.task_id == task_id,
+            LearnerTaskProgressModel.learner_id == learner_id,
+        )
     )
     return result.scalar() or 0
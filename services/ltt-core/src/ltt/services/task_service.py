@@ -7,7 +7,7 @@ Based on PRD section 5.1.
 
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -16,10 +16,14 @@ from ltt.models import (
     CommentCreate,
     CommentModel,
     Task,
+    TaskClosureModel,
     TaskCreate,
     TaskModel,
     TaskUpdate,
 )
+from ltt.services.project_graph import invalidate_project_graph
+from ltt.services.progress_rollup import COUNTED_TASK_TYPES, refresh_project_rollups
+from ltt.services.project_snapshot import invalidate_project_snapshot
 from ltt.utils.ids import PREFIX_COMMENT, generate_entity_id, generate_task_id
 
 
@@ -35,13 +39,22 @@ class InvalidTaskHierarchyError(Exception):
     pass
 
 
-async def create_task(session: AsyncSession, task_data: TaskCreate) -> Task:
+async def create_task(
+    session: AsyncSession,
+    task_data: TaskCreate,
+    update_closure: bool = True,
+    refresh_rollups: bool = True,
+) -> Task:
     """
     Create a new task at any hierarchy level.
 
     Args:
         session: Database session
         task_data: Task creation data
+        update_closure: Insert the task's closure rows now. Bulk loaders pass
+            False and call backfill_task_closure once at the end.
+        refresh_rollups: Recompute the project's learner rollups now. Bulk
+            loaders pass False and call refresh_project_rollups once at the end.
 
     Returns:
         Created task
@@ -128,12 +141,32 @@ async def create_task(session: AsyncSession, task_data: TaskCreate) -> Task:
         tutor_config=task_data.tutor_config,
         max_grade=task_data.max_grade,
         project_slug=task_data.project_slug,
+        checks=task_data.checks,
     )
 
     session.add(task_model)
+    if update_closure:
+        await session.flush()
+        await session.execute(
+            text("""
+                INSERT INTO task_closure (ancestor_id, descendant_id, depth)
+                SELECT CAST(:task_id AS VARCHAR), CAST(:task_id AS VARCHAR), 0
+                UNION ALL
+                SELECT ancestor_id, CAST(:task_id AS VARCHAR), depth + 1
+                FROM task_closure
+                WHERE descendant_id = :parent_id
+            """),
+            {"task_id": task_model.id, "parent_id": task_model.parent_id},
+        )
+    if refresh_rollups and task_model.task_type in COUNTED_TASK_TYPES:
+        await session.flush()
+        await refresh_project_rollups(session, task_model.project_id)
     await session.commit()
     await session.refresh(task_model)
 
+    invalidate_project_graph(task_model.project_id)
+    invalidate_project_snapshot(task_model.project_id)
+
     return Task.model_validate(task_model)
 
 
@@ -199,6 +232,9 @@ async def update_task(session: AsyncSession, task_id: str, updates: TaskUpdate)
     await session.commit()
     await session.refresh(task_model)
 
+    invalidate_project_graph(task_model.project_id)
+    invalidate_project_snapshot(task_model.project_id)
+
     return Task.model_validate(task_model)
 
 
@@ -224,6 +260,9 @@ async def update_task_summary(session: AsyncSession, task_id: str, summary: str)
     task_model.summary = summary
     await session.commit()
 
+    invalidate_project_graph(task_model.project_id)
+    invalidate_project_snapshot(task_model.project_id)
+
 
 async def delete_task(session: AsyncSession, task_id: str) -> None:
     """
@@ -240,9 +279,17 @@ async def delete_task(session: AsyncSession, task_id: str) -> None:
     if not task_model:
         raise TaskNotFoundError(f"Task {task_id} not found")
 
+    project_id = task_model.project_id
     await session.delete(task_model)
+    if project_id != task_id:
+        await session.flush()
+        await refresh_project_rollups(session, project_id)
     await session.commit()
 
+    # Cascaded dependency rows may have blocked tasks in other projects
+    invalidate_project_graph()
+    invalidate_project_snapshot()
+
 
 async def get_children(session: AsyncSession, task_id: str, recursive: bool = False) -> list[Task]:
     """
@@ -262,21 +309,15 @@ async def get_children(session: AsyncSession, task_id: str, recursive: bool = Fa
         children = result.scalars().all()
         return [Task.model_validate(child) for child in children]
 
-    # Recursive: get all descendants
-    # Use a CTE for recursive query
-    descendants = []
-    to_visit = [task_id]
-
-    while to_visit:
-        current_id = to_visit.pop(0)
-        result = await session.execute(select(TaskModel).where(TaskModel.parent_id == current_id))
-        children = result.scalars().all()
-
-        for child in children:
-            descendants.append(Task.model_validate(child))
-            to_visit.append(child.id)
-
-    return descendants
+    # Recursive: all descendants via the closure table, nearest levels first
+    result = await session.execute(
+        select(TaskModel)
+        .join(TaskClosureModel, TaskClosureModel.descendant_id == TaskModel.id)
+        .where(TaskClosureModel.ancestor_id == task_id)
+        .where(TaskClosureModel.depth > 0)
+        .order_by(TaskClosureModel.depth, TaskModel.id)
+    )
+    return [Task.model_validate(child) for child in result.scalars().all()]
 
 
 async def get_ancestors(session: AsyncSession, task_id: str) -> list[Task]:
@@ -290,22 +331,47 @@ async def get_ancestors(session: AsyncSession, task_id: str) -> list[Task]:
     Returns:
         List of ancestor tasks from nearest to farthest (parent first, project last)
     """
-    ancestors = []
-    current_id = task_id
+    result = await session.execute(
+        select(TaskModel)
+        .join(TaskClosureModel, TaskClosureModel.ancestor_id == TaskModel.id)
+        .where(TaskClosureModel.descendant_id == task_id)
+        .where(TaskClosureModel.depth > 0)
+        .order_by(TaskClosureModel.depth)
+    )
+    return [Task.model_validate(ancestor) for ancestor in result.scalars().all()]
 
-    while True:
-        task_model = await session.get(TaskModel, current_id)
-        if not task_model or not task_model.parent_id:
-            break
 
-        parent_model = await session.get(TaskModel, task_model.parent_id)
-        if not parent_model:
-            break
+async def backfill_task_closure(session: AsyncSession, project_id: str | None = None) -> None:
+    """
+    Insert missing closure rows in one statement.
 
-        ancestors.append(Task.model_validate(parent_model))
-        current_id = parent_model.id
+    Used after bulk task creation (create_task with update_closure=False).
+    Existing rows are left untouched. Does not commit.
 
-    return ancestors
+    Args:
+        session: Database session
+        project_id: Only backfill tasks of this project (None = every task)
+    """
+    project_filter = "WHERE project_id = :project_id" if project_id else ""
+    await session.execute(
+        text(f"""
+            WITH RECURSIVE chain AS (
+                SELECT id AS ancestor_id, id AS descendant_id, parent_id, 0 AS depth
+                FROM tasks
+                {project_filter}
+
+                UNION ALL
+
+                SELECT t.id, c.descendant_id, t.parent_id, c.depth + 1
+                FROM chain c
+                JOIN tasks t ON t.id = c.parent_id
+            )
+            INSERT INTO task_closure (ancestor_id, descendant_id, depth)
+            SELECT ancestor_id, descendant_id, depth FROM chain
+            ON CONFLICT DO NOTHING
+        """),
+        {"project_id": project_id} if project_id else {},
+    )
 
 
 async def add_comment(
@@ -2,12 +2,23 @@
 Validation service for the Learning Task Tracker.
 
 Validates submissions against acceptance criteria and gates task closure.
+
+Verdicts are reused for resubmitted content: a learner's earlier verdict for
+the same content hash and validator version is copied instead of running
+the validator again, and verdicts of deterministic validators are cached
+per task across learners. A validator run that ended without a verdict
+(ValidatorInfrastructureError) is recorded as a failure but never reused.
 """
 
-from sqlalchemy import select
+import hashlib
+import json
+from collections import OrderedDict
+
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ltt.models import (
+    LearnerTaskProgressModel,
     SubmissionModel,
     TaskModel,
     TaskType,
@@ -15,9 +26,17 @@ from ltt.models import (
     ValidationModel,
     ValidatorType,
 )
-from ltt.services.validators import SimpleValidator
+from ltt.services.progress_rollup import apply_passing_validation
+from ltt.services.submission_service import hash_content
+from ltt.services.validators import Validator, ValidatorInfrastructureError, get_validator
 from ltt.utils.ids import PREFIX_VALIDATION, generate_entity_id
 
+# Upper bound on cached verdicts (oldest entries are evicted first)
+MAX_CACHED_VERDICTS = 4096
+
+# (passed, error_message, grade, feedback)
+Verdict = tuple[bool, str | None, float | None, str | None]
+
 # ============================================================================
 # Exceptions
 # ============================================================================
@@ -48,8 +67,8 @@ async def validate_submission(
     """
     Validate a submission against task acceptance criteria.
 
-    For MVP, uses SimpleValidator (non-empty check).
-    In production, this would dispatch to appropriate validators.
+    Dispatches to the validator registered for the submission type and the
+    task's subtask type (default: SimpleValidator, a non-empty check).
 
     Args:
         session: Database session
@@ -62,7 +81,7 @@ async def validate_submission(
     Raises:
         SubmissionNotFoundError: If submission doesn't exist
     """
-    # 1. Load submission and task
+    # Load submission and task
     submission_result = await session.execute(
         select(SubmissionModel).where(SubmissionModel.id == submission_id)
     )
@@ -74,33 +93,175 @@ async def validate_submission(
     task_result = await session.execute(select(TaskModel).where(TaskModel.id == submission.task_id))
     task = task_result.scalar_one_or_none()
 
-    # 2. Run validation using SimpleValidator for MVP
-    validator = SimpleValidator()
-    passed, error_message = await validator.validate(
-        content=submission.content,
-        acceptance_criteria=task.acceptance_criteria if task else "",
-        submission_type=submission.submission_type,
-    )
+    validation = await apply_validation(session, submission, task, validator_type)
+
+    await session.commit()
+
+    return Validation.model_validate(validation)
+
+
+async def apply_validation(
+    session: AsyncSession,
+    submission: SubmissionModel,
+    task: TaskModel | None,
+    validator_type: ValidatorType = ValidatorType.AUTOMATED,
+) -> ValidationModel:
+    """
+    Validate a loaded submission and insert the result without committing.
 
-    # 3. Create validation record with grade
+    Resubmitted content reuses an earlier verdict instead of running the
+    validator. The learner's progress row points at the new verdict, and a
+    passing result is counted in the learner's project rollup. A validator
+    infrastructure error is stored as a failed validation without a
+    validator version, so the next submission runs the validator again.
+
+    Args:
+        session: Database session
+        submission: Submission to validate
+        task: The submission's task
+        validator_type: Who/what is validating
+
+    Returns:
+        Inserted validation row
+    """
+    validator = get_validator(submission.submission_type, task.subtask_type if task else None)
+    version = _verdict_version(validator, submission, task)
+    content_hash = submission.content_hash or hash_content(submission.content)
+
+    verdict = await _reusable_verdict(session, submission, validator, version, content_hash)
+    if verdict is None:
+        # Run the validator registered for this submission (pooled validators
+        # execute off the event loop)
+        try:
+            passed, error_message = await validator.validate(
+                content=submission.content,
+                acceptance_criteria=task.acceptance_criteria if task else "",
+                submission_type=submission.submission_type,
+                checks=task.checks if task else None,
+            )
+        except ValidatorInfrastructureError as e:
+            # Stored without a version so _reusable_verdict never matches it
+            verdict = (False, str(e), 0.0, str(e))
+            version = None
+        else:
+            verdict = (
+                passed,
+                error_message,
+                1.0 if passed else 0.0,
+                validator.describe_pass(task.checks if task else None) if passed else error_message,
+            )
+            if validator.deterministic:
+                _cache_verdict((submission.task_id, version, content_hash), verdict)
+
+    passed, error_message, grade, feedback = verdict
+
+    # Create validation record with grade
     validation_id = generate_entity_id(PREFIX_VALIDATION)
-    validation = ValidationModel(
-        id=validation_id,
-        submission_id=submission_id,
-        task_id=submission.task_id,
-        passed=passed,
-        error_message=error_message,
-        validator_type=validator_type.value,
-        grade=1.0 if passed else 0.0,
-        grader_type="auto",
-        feedback="Passed: non-empty submission" if passed else error_message,
+    result = await session.scalars(
+        insert(ValidationModel)
+        .values(
+            id=validation_id,
+            submission_id=submission.id,
+            task_id=submission.task_id,
+            passed=passed,
+            error_message=error_message,
+            validator_type=validator_type.value,
+            grade=grade,
+            grader_type="auto",
+            feedback=feedback,
+            validator_version=version,
+        )
+        .returning(ValidationModel)
     )
-    session.add(validation)
+    validation = result.one()
 
-    await session.commit()
-    await session.refresh(validation)
+    await _record_latest_validation(session, submission, passed, error_message)
+    if passed and task:
+        await apply_passing_validation(session, submission.learner_id, task.project_id, task.id)
 
-    return Validation.model_validate(validation)
+    return validation
+
+
+def clear_verdict_cache() -> None:
+    """Drop every cached cross-learner verdict."""
+    _verdicts.clear()
+
+
+_verdicts: OrderedDict[tuple[str, str, str], Verdict] = OrderedDict()
+
+
+def _verdict_version(validator: Validator, submission: SubmissionModel, task: TaskModel | None) -> str:
+    """Fingerprint of the validator and every task input that affects its verdict."""
+    inputs = json.dumps(
+        [
+            submission.submission_type,
+            task.subtask_type if task else None,
+            task.acceptance_criteria if task else "",
+            task.checks if task else None,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(inputs.encode()).hexdigest()[:16]
+    return f"{type(validator).__name__}:{validator.version}:{digest}"
+
+
+async def _reusable_verdict(
+    session: AsyncSession,
+    submission: SubmissionModel,
+    validator: Validator,
+    version: str,
+    content_hash: str,
+) -> Verdict | None:
+    """Find a verdict for the same content and validator version, if any."""
+    if validator.deterministic:
+        key = (submission.task_id, version, content_hash)
+        verdict = _verdicts.get(key)
+        if verdict is not None:
+            _verdicts.move_to_end(key)
+            return verdict
+
+    result = await session.execute(
+        select(
+            ValidationModel.passed,
+            ValidationModel.error_message,
+            ValidationModel.grade,
+            ValidationModel.feedback,
+        )
+        .join(SubmissionModel, SubmissionModel.id == ValidationModel.submission_id)
+        .where(SubmissionModel.task_id == submission.task_id)
+        .where(SubmissionModel.learner_id == submission.learner_id)
+        .where(SubmissionModel.content_hash == content_hash)
+        .where(ValidationModel.validator_version == version)
+        .order_by(ValidationModel.validated_at.desc())
+        .limit(1)
+    )
+    row = result.one_or_none()
+    return tuple(row) if row is not None else None
+
+
+async def _record_latest_validation(
+    session: AsyncSession, submission: SubmissionModel, passed: bool, error_message: str | None
+) -> None:
+    """Point the learner's progress row at a new validation."""
+    table = LearnerTaskProgressModel
+    await session.execute(
+        update(table)
+        .where(table.task_id == submission.task_id, table.learner_id == submission.learner_id)
+        .values(
+            latest_submission_id=submission.id,
+            latest_validation_passed=passed,
+            latest_validation_error=error_message,
+            updated_at=func.now(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _cache_verdict(key: tuple[str, str, str], verdict: Verdict) -> None:
+    _verdicts[key] = verdict
+    while len(_verdicts) > MAX_CACHED_VERDICTS:
+        _verdicts.popitem(last=False)
 
 
 async def get_validation(
@@ -163,7 +324,7 @@ async def get_latest_validation(
     """
     Get the latest validation for a task/learner.
 
-    Used to determine if task can be closed.
+    Follows the latest-submission pointer on the learner's progress row.
 
     Args:
         session: Database session
@@ -175,9 +336,12 @@ async def get_latest_validation(
     """
     result = await session.execute(
         select(ValidationModel)
-        .join(SubmissionModel)
-        .where(SubmissionModel.task_id == task_id)
-        .where(SubmissionModel.learner_id == learner_id)
+        .join(
+            LearnerTaskProgressModel,
+            LearnerTaskProgressModel.latest_submission_id == ValidationModel.submission_id,
+        )
+        .where(LearnerTaskProgressModel.task_id == task_id)
+        .where(LearnerTaskProgressModel.learner_id == learner_id)
         .order_by(ValidationModel.validated_at.desc())
         .limit(1)
     )
@@ -236,17 +400,50 @@ async def can_close_task(
     if not _get_requires_submission(task):
         return True, ""
 
-    # Task requires submission - check for passing validation
-    latest_validation = await get_latest_validation(session, task_id, learner_id)
+    # Task requires submission - check the latest validation on the progress row
+    result = await session.execute(
+        select(
+            LearnerTaskProgressModel.latest_validation_passed,
+            LearnerTaskProgressModel.latest_validation_error,
+        ).where(
+            LearnerTaskProgressModel.task_id == task_id,
+            LearnerTaskProgressModel.learner_id == learner_id,
+        )
+    )
+    latest = result.one_or_none()
 
-    if latest_validation is None:
-        return False, "No submission found. Submit your work before closing."
+    if latest is None:
+        reason = close_requirement_error(True, None, None)
+    else:
+        reason = close_requirement_error(True, *latest)
+    return not reason, reason
 
-    if not latest_validation.passed:
-        error = latest_validation.error_message or "Validation failed"
-        return False, f"Validation failed: {error}"
 
-    return True, ""
+def close_requirement_error(
+    requires_submission: bool, validation_passed: bool | None, error_message: str | None
+) -> str:
+    """
+    Apply the submission rule for closing a task.
+
+    Args:
+        requires_submission: Whether the task requires a passing submission
+        validation_passed: Result of the latest validation (None = no submission)
+        error_message: Error message of the latest validation
+
+    Returns:
+        Empty string if the task can close, otherwise the reason it cannot
+    """
+    if not requires_submission:
+        return ""
+
+    if validation_passed is None:
+        return "No submission found. Submit your work before closing."
+
+    if not validation_passed:
+        error = error_message or "Validation failed"
+        return f"Validation failed: {error}"
+
+    return ""
 
 
 async def create_manual_validation(
@@ -297,6 +494,12 @@ async def create_manual_validation(
         feedback=feedback,
     )
     session.add(validation)
+    await session.flush()
+
+    await _record_latest_validation(session, submission, passed, error_message)
+    if passed:
+        task = await session.get(TaskModel, submission.task_id)
+        await apply_passing_validation(session, submission.learner_id, task.project_id, task.id)
 
     await session.commit()
     await session.refresh(validation)
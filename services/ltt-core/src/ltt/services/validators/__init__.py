@@ -5,6 +5,25 @@ Pluggable validation strategies for different submission types.
 """
 
 from .base import Validator
+from .pool import (
+    PooledValidator,
+    ValidatorInfrastructureError,
+    run_in_pool,
+    shutdown_validator_pool,
+)
+from .registry import get_validator, register_validator, unregister_validator
 from .simple import SimpleValidator
+from .sql import SQLResultValidator
 
-__all__ = ["Validator", "SimpleValidator"]
+__all__ = [
+    "Validator",
+    "SimpleValidator",
+    "PooledValidator",
+    "SQLResultValidator",
+    "ValidatorInfrastructureError",
+    "run_in_pool",
+    "shutdown_validator_pool",
+    "get_validator",
+    "register_validator",
+    "unregister_validator",
+]
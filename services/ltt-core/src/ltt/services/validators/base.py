@@ -13,12 +13,36 @@ class Validator(ABC):
     and return pass/fail results with optional error messages.
     """
 
+    # Bump when the same input may get a different verdict; stored verdicts
+    # from another version are not reused
+    version: str = "1"
+
+    # Same content, criteria and checks always get the same verdict, so the
+    # verdict can be shared across learners
+    deterministic: bool = False
+
+    # Feedback stored with a passing verdict
+    pass_feedback: str = "Passed"
+
+    def describe_pass(self, checks: list[dict] | None = None) -> str:
+        """
+        Feedback for a passing verdict, telling the learner what was checked.
+
+        Args:
+            checks: Task's automated result checks, if any
+
+        Returns:
+            Feedback text (``pass_feedback`` unless overridden)
+        """
+        return self.pass_feedback
+
     @abstractmethod
     async def validate(
         self,
         content: str,
         acceptance_criteria: str,
         submission_type: str,
+        checks: list[dict] | None = None,
     ) -> tuple[bool, str | None]:
         """
         Validate submission content against acceptance criteria.
@@ -27,6 +51,7 @@ class Validator(ABC):
             content: The submission content to validate
             acceptance_criteria: Task's acceptance criteria
             submission_type: Type of submission (code, sql, text, etc.)
+            checks: Task's automated result checks, if any
 
         Returns:
             (passed, error_message)
@@ -0,0 +1,264 @@
+"""
+Process-pool execution for CPU-heavy validators.
+
+Validators that execute learner code or SQL subclass PooledValidator and
+implement a synchronous ``check``. It runs in a bounded pool of worker
+processes so it never blocks the event loop serving other learners. Each
+pool thread drives one long-lived worker process over a pipe, so a check
+only ever occupies its own worker. Each worker has an address-space limit,
+and each check has a time limit enforced inside the worker (SIGALRM) with a
+wall-clock backstop in the caller. A worker that misses the backstop or
+dies is killed and replaced on its next check; checks running in other
+workers are unaffected.
+
+A check that could not produce a verdict (time or memory limit hit, worker
+crashed) raises ValidatorInfrastructureError instead of returning one: the
+outcome depends on load, not only on the submission, so it must not be
+cached or reused like a verdict.
+
+Pool size and limits come from LTT_VALIDATOR_* settings.
+"""
+
+import asyncio
+import multiprocessing
+import signal
+import threading
+from abc import abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+
+from ltt_settings import get_settings
+
+from .base import Validator
+
+# Extra wall-clock time the caller waits beyond the in-worker limit
+_BACKSTOP_GRACE_SECONDS = 2.0
+
+CheckResult = tuple[bool, str | None]
+
+# Threads waiting on worker processes, one worker per thread
+_executor: ThreadPoolExecutor | None = None
+_workers: set["_Worker"] = set()
+_workers_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+class ValidatorInfrastructureError(Exception):
+    """A pooled check ended without a verdict (limit hit or worker crashed)."""
+
+
+class PooledValidator(Validator):
+    """
+    Validator whose check runs in the validator process pool.
+
+    Subclasses implement ``check``; instances must be picklable (defined at
+    module level, holding only plain data).
+    """
+
+    # Per-check time limit in seconds (None = LTT_VALIDATOR_TIMEOUT_SECONDS)
+    timeout: float | None = None
+
+    @abstractmethod
+    def check(
+        self,
+        content: str,
+        acceptance_criteria: str,
+        submission_type: str,
+        checks: list[dict] | None = None,
+    ) -> CheckResult:
+        """
+        Validate synchronously inside a worker process.
+
+        Args:
+            content: The submission content to validate
+            acceptance_criteria: Task's acceptance criteria
+            submission_type: Type of submission
+            checks: Task's automated result checks, if any
+
+        Returns:
+            (passed, error_message)
+        """
+
+    async def validate(
+        self,
+        content: str,
+        acceptance_criteria: str,
+        submission_type: str,
+        checks: list[dict] | None = None,
+    ) -> CheckResult:
+        """Run ``check`` in the process pool."""
+        return await run_in_pool(
+            self.check, content, acceptance_criteria, submission_type, checks, timeout=self.timeout
+        )
+
+
+async def run_in_pool(
+    fn: Callable[..., CheckResult], *args, timeout: float | None = None
+) -> CheckResult:
+    """
+    Run a picklable check function in the validator process pool.
+
+    Args:
+        fn: Check function returning (passed, error_message)
+        *args: Arguments for fn
+        timeout: Time limit in seconds (None = LTT_VALIDATOR_TIMEOUT_SECONDS)
+
+    Returns:
+        (passed, error_message)
+
+    Raises:
+        ValidatorInfrastructureError: If the check timed out, ran out of
+            memory or its worker crashed
+    """
+    settings = get_settings()
+    if timeout is None:
+        timeout = settings.validator_timeout_seconds
+
+    loop = asyncio.get_running_loop()
+    ok, value = await loop.run_in_executor(
+        _get_executor(), _run_in_worker, fn, args, timeout, settings.validator_memory_limit_mb
+    )
+    if not ok:
+        raise value
+    return value
+
+
+def shutdown_validator_pool() -> None:
+    """Stop the validator worker processes (call at application shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    with _workers_lock:
+        workers = list(_workers)
+    for worker in workers:
+        worker.stop()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=get_settings().validator_pool_workers,
+            thread_name_prefix="validator",
+        )
+    return _executor
+
+
+class _Worker:
+    """A validator process driven by one pool thread."""
+
+    def __init__(self, memory_limit_mb: int):
+        # Forking a process that runs an event loop and DB pools is unsafe
+        context = multiprocessing.get_context("spawn")
+        self.connection, child = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child, memory_limit_mb), daemon=True
+        )
+        self.process.start()
+        child.close()
+        with _workers_lock:
+            _workers.add(self)
+
+    @property
+    def alive(self) -> bool:
+        # A killed process can briefly still look alive; its pipe is closed at once
+        return not self.connection.closed and self.process.is_alive()
+
+    def stop(self) -> None:
+        """Kill the process; a check running in it fails as crashed."""
+        with _workers_lock:
+            _workers.discard(self)
+        self.process.kill()
+        self.connection.close()
+
+
+def _run_in_worker(
+    fn: Callable[..., CheckResult], args: tuple, timeout: float, memory_limit_mb: int
+) -> tuple[bool, object]:
+    """
+    Run one check in this thread's worker process (called in a pool thread).
+
+    Returns:
+        (True, result) or (False, exception raised by the check)
+    """
+    worker: _Worker | None = getattr(_thread_state, "worker", None)
+    if worker is None or not worker.alive:
+        worker = _thread_state.worker = _Worker(memory_limit_mb)
+
+    try:
+        worker.connection.send((fn, args, timeout))
+        if not worker.connection.poll(timeout + _BACKSTOP_GRACE_SECONDS):
+            # Stuck past the in-worker limit: only this worker is recycled
+            worker.stop()
+            return False, ValidatorInfrastructureError(f"Validation timed out after {timeout:g}s")
+        return worker.connection.recv()
+    except (EOFError, OSError):
+        worker.stop()
+        return False, ValidatorInfrastructureError(
+            "Validation failed: the validator process crashed"
+        )
+
+
+# ============================================================================
+# Worker side
+# ============================================================================
+
+
+class _CheckTimeout(Exception):
+    pass
+
+
+def _init_worker(memory_limit_mb: int) -> None:
+    """Apply the address-space limit to a new worker process."""
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _worker_main(connection: Connection, memory_limit_mb: int) -> None:
+    """Run checks sent over the pipe until it is closed."""
+    _init_worker(memory_limit_mb)
+    while True:
+        try:
+            fn, args, timeout = connection.recv()
+        except EOFError:
+            return
+        try:
+            reply = (True, _run_with_limits(fn, args, timeout))
+        except Exception as e:
+            reply = (False, e)
+        try:
+            connection.send(reply)
+        except Exception as e:
+            # The result or exception could not be pickled
+            connection.send((False, RuntimeError(f"Validator returned an unpicklable result: {e}")))
+
+
+def _raise_timeout(signum, frame) -> None:
+    raise _CheckTimeout
+
+
+def _run_with_limits(
+    fn: Callable[..., CheckResult], args: tuple, timeout: float
+) -> CheckResult:
+    """Run one check in a worker, turning limit violations into infrastructure errors."""
+    use_alarm = hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return fn(*args)
+    except _CheckTimeout:
+        raise ValidatorInfrastructureError(f"Validation timed out after {timeout:g}s") from None
+    except MemoryError:
+        raise ValidatorInfrastructureError("Validation exceeded the memory limit") from None
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
@@ -0,0 +1,74 @@
+"""
+Validator registry.
+
+Maps submission types and subtask types to validators. Lookup is most
+specific first: (submission_type, subtask_type), then subtask_type, then
+submission_type, then the built-in validator for the submission type,
+then the default SimpleValidator.
+"""
+
+from ltt.models import SubmissionType
+
+from .base import Validator
+from .simple import SimpleValidator
+from .sql import SQLResultValidator
+
+_DEFAULT = SimpleValidator()
+
+# Built-in validators per submission type, used when nothing is registered
+_BUILTIN: dict[str, Validator] = {
+    SubmissionType.SQL.value: SQLResultValidator(),
+}
+
+_validators: dict[tuple[str | None, str | None], Validator] = {}
+
+
+def register_validator(
+    validator: Validator,
+    submission_type: str | None = None,
+    subtask_type: str | None = None,
+) -> None:
+    """
+    Register a validator for a submission type and/or subtask type.
+
+    Registering the same key again replaces the previous validator.
+
+    Args:
+        validator: Validator instance (shared across requests)
+        submission_type: SubmissionType value to handle (None = any)
+        subtask_type: Task subtask_type to handle (None = any)
+
+    Raises:
+        ValueError: If neither key is given
+    """
+    if submission_type is None and subtask_type is None:
+        raise ValueError("register_validator needs a submission_type or subtask_type")
+    _validators[(submission_type, subtask_type)] = validator
+
+
+def unregister_validator(submission_type: str | None = None, subtask_type: str | None = None) -> None:
+    """Remove a registered validator (no-op if none is registered)."""
+    _validators.pop((submission_type, subtask_type), None)
+
+
+def get_validator(submission_type: str, subtask_type: str | None = None) -> Validator:
+    """
+    Find the validator for a submission.
+
+    Args:
+        submission_type: The submission's SubmissionType value
+        subtask_type: The task's subtask_type
+
+    Returns:
+        Most specific registered validator, else the built-in validator for
+        the submission type, else the default SimpleValidator
+    """
+    for key in (
+        (submission_type, subtask_type),
+        (None, subtask_type),
+        (submission_type, None),
+    ):
+        validator = _validators.get(key)
+        if validator is not None:
+            return validator
+    return _BUILTIN.get(submission_type, _DEFAULT)
@@ -18,11 +18,16 @@ class SimpleValidator(Validator):
     - Check outputs against expected results
     """
 
+    deterministic = True
+
+    pass_feedback = "Passed: non-empty submission"
+
     async def validate(
         self,
         content: str,
         acceptance_criteria: str,
         submission_type: str,
+        checks: list[dict] | None = None,
     ) -> tuple[bool, str | None]:
         """
         Validate that submission content is non-empty.
@@ -31,6 +36,7 @@ class SimpleValidator(Validator):
             content: The submission content
             acceptance_criteria: Task's acceptance criteria (ignored for now)
             submission_type: Type of submission (ignored for now)
+            checks: Result checks (ignored)
 
         Returns:
             (passed, error_message)
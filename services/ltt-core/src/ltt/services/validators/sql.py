@@ -0,0 +1,259 @@
+"""
+SQL result-set validator.
+
+Runs the learner's query against an in-memory SQLite copy of the project
+dataset and compares its result with the result of each of the task's
+checks. A check is ``{"query": <reference query>, "expect": {...}}``;
+``expect`` may constrain the result further:
+
+- ``row_count``: exact number of rows
+- ``min_rows``: minimum number of rows
+- ``columns``: expected column names (case-insensitive, in order)
+- ``match_reference``: compare rows with the reference result (default true)
+
+Rows are compared in order when the reference query has an ORDER BY and as
+a multiset otherwise. Floats are rounded before comparing.
+
+Checks run in the validator process pool. Each worker loads the dataset
+once into a read-only in-memory database and caches reference results by a
+hash of the reference query, so a task's reference is computed once per
+worker rather than per submission.
+"""
+
+import hashlib
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+from ltt_settings import get_settings
+
+from .pool import CheckResult, PooledValidator
+from .simple import SimpleValidator
+
+# Digits kept when comparing REAL values
+_FLOAT_PRECISION = 6
+
+# SQLite VM instructions between time-limit checks
+_PROGRESS_INTERVAL = 10_000
+
+_ORDER_BY = re.compile(r"\border\s+by\b", re.IGNORECASE)
+
+# Authorizer actions a learner query may perform
+_ALLOWED_ACTIONS = {
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_RECURSIVE,
+}
+
+
+class SQLResultValidator(PooledValidator):
+    """
+    Validates SQL submissions by running them against the project dataset.
+
+    Tasks without checks, or deployments without a dataset, fall back to the
+    non-empty check of SimpleValidator.
+    """
+
+    # The dataset is a fixed snapshot, so verdicts only depend on the inputs
+    deterministic = True
+
+    pass_feedback = "Query results match the expected results"
+
+    def __init__(
+        self,
+        dataset_path: str | None = None,
+        max_rows: int | None = None,
+        query_timeout: float | None = None,
+    ):
+        """
+        Args:
+            dataset_path: SQL script with the dataset (None = LTT_SQL_DATASET_PATH)
+            max_rows: Row cap per query (None = LTT_SQL_MAX_ROWS)
+            query_timeout: Time limit per query in seconds
+                (None = LTT_SQL_QUERY_TIMEOUT_SECONDS)
+        """
+        self.dataset_path = dataset_path
+        self.max_rows = max_rows
+        self.query_timeout = query_timeout
+
+    async def validate(
+        self,
+        content: str,
+        acceptance_criteria: str,
+        submission_type: str,
+        checks: list[dict] | None = None,
+    ) -> CheckResult:
+        """Run result checks in the pool; skip the pool when there are none."""
+        if not checks:
+            return await SimpleValidator().validate(content, acceptance_criteria, submission_type)
+        return await super().validate(content, acceptance_criteria, submission_type, checks)
+
+    def describe_pass(self, checks: list[dict] | None = None) -> str:
+        """Say that the result checks ran, unless only the non-empty check did."""
+        if not checks or self._dataset_path() is None:
+            return SimpleValidator.pass_feedback
+        return self.pass_feedback
+
+    def check(
+        self,
+        content: str,
+        acceptance_criteria: str,
+        submission_type: str,
+        checks: list[dict] | None = None,
+    ) -> CheckResult:
+        """Run the learner query and compare it with every check."""
+        settings = get_settings()
+        dataset_path = self._dataset_path()
+        max_rows = self.max_rows or settings.sql_max_rows
+        query_timeout = self.query_timeout or settings.sql_query_timeout_seconds
+
+        if not content or not content.strip():
+            return False, "Submission is empty"
+        if not checks or dataset_path is None:
+            return True, None
+
+        connection = _get_connection(dataset_path)
+
+        try:
+            columns, rows = _run_query(connection, content, query_timeout, max_rows)
+        except _QueryError as e:
+            return False, f"Your query failed: {e}"
+
+        for check in checks:
+            expect = check.get("expect") or {}
+            error = _check_expectations(columns, rows, expect)
+            if error:
+                return False, error
+
+            if not expect.get("match_reference", True):
+                continue
+
+            try:
+                reference = _get_reference(connection, dataset_path, check["query"], query_timeout, max_rows)
+            except _QueryError as e:
+                return False, f"The reference query for this task failed: {e}"
+
+            error = _compare(columns, rows, reference, ordered=bool(_ORDER_BY.search(check["query"])))
+            if error:
+                return False, error
+
+        return True, None
+
+    def _dataset_path(self) -> str | None:
+        """The dataset script, if one is configured and present."""
+        dataset_path = self.dataset_path or get_settings().sql_dataset_path
+        if not dataset_path or not Path(dataset_path).is_file():
+            return None
+        return dataset_path
+
+
+# ============================================================================
+# Worker side
+# ============================================================================
+
+
+class _QueryError(Exception):
+    pass
+
+
+# Read-only dataset snapshots, one per dataset path, per worker process
+_connections: dict[str, sqlite3.Connection] = {}
+
+# Reference results keyed by hash of (dataset path, reference query)
+_references: dict[str, tuple[list[str], list[tuple]]] = {}
+
+
+def _get_connection(dataset_path: str) -> sqlite3.Connection:
+    """Return this worker's read-only in-memory copy of a dataset."""
+    connection = _connections.get(dataset_path)
+    if connection is None:
+        connection = sqlite3.connect(":memory:")
+        connection.executescript(Path(dataset_path).read_text())
+        connection.execute("PRAGMA query_only = ON")
+        connection.set_authorizer(_authorize)
+        _connections[dataset_path] = connection
+    return connection
+
+
+def _authorize(action, arg1, arg2, db_name, trigger) -> int:
+    return sqlite3.SQLITE_OK if action in _ALLOWED_ACTIONS else sqlite3.SQLITE_DENY
+
+
+def _get_reference(
+    connection: sqlite3.Connection,
+    dataset_path: str,
+    query: str,
+    query_timeout: float,
+    max_rows: int,
+) -> tuple[list[str], list[tuple]]:
+    key = hashlib.sha256(f"{dataset_path}\0{query}".encode()).hexdigest()
+    reference = _references.get(key)
+    if reference is None:
+        reference = _run_query(connection, query, query_timeout, max_rows)
+        _references[key] = reference
+    return reference
+
+
+def _run_query(
+    connection: sqlite3.Connection, query: str, query_timeout: float, max_rows: int
+) -> tuple[list[str], list[tuple]]:
+    """Run one statement with a time limit and row cap; return (columns, rows)."""
+    deadline = time.monotonic() + query_timeout
+    connection.set_progress_handler(lambda: time.monotonic() > deadline, _PROGRESS_INTERVAL)
+    try:
+        cursor = connection.execute(query)
+        rows = cursor.fetchmany(max_rows + 1)
+    except sqlite3.Error as e:
+        if time.monotonic() > deadline:
+            raise _QueryError(f"timed out after {query_timeout:g}s") from e
+        raise _QueryError(str(e)) from e
+    except sqlite3.Warning as e:  # Raised for multiple statements
+        raise _QueryError(str(e)) from e
+    finally:
+        connection.set_progress_handler(None, 0)
+
+    if cursor.description is None:
+        raise _QueryError("query did not return rows")
+    if len(rows) > max_rows:
+        raise _QueryError(f"returned more than {max_rows} rows")
+
+    columns = [column[0] for column in cursor.description]
+    return columns, [_normalize(row) for row in rows]
+
+
+def _normalize(row: tuple) -> tuple:
+    return tuple(round(value, _FLOAT_PRECISION) if isinstance(value, float) else value for value in row)
+
+
+def _check_expectations(columns: list[str], rows: list[tuple], expect: dict) -> str | None:
+    if "row_count" in expect and len(rows) != expect["row_count"]:
+        return f"Your query returned {len(rows)} rows; expected {expect['row_count']}"
+    if "min_rows" in expect and len(rows) < expect["min_rows"]:
+        return f"Your query returned {len(rows)} rows; expected at least {expect['min_rows']}"
+    if "columns" in expect:
+        expected = [name.lower() for name in expect["columns"]]
+        if [name.lower() for name in columns] != expected:
+            return f"Your query returned columns {columns}; expected {expect['columns']}"
+    return None
+
+
+def _compare(
+    columns: list[str],
+    rows: list[tuple],
+    reference: tuple[list[str], list[tuple]],
+    ordered: bool,
+) -> str | None:
+    expected_columns, expected_rows = reference
+    if len(columns) != len(expected_columns):
+        return f"Your query returned {len(columns)} columns; expected {len(expected_columns)}"
+    if len(rows) != len(expected_rows):
+        return f"Your query returned {len(rows)} rows; expected {len(expected_rows)}"
+    if ordered:
+        matches = rows == expected_rows
+    else:
+        matches = sorted(rows, key=repr) == sorted(expected_rows, key=repr)
+    if not matches:
+        return "Your query's results do not match the expected results"
+    return None
@@ -12,9 +12,23 @@ Usage:
 
     # Execute a tool
     result = await execute_tool("get_ready", {"project_id": "proj-123"}, learner_id, session)
+
+    # Execute the tool calls of one agent message (reads run concurrently)
+    results = await execute_tools_batch(
+        [("show_task", {"task_id": "proj-123.1"}), ("get_comments", {"task_id": "proj-123.1"})],
+        learner_id,
+        session_factory,
+    )
+
+    # Share lookups across the tool calls of one agent turn
+    with tool_loader_scope(learner_id):
+        ...
 """
 
-from collections.abc import Callable
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager, AsyncExitStack
 from dataclasses import dataclass
 
 from pydantic import BaseModel, ValidationError
@@ -27,6 +41,14 @@ from ltt.services.task_service import TaskNotFoundError
 from ltt.services.validation_service import ValidationNotFoundError
 from ltt.tools.control import go_back, request_help
 from ltt.tools.feedback import add_comment, get_comments
+from ltt.tools.loader import ToolLoader, current_tool_loader, tool_loader_scope
+from ltt.tools.metrics import (
+    ToolCallMetrics,
+    add_tool_metrics_sink,
+    remove_tool_metrics_sink,
+    render_prometheus,
+    track_tool_call,
+)
 from ltt.tools.navigation import get_context, get_ready, show_task
 from ltt.tools.progress import start_task, submit
 from ltt.tools.schemas import (
@@ -51,6 +73,8 @@ from ltt.tools.schemas import (
     ToolError,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ToolDefinition:
@@ -62,6 +86,8 @@ class ToolDefinition:
     output_model: type[BaseModel]
     handler: Callable
     requires_learner: bool = True  # Most tools need learner_id
+    uses_loader: bool = False  # Handler takes the turn's ToolLoader
+    read_only: bool = False  # Handler never writes; safe to run concurrently
 
 
 TOOLS: dict[str, ToolDefinition] = {
@@ -71,6 +97,7 @@ TOOLS: dict[str, ToolDefinition] = {
         input_model=GetReadyInput,
         output_model=GetReadyOutput,
         handler=get_ready,
+        read_only=True,
     ),
     "show_task": ToolDefinition(
         name="show_task",
@@ -78,6 +105,8 @@ TOOLS: dict[str, ToolDefinition] = {
         input_model=ShowTaskInput,
         output_model=TaskDetailOutput,
         handler=show_task,
+        uses_loader=True,
+        read_only=True,
     ),
     "get_context": ToolDefinition(
         name="get_context",
@@ -85,6 +114,8 @@ TOOLS: dict[str, ToolDefinition] = {
         input_model=GetContextInput,
         output_model=GetContextOutput,
         handler=get_context,
+        uses_loader=True,
+        read_only=True,
     ),
     "start_task": ToolDefinition(
         name="start_task",
@@ -92,6 +123,7 @@ TOOLS: dict[str, ToolDefinition] = {
         input_model=StartTaskInput,
         output_model=StartTaskOutput,
         handler=start_task,
+        uses_loader=True,
     ),
     "submit": ToolDefinition(
         name="submit",
@@ -99,6 +131,7 @@ TOOLS: dict[str, ToolDefinition] = {
         input_model=SubmitInput,
         output_model=SubmitOutput,
         handler=submit,
+        uses_loader=True,
     ),
     "add_comment": ToolDefinition(
         name="add_comment",
@@ -113,6 +146,7 @@ TOOLS: dict[str, ToolDefinition] = {
         input_model=GetCommentsInput,
         output_model=GetCommentsOutput,
         handler=get_comments,
+        read_only=True,
     ),
     "go_back": ToolDefinition(
         name="go_back",
@@ -120,6 +154,7 @@ TOOLS: dict[str, ToolDefinition] = {
         input_model=GoBackInput,
         output_model=GoBackOutput,
         handler=go_back,
+        uses_loader=True,
     ),
     "request_help": ToolDefinition(
         name="request_help",
@@ -157,11 +192,17 @@ ERROR_CODES = {
 
 
 async def execute_tool(
-    tool_name: str, input_data: dict, learner_id: str, session: AsyncSession
+    tool_name: str,
+    input_data: dict,
+    learner_id: str,
+    session: AsyncSession,
+    loader: ToolLoader | None = None,
 ) -> BaseModel:
     """
     Execute a tool with error handling.
 
+    Each call is measured and reported to the tool metrics sinks.
+
     Note: Session management is handled by LangGraph. Tools only need learner_id.
 
     Args:
@@ -169,6 +210,8 @@ async def execute_tool(
         input_data: Input parameters as dict
         learner_id: Learner ID for scoping
         session: Database session
+        loader: Lookup cache shared by the turn's tool calls
+            (default: the enclosing tool_loader_scope, else a new one)
 
     Returns:
         Tool output or ToolError on failure
@@ -176,8 +219,115 @@ async def execute_tool(
     if tool_name not in TOOLS:
         return ToolError(error_code="UNKNOWN_TOOL", message=f"Unknown tool: {tool_name}")
 
-    tool = TOOLS[tool_name]
+    with track_tool_call(tool_name, learner_id) as call:
+        result = await _run_tool(TOOLS[tool_name], input_data, learner_id, session, loader)
+        if isinstance(result, ToolError):
+            call.error_code = result.error_code
+        call.record_payload(result.model_dump_json())
+    return result
+
+
+async def execute_tools_batch(
+    calls: Sequence[tuple[str, dict]],
+    learner_id: str,
+    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+    loader: ToolLoader | None = None,
+) -> list[BaseModel]:
+    """
+    Execute the tool calls of one agent message.
+
+    Calls keep their order: each run of consecutive read-only calls executes
+    concurrently, each on its own pooled session, and each mutating call
+    executes alone, in order, on one session shared by the batch. A read
+    after a write therefore sees the write. A call that fails outside its
+    tool (e.g. its session cannot be opened) gets an INTERNAL_ERROR result;
+    the other calls are unaffected.
+
+    Args:
+        calls: (tool_name, input_data) pairs in the order the model made them
+        learner_id: Learner ID for scoping
+        session_factory: Returns a context manager yielding a new AsyncSession
+        loader: Lookup cache shared by the calls
+            (default: the enclosing tool_loader_scope, else a new one)
+
+    Returns:
+        One tool output or ToolError per call, in call order
+    """
+    loader = loader or current_tool_loader(learner_id)
+    results: list[BaseModel] = []
+    stack = AsyncExitStack()
+    shared: AsyncSession | None = None
+
+    async def run_read(tool_name: str, input_data: dict) -> BaseModel:
+        try:
+            async with session_factory() as session:
+                return await execute_tool(tool_name, input_data, learner_id, session, loader)
+        except Exception as e:
+            return _internal_error(tool_name, e)
+
+    async def run_write(tool_name: str, input_data: dict) -> BaseModel:
+        nonlocal shared
+        try:
+            if shared is None:
+                shared = await stack.enter_async_context(session_factory())
+            result = await execute_tool(tool_name, input_data, learner_id, shared, loader)
+            if isinstance(result, ToolError):
+                # A failed write may leave the transaction unusable
+                await shared.rollback()
+            return result
+        except Exception as e:
+            # Later writes start over on a new session
+            shared = None
+            return _internal_error(tool_name, e)
+
+    try:
+        for group in _group_calls(calls):
+            if len(group) > 1:
+                results += await asyncio.gather(
+                    *(run_read(tool_name, input_data) for tool_name, input_data in group)
+                )
+            else:
+                results.append(await run_write(*group[0]))
+    finally:
+        try:
+            await stack.aclose()
+        except Exception:
+            # The results are complete; a session failing to close loses none of them
+            logger.exception("Closing a tool batch session failed")
+
+    return results
+
 
+def _internal_error(tool_name: str, error: Exception) -> ToolError:
+    logger.exception("Tool call %s failed", tool_name, exc_info=error)
+    return ToolError(
+        error_code="INTERNAL_ERROR", message=f"An unexpected error occurred: {error!s}"
+    )
+
+
+def _group_calls(calls: Sequence[tuple[str, dict]]) -> list[list[tuple[str, dict]]]:
+    """Split calls into runs of read-only calls and single mutating calls."""
+    groups: list[list[tuple[str, dict]]] = []
+    previous_read_only = False
+    for call in calls:
+        tool = TOOLS.get(call[0])
+        read_only = tool is not None and tool.read_only
+        if read_only and previous_read_only:
+            groups[-1].append(call)
+        else:
+            groups.append([call])
+        previous_read_only = read_only
+    return groups
+
+
+async def _run_tool(
+    tool: ToolDefinition,
+    input_data: dict,
+    learner_id: str,
+    session: AsyncSession,
+    loader: ToolLoader | None,
+) -> BaseModel:
+    """Run a tool's handler, turning known failures into ToolError."""
     try:
         # Parse input
         if tool.input_model:
@@ -186,7 +336,12 @@ async def execute_tool(
             input_obj = None
 
         # Execute
-        result = await tool.handler(input=input_obj, learner_id=learner_id, session=session)
+        kwargs = {}
+        if tool.uses_loader:
+            kwargs["loader"] = loader or current_tool_loader(learner_id)
+        result = await tool.handler(
+            input=input_obj, learner_id=learner_id, session=session, **kwargs
+        )
         return result
 
     except (
@@ -213,8 +368,19 @@ async def execute_tool(
 __all__ = [
     # Core functions
     "execute_tool",
+    "execute_tools_batch",
     "get_tool_schemas",
     "TOOLS",
+    # Per-turn lookup cache
+    "ToolLoader",
+    "tool_loader_scope",
+    "current_tool_loader",
+    # Instrumentation
+    "ToolCallMetrics",
+    "track_tool_call",
+    "add_tool_metrics_sink",
+    "remove_tool_metrics_sink",
+    "render_prometheus",
     # Tool handlers
     "get_ready",
     "show_task",
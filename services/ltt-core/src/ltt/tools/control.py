@@ -12,12 +12,18 @@ Implementation Note (ADR-001):
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ltt.models import CommentCreate, TaskStatus
-from ltt.services.progress_service import get_or_create_progress, reopen_task
+from ltt.services.progress_service import reopen_task
 from ltt.services.task_service import add_comment
+from ltt.tools.loader import ToolLoader, current_tool_loader
 from ltt.tools.schemas import GoBackInput, GoBackOutput, RequestHelpInput, RequestHelpOutput
 
 
-async def go_back(input: GoBackInput, learner_id: str, session: AsyncSession) -> GoBackOutput:
+async def go_back(
+    input: GoBackInput,
+    learner_id: str,
+    session: AsyncSession,
+    loader: ToolLoader | None = None,
+) -> GoBackOutput:
     """
     Reopen a closed task.
 
@@ -29,20 +35,23 @@ async def go_back(input: GoBackInput, learner_id: str, session: AsyncSession) ->
     - Only affects this learner's progress record
     - Other learners' progress is unchanged
     """
-    # Get learner's progress record
-    progress = await get_or_create_progress(session, input.task_id, learner_id)
+    loader = loader or current_tool_loader(learner_id)
 
-    if progress.status != TaskStatus.CLOSED.value:
+    # Get learner's status (read-only, missing = open)
+    status = await loader.get_status(session, input.task_id)
+
+    if status != TaskStatus.CLOSED:
         return GoBackOutput(
             success=False,
             task_id=input.task_id,
-            new_status=progress.status,
-            message=f"Task is not closed (status: {progress.status})",
+            new_status=status.value,
+            message=f"Task is not closed (status: {status.value})",
             reason=input.reason,
         )
 
     # Reopen the task for this learner
     reopened = await reopen_task(session, input.task_id, learner_id)
+    loader.invalidate_learner_state()
 
     return GoBackOutput(
         success=True,
@@ -0,0 +1,204 @@
+"""
+Request-scoped loader for agent tool handlers.
+
+Tool handlers render trees of related tasks (children, blockers, dependents)
+and need each one's status and whether it has children. Loading those per
+item costs a few queries per related task. ToolLoader batches each kind of
+lookup into one query over every missing ID and memoizes the results, so a
+tool call costs a fixed number of queries regardless of fan-out, and later
+tool calls in the same agent turn reuse what earlier ones loaded.
+
+Template data (tasks, children, dependents) is stable for the lifetime of a
+loader. Learner state (statuses, blockers) is dropped by handlers that
+change it via ``invalidate_learner_state``.
+
+One loader covers one learner and one agent turn. ``execute_tool`` creates
+one per call unless a turn opened ``tool_loader_scope``:
+
+    with tool_loader_scope(learner_id):
+        await agent.ainvoke(message)
+"""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ltt.models import DependencyModel, Task, TaskModel, TaskStatus
+from ltt.services.dependency_service import get_blockers_for_tasks
+from ltt.services.progress_service import get_statuses
+from ltt.services.task_service import TaskNotFoundError
+
+
+class ToolLoader:
+    """Batched, memoized lookups for one learner within one agent turn."""
+
+    def __init__(self, learner_id: str):
+        self.learner_id = learner_id
+        # Template layer
+        self._tasks: dict[str, Task | None] = {}  # None = does not exist
+        self._children: dict[str, list[str]] = {}
+        self._child_counts: dict[str, int] = {}
+        self._dependents: dict[str, list[str]] = {}
+        # Learner layer
+        self._statuses: dict[str, TaskStatus] = {}
+        self._blockers: dict[str, list[str]] = {}
+
+    def invalidate_learner_state(self) -> None:
+        """Forget learner statuses and blockers (call after a status change)."""
+        self._statuses.clear()
+        self._blockers.clear()
+
+    async def load_tasks(self, session: AsyncSession, task_ids: Iterable[str]) -> dict[str, Task]:
+        """
+        Load tasks by ID in one query for the ones not loaded yet.
+
+        Returns:
+            Mapping of the requested IDs that exist to their tasks
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        missing = [task_id for task_id in task_ids if task_id not in self._tasks]
+        if missing:
+            result = await session.execute(select(TaskModel).where(TaskModel.id.in_(missing)))
+            for model in result.scalars():
+                self._tasks[model.id] = Task.model_validate(model)
+            for task_id in missing:
+                self._tasks.setdefault(task_id, None)
+
+        return {task_id: self._tasks[task_id] for task_id in task_ids if self._tasks[task_id]}
+
+    async def get_task(self, session: AsyncSession, task_id: str) -> Task:
+        """
+        Load one task.
+
+        Raises:
+            TaskNotFoundError: If task does not exist
+        """
+        tasks = await self.load_tasks(session, [task_id])
+        if task_id not in tasks:
+            raise TaskNotFoundError(f"Task {task_id} not found")
+        return tasks[task_id]
+
+    async def get_children(self, session: AsyncSession, task_id: str) -> list[Task]:
+        """Load the direct children of a task."""
+        if task_id not in self._children:
+            result = await session.execute(select(TaskModel).where(TaskModel.parent_id == task_id))
+            children = [Task.model_validate(model) for model in result.scalars()]
+            for child in children:
+                self._tasks[child.id] = child
+            self._children[task_id] = [child.id for child in children]
+            self._child_counts[task_id] = len(children)
+
+        return [self._tasks[child_id] for child_id in self._children[task_id]]
+
+    async def child_counts(self, session: AsyncSession, task_ids: Iterable[str]) -> dict[str, int]:
+        """Count the direct children of many tasks in one query."""
+        task_ids = list(dict.fromkeys(task_ids))
+        missing = [task_id for task_id in task_ids if task_id not in self._child_counts]
+        if missing:
+            result = await session.execute(
+                select(TaskModel.parent_id, func.count())
+                .where(TaskModel.parent_id.in_(missing))
+                .group_by(TaskModel.parent_id)
+            )
+            counts = dict(result.all())
+            for task_id in missing:
+                self._child_counts[task_id] = counts.get(task_id, 0)
+
+        return {task_id: self._child_counts[task_id] for task_id in task_ids}
+
+    async def get_dependents(self, session: AsyncSession, task_id: str) -> list[Task]:
+        """Load the tasks that depend on a task (any dependency type)."""
+        if task_id not in self._dependents:
+            result = await session.execute(
+                select(TaskModel)
+                .join(DependencyModel, DependencyModel.task_id == TaskModel.id)
+                .where(DependencyModel.depends_on_id == task_id)
+            )
+            dependents = [Task.model_validate(model) for model in result.scalars().unique()]
+            for dependent in dependents:
+                self._tasks[dependent.id] = dependent
+            self._dependents[task_id] = [dependent.id for dependent in dependents]
+
+        return [self._tasks[dependent_id] for dependent_id in self._dependents[task_id]]
+
+    async def statuses(
+        self, session: AsyncSession, task_ids: Iterable[str]
+    ) -> dict[str, TaskStatus]:
+        """Load the learner's status for many tasks (missing = open) in one query."""
+        task_ids = list(dict.fromkeys(task_ids))
+        missing = [task_id for task_id in task_ids if task_id not in self._statuses]
+        if missing:
+            self._statuses.update(await get_statuses(session, self.learner_id, missing))
+
+        return {task_id: self._statuses[task_id] for task_id in task_ids}
+
+    async def get_status(self, session: AsyncSession, task_id: str) -> TaskStatus:
+        """Load the learner's status for one task."""
+        statuses = await self.statuses(session, [task_id])
+        return statuses[task_id]
+
+    async def blockers(
+        self, session: AsyncSession, task_ids: Iterable[str]
+    ) -> dict[str, list[Task]]:
+        """Load the learner's open blockers of many tasks in one query."""
+        task_ids = list(dict.fromkeys(task_ids))
+        missing = [task_id for task_id in task_ids if task_id not in self._blockers]
+        if missing:
+            loaded = await get_blockers_for_tasks(session, missing, self.learner_id)
+            for task_id, blockers in loaded.items():
+                for blocker in blockers:
+                    self._tasks[blocker.id] = blocker
+                self._blockers[task_id] = [blocker.id for blocker in blockers]
+
+        return {
+            task_id: [self._tasks[blocker_id] for blocker_id in self._blockers[task_id]]
+            for task_id in task_ids
+        }
+
+    async def get_blockers(self, session: AsyncSession, task_id: str) -> list[Task]:
+        """Load the learner's open blockers of one task."""
+        blockers = await self.blockers(session, [task_id])
+        return blockers[task_id]
+
+
+_current_loader: ContextVar[ToolLoader | None] = ContextVar("ltt_tool_loader", default=None)
+
+
+@contextmanager
+def tool_loader_scope(learner_id: str) -> Iterator[ToolLoader]:
+    """
+    Share one ToolLoader across every tool call made inside the block.
+
+    Args:
+        learner_id: Learner whose tool calls run in the block
+
+    Yields:
+        The shared loader
+    """
+    loader = ToolLoader(learner_id)
+    token = _current_loader.set(loader)
+    try:
+        yield loader
+    finally:
+        try:
+            _current_loader.reset(token)
+        except ValueError:
+            # Closed from another context (an abandoned async generator)
+            pass
+
+
+def current_tool_loader(learner_id: str) -> ToolLoader:
+    """
+    Get the loader of the enclosing tool_loader_scope for a learner.
+
+    Returns:
+        The scoped loader, or a new unshared one outside a scope (or when
+        the scope belongs to another learner)
+    """
+    loader = _current_loader.get()
+    if loader is None or loader.learner_id != learner_id:
+        return ToolLoader(learner_id)
+    return loader
@@ -0,0 +1,319 @@
+"""
+Per-call instrumentation for agent tools.
+
+Every tool call run inside ``track_tool_call`` is measured for wall time,
+time spent in the database, number of SQL statements and the size of the
+serialized result, and reported to the registered sinks as a
+``ToolCallMetrics`` record. ``execute_tool`` and the agent's tool wrappers
+both track their calls.
+
+SQL statements are attributed to the tool call running in the current
+context via cursor-execute hooks on SQLAlchemy engines, so concurrent calls
+for different learners are measured separately.
+
+Built-in sinks:
+
+- ``tool_histogram``: in-process latency and statement-count histograms per
+  tool, rendered in the Prometheus text format by ``render_prometheus``
+  (always registered; served at the API's ``/metrics``)
+- ``log_tool_call``: one structured log line per call (registered when
+  LTT_TOOL_METRICS_LOG is set)
+
+Other sinks are callables taking a ``ToolCallMetrics``:
+
+    add_tool_metrics_sink(my_sink)
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+
+from ltt_settings import get_settings
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+STATEMENT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+
+@dataclass(frozen=True)
+class ToolCallMetrics:
+    """Measurements of one tool call."""
+
+    tool_name: str
+    learner_id: str
+    wall_ms: float
+    db_ms: float
+    statements: int
+    payload_bytes: int
+    error_code: str | None = None  # None = succeeded
+
+
+ToolMetricsSink = Callable[[ToolCallMetrics], None]
+
+
+class ToolCall:
+    """A tool call in progress; the caller records its result and outcome."""
+
+    def __init__(self, tool_name: str, learner_id: str):
+        self.tool_name = tool_name
+        self.learner_id = learner_id
+        self.db_ms = 0.0
+        self.statements = 0
+        self.payload_bytes = 0
+        self.error_code: str | None = None
+
+    def record_payload(self, payload: str) -> None:
+        """Record the serialized result returned to the agent."""
+        self.payload_bytes = len(payload.encode())
+
+
+_current_call: ContextVar[ToolCall | None] = ContextVar("ltt_tool_call", default=None)
+
+
+@contextmanager
+def track_tool_call(tool_name: str, learner_id: str) -> Iterator[ToolCall]:
+    """
+    Measure a tool call and report it to the sinks when the block exits.
+
+    An exception escaping the block is recorded as an error and re-raised.
+
+    Args:
+        tool_name: Name of the tool
+        learner_id: Learner the call runs for
+
+    Yields:
+        The call, for recording the payload and error code
+    """
+    _install_query_hooks()
+    call = ToolCall(tool_name, learner_id)
+    token = _current_call.set(call)
+    start = time.perf_counter()
+    try:
+        yield call
+    except BaseException as e:
+        call.error_code = call.error_code or type(e).__name__
+        raise
+    finally:
+        wall_ms = (time.perf_counter() - start) * 1000
+        _current_call.reset(token)
+        _emit(
+            ToolCallMetrics(
+                tool_name=call.tool_name,
+                learner_id=call.learner_id,
+                wall_ms=wall_ms,
+                db_ms=call.db_ms,
+                statements=call.statements,
+                payload_bytes=call.payload_bytes,
+                error_code=call.error_code,
+            )
+        )
+
+
+# ============================================================================
+# Query hooks
+# ============================================================================
+
+_hooks_installed = False
+
+
+def _install_query_hooks() -> None:
+    global _hooks_installed
+    if not _hooks_installed:
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _hooks_installed = True
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_call.get() is not None:
+        conn.info.setdefault("ltt_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    call = _current_call.get()
+    starts = conn.info.get("ltt_query_start")
+    if call is None or not starts:
+        return
+    call.db_ms += (time.perf_counter() - starts.pop()) * 1000
+    call.statements += 1
+
+
+# ============================================================================
+# Sinks
+# ============================================================================
+
+
+class ToolLatencyHistogram:
+    """
+    In-process histograms of tool call latency and statement count.
+
+    Counts are per process; each API worker reports its own.
+    """
+
+    def __init__(self):
+        self._tools: dict[str, dict] = {}
+
+    def __call__(self, metrics: ToolCallMetrics) -> None:
+        stats = self._tools.get(metrics.tool_name)
+        if stats is None:
+            stats = self._tools[metrics.tool_name] = {
+                "count": 0,
+                "errors": 0,
+                "wall_ms": 0.0,
+                "db_ms": 0.0,
+                "statements": 0,
+                "payload_bytes": 0,
+                "latency_buckets": [0] * len(LATENCY_BUCKETS_MS),
+                "statement_buckets": [0] * len(STATEMENT_BUCKETS),
+            }
+
+        stats["count"] += 1
+        stats["errors"] += metrics.error_code is not None
+        stats["wall_ms"] += metrics.wall_ms
+        stats["db_ms"] += metrics.db_ms
+        stats["statements"] += metrics.statements
+        stats["payload_bytes"] += metrics.payload_bytes
+        _observe(stats["latency_buckets"], LATENCY_BUCKETS_MS, metrics.wall_ms)
+        _observe(stats["statement_buckets"], STATEMENT_BUCKETS, metrics.statements)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Totals per tool (bucket counts are not cumulative)."""
+        return {
+            name: {
+                **stats,
+                "latency_buckets": list(stats["latency_buckets"]),
+                "statement_buckets": list(stats["statement_buckets"]),
+            }
+            for name, stats in self._tools.items()
+        }
+
+    def reset(self) -> None:
+        """Drop all observations."""
+        self._tools.clear()
+
+    def render_prometheus(self) -> str:
+        """Render the histograms in the Prometheus text exposition format."""
+        lines = [
+            "# HELP ltt_tool_call_duration_seconds Wall time of agent tool calls",
+            "# TYPE ltt_tool_call_duration_seconds histogram",
+        ]
+        for name, stats in sorted(self._tools.items()):
+            lines += _render_histogram(
+                "ltt_tool_call_duration_seconds",
+                name,
+                [bound / 1000 for bound in LATENCY_BUCKETS_MS],
+                stats["latency_buckets"],
+                stats["wall_ms"] / 1000,
+                stats["count"],
+            )
+
+        lines += [
+            "# HELP ltt_tool_call_statements SQL statements per agent tool call",
+            "# TYPE ltt_tool_call_statements histogram",
+        ]
+        for name, stats in sorted(self._tools.items()):
+            lines += _render_histogram(
+                "ltt_tool_call_statements",
+                name,
+                STATEMENT_BUCKETS,
+                stats["statement_buckets"],
+                stats["statements"],
+                stats["count"],
+            )
+
+        for metric, key, scale, help_text in (
+            ("ltt_tool_call_db_seconds_total", "db_ms", 1000, "Database time of agent tool calls"),
+            ("ltt_tool_call_payload_bytes_total", "payload_bytes", 1, "Result size of agent tool calls"),
+            ("ltt_tool_call_errors_total", "errors", 1, "Agent tool calls that failed"),
+        ):
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            for name, stats in sorted(self._tools.items()):
+                lines.append(f'{metric}{{tool="{name}"}} {_format(stats[key] / scale)}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _observe(buckets: list[int], bounds: tuple, value: float) -> None:
+    for i, bound in enumerate(bounds):
+        if value <= bound:
+            buckets[i] += 1
+            return
+
+
+def _render_histogram(
+    metric: str, tool_name: str, bounds, buckets: list[int], total: float, count: int
+) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, bucket in zip(bounds, buckets, strict=True):
+        cumulative += bucket
+        lines.append(f'{metric}_bucket{{tool="{tool_name}",le="{_format(bound)}"}} {cumulative}')
+    lines.append(f'{metric}_bucket{{tool="{tool_name}",le="+Inf"}} {count}')
+    lines.append(f'{metric}_sum{{tool="{tool_name}"}} {_format(total)}')
+    lines.append(f'{metric}_count{{tool="{tool_name}"}} {count}')
+    return lines
+
+
+def _format(value: float) -> str:
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+def log_tool_call(metrics: ToolCallMetrics) -> None:
+    """Log one tool call, with the measurements as structured fields."""
+    logger.info(
+        "tool=%s wall_ms=%.1f db_ms=%.1f statements=%d payload_bytes=%d error=%s",
+        metrics.tool_name,
+        metrics.wall_ms,
+        metrics.db_ms,
+        metrics.statements,
+        metrics.payload_bytes,
+        metrics.error_code or "-",
+        extra={"tool_call": asdict(metrics)},
+    )
+
+
+tool_histogram = ToolLatencyHistogram()
+
+_sinks: list[ToolMetricsSink] | None = None
+
+
+def _get_sinks() -> list[ToolMetricsSink]:
+    global _sinks
+    if _sinks is None:
+        _sinks = [tool_histogram]
+        if get_settings().tool_metrics_log:
+            _sinks.append(log_tool_call)
+    return _sinks
+
+
+def add_tool_metrics_sink(sink: ToolMetricsSink) -> None:
+    """Report every tool call to a sink."""
+    _get_sinks().append(sink)
+
+
+def remove_tool_metrics_sink(sink: ToolMetricsSink) -> None:
+    """Stop reporting to a sink added with add_tool_metrics_sink."""
+    sinks = _get_sinks()
+    if sink in sinks:
+        sinks.remove(sink)
+
+
+def render_prometheus() -> str:
+    """Render the built-in tool histograms for a /metrics endpoint."""
+    return tool_histogram.render_prometheus()
+
+
+def _emit(metrics: ToolCallMetrics) -> None:
+    for sink in list(_get_sinks()):
+        try:
+            sink(metrics)
+        except Exception:
+            # Instrumentation must never fail a tool call
+            logger.exception("Tool metrics sink %r failed", sink)
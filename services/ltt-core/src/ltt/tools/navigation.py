@@ -11,12 +11,12 @@ Implementation Note (ADR-001):
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ltt.services.dependency_service import get_blocking_tasks, get_ready_work
+from ltt.models import Task
 from ltt.services.learning import get_objectives, get_progress, get_summaries
-from ltt.services.progress_service import get_or_create_progress
-from ltt.services.submission_service import get_submissions
-from ltt.services.task_service import get_ancestors, get_children, get_task
-from ltt.services.validation_service import get_latest_validation
+from ltt.services.progress_service import get_progress as get_task_progress
+from ltt.services.ready_set import get_ready_set
+from ltt.services.task_service import get_ancestors
+from ltt.tools.loader import ToolLoader, current_tool_loader
 from ltt.tools.schemas import (
     GetContextInput,
     GetContextOutput,
@@ -41,25 +41,14 @@ async def get_ready(input: GetReadyInput, learner_id: str, session: AsyncSession
     - Queries learner_task_progress to get per-learner status
     - Falls back to 'open' for tasks without progress records (lazy initialization)
     - Checks dependencies against learner's progress, not global task status
+    - Served from the learner's incremental ready set (see ready_set)
     """
-    ready_tasks = await get_ready_work(
-        session,
-        project_id=input.project_id,
-        learner_id=learner_id,
-        task_type=input.task_type,
-        limit=input.limit,
-    )
+    ready_set = await get_ready_set(session, input.project_id, learner_id)
+    ready_tasks = ready_set.ready(task_type=input.task_type, limit=input.limit)
 
     # Convert to summaries with content and hierarchical summaries
     summaries = []
     for task in ready_tasks:
-        # Get learner-specific status
-        progress = await get_or_create_progress(session, task.id, learner_id)
-
-        # Get children count
-        children = await get_children(session, task.id)
-        has_children = len(children) > 0
-
         # Include content and summary for epics and tasks (not subtasks)
         include_content = task.task_type in ("epic", "task")
 
@@ -67,10 +56,10 @@ async def get_ready(input: GetReadyInput, learner_id: str, session: AsyncSession
             TaskSummaryOutput(
                 id=task.id,
                 title=task.title,
-                status=progress.status,
+                status=ready_set.status_of(task.id),
                 task_type=task.task_type,
                 priority=task.priority,
-                has_children=has_children,
+                has_children=ready_set.graph.has_children(task.id),
                 parent_id=task.parent_id,
                 description=task.description if include_content else None,
                 content=task.content if include_content else None,
@@ -88,7 +77,10 @@ async def get_ready(input: GetReadyInput, learner_id: str, session: AsyncSession
 
 
 async def show_task(
-    input: ShowTaskInput, learner_id: str, session: AsyncSession
+    input: ShowTaskInput,
+    learner_id: str,
+    session: AsyncSession,
+    loader: ToolLoader | None = None,
 ) -> TaskDetailOutput:
     """
     Show detailed information about a task.
@@ -99,76 +91,30 @@ async def show_task(
     - Task template (title, description, objectives) from tasks table
     - Status comes from learner_task_progress join (per-learner)
     - Submissions, validations, summaries are learner-scoped
+    - Related tasks are loaded through the turn's ToolLoader, so the query
+      count does not grow with the number of children/blockers/dependents
     """
-    # Get base task
-    task = await get_task(session, input.task_id)
-
-    # Get learner-specific status
-    progress = await get_or_create_progress(session, input.task_id, learner_id)
-
-    # Get children
-    children = await get_children(session, input.task_id)
-    children_summaries = []
-    for child in children:
-        child_progress = await get_or_create_progress(session, child.id, learner_id)
-        child_children = await get_children(session, child.id)
-        children_summaries.append(
-            TaskSummaryOutput(
-                id=child.id,
-                title=child.title,
-                status=child_progress.status,
-                task_type=child.task_type,
-                priority=child.priority,
-                has_children=len(child_children) > 0,
-            )
-        )
+    loader = loader or current_tool_loader(learner_id)
+
+    # Get base task, children, blocking tasks and tasks this one blocks
+    task = await loader.get_task(session, input.task_id)
+    children = await loader.get_children(session, input.task_id)
+    blockers = await loader.get_blockers(session, input.task_id)
+    dependents = await loader.get_dependents(session, input.task_id)
+
+    # Learner-specific statuses for every task shown, read-only (missing = open)
+    related = [input.task_id, *(t.id for t in children + blockers + dependents)]
+    status = (await loader.statuses(session, related))[input.task_id]
+    children_summaries, blocked_by_summaries, blocks_summaries = await _summarize(
+        session, loader, children, blockers, dependents
+    )
 
     # Get learning objectives
     objectives = await get_objectives(session, input.task_id)
     objectives_list = [{"level": obj.level, "description": obj.description} for obj in objectives]
 
-    # Get blocking tasks
-    blockers = await get_blocking_tasks(session, input.task_id, learner_id)
-    blocked_by_summaries = []
-    for blocker in blockers:
-        blocker_progress = await get_or_create_progress(session, blocker.id, learner_id)
-        blocker_children = await get_children(session, blocker.id)
-        blocked_by_summaries.append(
-            TaskSummaryOutput(
-                id=blocker.id,
-                title=blocker.title,
-                status=blocker_progress.status,
-                task_type=blocker.task_type,
-                priority=blocker.priority,
-                has_children=len(blocker_children) > 0,
-            )
-        )
-
-    # Get tasks this one blocks (dependents)
-    # Query dependencies where this task is the blocker
-    from ltt.services.dependency_service import get_dependents
-
-    dependency_records = await get_dependents(session, input.task_id)
-    blocks_summaries = []
-    for dep in dependency_records:
-        # Get the actual task that depends on this one
-        dependent_task = await get_task(session, dep.task_id)
-        dependent_progress = await get_or_create_progress(session, dependent_task.id, learner_id)
-        dependent_children = await get_children(session, dependent_task.id)
-        blocks_summaries.append(
-            TaskSummaryOutput(
-                id=dependent_task.id,
-                title=dependent_task.title,
-                status=dependent_progress.status,
-                task_type=dependent_task.task_type,
-                priority=dependent_task.priority,
-                has_children=len(dependent_children) > 0,
-            )
-        )
-
-    # Get submissions and validation
-    submissions = await get_submissions(session, input.task_id, learner_id)
-    latest_val = await get_latest_validation(session, input.task_id, learner_id)
+    # Attempt count and latest verdict are kept on the learner's progress row
+    task_progress = await get_task_progress(session, input.task_id, learner_id)
 
     # Get status summaries
     summaries = await get_summaries(session, input.task_id, learner_id)
@@ -183,7 +129,7 @@ async def show_task(
         description=task.description,
         acceptance_criteria=task.acceptance_criteria,
         notes=task.notes,
-        status=progress.status,
+        status=status.value,
         task_type=task.task_type,
         priority=task.priority,
         parent_id=task.parent_id,
@@ -194,14 +140,17 @@ async def show_task(
         narrative_context=task.narrative_context,
         blocked_by=blocked_by_summaries,
         blocks=blocks_summaries,
-        submission_count=len(submissions),
-        latest_validation_passed=latest_val.passed if latest_val else None,
+        submission_count=task_progress.attempt_count if task_progress else 0,
+        latest_validation_passed=task_progress.latest_validation_passed if task_progress else None,
         status_summaries=summaries_list,
     )
 
 
 async def get_context(
-    input: GetContextInput, learner_id: str, session: AsyncSession
+    input: GetContextInput,
+    learner_id: str,
+    session: AsyncSession,
+    loader: ToolLoader | None = None,
 ) -> GetContextOutput:
     """
     Get full context for a task.
@@ -213,36 +162,34 @@ async def get_context(
     - Status comes from learner's progress record
     - Dependencies checked against learner's progress
     """
+    loader = loader or current_tool_loader(learner_id)
+
     # Get base task
-    task = await get_task(session, input.task_id)
+    task = await loader.get_task(session, input.task_id)
 
-    # Get learner-specific status
-    progress = await get_or_create_progress(session, input.task_id, learner_id)
+    # Get learner-specific status (read-only, missing = open)
+    status = await loader.get_status(session, input.task_id)
 
-    # Get children
-    children = await get_children(session, input.task_id)
-    has_children = len(children) > 0
+    # Whether the task has children
+    child_counts = await loader.child_counts(session, [input.task_id])
+    has_children = child_counts[input.task_id] > 0
 
     # Build hierarchy (ancestors up to project)
     ancestors = await get_ancestors(session, input.task_id)
     hierarchy = [{"id": t.id, "title": t.title, "type": t.task_type} for t in ancestors]
 
     # Get ready tasks for project
-    ready_tasks_data = await get_ready_work(
-        session, project_id=task.project_id, learner_id=learner_id, limit=10
-    )
+    ready_set = await get_ready_set(session, task.project_id, learner_id)
     ready_summaries = []
-    for ready_task in ready_tasks_data:
-        ready_task_progress = await get_or_create_progress(session, ready_task.id, learner_id)
-        ready_children = await get_children(session, ready_task.id)
+    for ready_task in ready_set.ready(limit=10):
         ready_summaries.append(
             TaskSummaryOutput(
                 id=ready_task.id,
                 title=ready_task.title,
-                status=ready_task_progress.status,
+                status=ready_set.status_of(ready_task.id),
                 task_type=ready_task.task_type,
                 priority=ready_task.priority,
-                has_children=len(ready_children) > 0,
+                has_children=ready_set.graph.has_children(ready_task.id),
             )
         )
 
@@ -270,7 +217,7 @@ async def get_context(
         current_task=TaskSummaryOutput(
             id=task.id,
             title=task.title,
-            status=progress.status,
+            status=status.value,
             task_type=task.task_type,
             priority=task.priority,
             has_children=has_children,
@@ -283,3 +230,27 @@ async def get_context(
         learning_objectives=objectives_list,
         status_summaries=summaries_list,
     )
+
+
+async def _summarize(
+    session: AsyncSession, loader: ToolLoader, *groups: list[Task]
+) -> list[list[TaskSummaryOutput]]:
+    """Summarize groups of related tasks with one status and one child-count query."""
+    task_ids = [task.id for group in groups for task in group]
+    statuses = await loader.statuses(session, task_ids)
+    child_counts = await loader.child_counts(session, task_ids)
+
+    return [
+        [
+            TaskSummaryOutput(
+                id=task.id,
+                title=task.title,
+                status=statuses[task.id].value,
+                task_type=task.task_type,
+                priority=task.priority,
+                has_children=child_counts[task.id] > 0,
+            )
+            for task in group
+        ]
+        for group in groups
+    ]
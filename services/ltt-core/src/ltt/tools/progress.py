@@ -5,24 +5,17 @@ Tools for tracking progress: start_task, submit.
 
 Implementation Note (ADR-001):
 - Status updates go to learner_task_progress table
-- Lazy initialization: creates progress record if doesn't exist
+- Progress records are created by status transitions only; reads default to 'open'
 - Validation and submission are learner-scoped
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ltt.models import SubmissionType, TaskStatus
-from ltt.services.dependency_service import get_ready_work, is_task_blocked
-from ltt.services.progress_service import (
-    InvalidStatusTransitionError,
-    close_task,
-    get_or_create_progress,
-    try_auto_close_ancestors,
-    update_status,
-)
-from ltt.services.submission_service import create_submission
-from ltt.services.task_service import get_children, get_task
-from ltt.services.validation_service import validate_submission
+from ltt.services.progress_service import update_status
+from ltt.services.ready_set import get_ready_set
+from ltt.services.submission_service import submit_and_validate
+from ltt.tools.loader import ToolLoader, current_tool_loader
 from ltt.tools.schemas import (
     AutoClosedTask,
     StartTaskContextOutput,
@@ -35,7 +28,10 @@ from ltt.tools.schemas import (
 
 
 async def start_task(
-    input: StartTaskInput, learner_id: str, session: AsyncSession
+    input: StartTaskInput,
+    learner_id: str,
+    session: AsyncSession,
+    loader: ToolLoader | None = None,
 ) -> StartTaskOutput:
     """
     Start working on a task.
@@ -45,19 +41,21 @@ async def start_task(
 
     Implementation Note (ADR-001):
     - Status is written to learner_task_progress, not tasks table
-    - Creates progress record if it doesn't exist (lazy initialization)
+    - The progress record is created by the transition, not by the status read
     - Checks blocking against learner's own progress
     """
     from ltt.services.learning.objectives import get_objectives
 
+    loader = loader or current_tool_loader(learner_id)
+
     # Get task details
-    task = await get_task(session, input.task_id)
+    task = await loader.get_task(session, input.task_id)
 
-    # Get or create learner's progress record
-    progress = await get_or_create_progress(session, input.task_id, learner_id)
+    # Get learner's current status (read-only; the transition creates the record)
+    status = await loader.get_status(session, input.task_id)
 
     # Already in progress - still return context so tutor has what they need
-    if progress.status == TaskStatus.IN_PROGRESS.value:
+    if status == TaskStatus.IN_PROGRESS:
         # Get learning objectives with Bloom levels
         objectives = await get_objectives(session, input.task_id)
         objective_dicts = [
@@ -86,7 +84,7 @@ async def start_task(
         )
 
     # Check if task is closed
-    if progress.status == TaskStatus.CLOSED.value:
+    if status == TaskStatus.CLOSED:
         return StartTaskOutput(
             success=False,
             task_id=input.task_id,
@@ -96,8 +94,8 @@ async def start_task(
         )
 
     # Check if task is blocked by dependencies
-    is_blocked, blockers = await is_task_blocked(session, input.task_id, learner_id)
-    if is_blocked:
+    blockers = await loader.get_blockers(session, input.task_id)
+    if blockers:
         blocker_titles = [b.title for b in blockers[:3]]
         return StartTaskOutput(
             success=False,
@@ -109,6 +107,7 @@ async def start_task(
 
     # Set to in_progress
     await update_status(session, input.task_id, learner_id, TaskStatus.IN_PROGRESS)
+    loader.invalidate_learner_state()
 
     # Get learning objectives with Bloom levels
     objectives = await get_objectives(session, input.task_id)
@@ -137,7 +136,12 @@ async def start_task(
     )
 
 
-async def submit(input: SubmitInput, learner_id: str, session: AsyncSession) -> SubmitOutput:
+async def submit(
+    input: SubmitInput,
+    learner_id: str,
+    session: AsyncSession,
+    loader: ToolLoader | None = None,
+) -> SubmitOutput:
     """
     Submit work for a task and trigger validation.
 
@@ -147,17 +151,19 @@ async def submit(input: SubmitInput, learner_id: str, session: AsyncSession) ->
     IMPORTANT: Task must be started (in_progress) before submission.
     Use start_task first.
     """
+    loader = loader or current_tool_loader(learner_id)
+
     # Check task is in_progress - must call start_task first
-    progress = await get_or_create_progress(session, input.task_id, learner_id)
-    if progress.status != TaskStatus.IN_PROGRESS.value:
+    status = await loader.get_status(session, input.task_id)
+    if status != TaskStatus.IN_PROGRESS:
         return SubmitOutput(
             success=False,
             submission_id="",
             attempt_number=0,
             validation_passed=None,
             validation_message=None,
-            status=progress.status,
-            message=f"Cannot submit: task is '{progress.status}', not 'in_progress'. Use start_task first.",
+            status=status.value,
+            message=f"Cannot submit: task is '{status.value}', not 'in_progress'. Use start_task first.",
         )
 
     # Parse submission type (enum values are lowercase)
@@ -170,86 +176,73 @@ async def submit(input: SubmitInput, learner_id: str, session: AsyncSession) ->
             attempt_number=0,
             validation_passed=None,
             validation_message=f"Invalid submission type: {input.submission_type}",
-            status=progress.status,
+            status=status.value,
             message=f"Invalid submission type: {input.submission_type}",
         )
 
-    # Create submission
-    submission = await create_submission(
+    # Submit, validate and (on a pass) close the task and its ancestors in one transaction
+    result = await submit_and_validate(
         session, input.task_id, learner_id, input.content, sub_type
     )
-
-    # Validate submission
-    validation = await validate_submission(session, submission.id)
-
-    # Get current status (refresh after submission)
-    current_status = progress.status
+    loader.invalidate_learner_state()
+    submission = result.submission
+    validation = result.validation
+    current_status = result.status.value
 
     ready_tasks_list = None
     auto_closed_list = None
 
-    if validation.passed:
-        # Try to auto-close the task (reuses existing close_task logic)
-        try:
-            closed_progress = await close_task(
-                session, input.task_id, learner_id, "Passed validation"
-            )
-            current_status = closed_progress.status
-            message = "Validation successful, task complete!"
-
-            # Try to auto-close ancestors (parent task, epic, etc.)
-            auto_closed_ids = await try_auto_close_ancestors(session, input.task_id, learner_id)
-
-            if auto_closed_ids:
-                # Fetch details for auto-closed tasks
-                auto_closed_list = []
-                for aid in auto_closed_ids:
-                    auto_task = await get_task(session, aid)
-                    if auto_task:
-                        auto_closed_list.append(
-                            AutoClosedTask(
-                                id=auto_task.id,
-                                title=auto_task.title,
-                                task_type=auto_task.task_type,
-                            )
+    if validation.passed and result.close_error is None:
+        message = "Validation successful, task complete!"
+
+        # Get ready tasks so tutor knows what's next (avoid extra get_ready call)
+        # The ready set was updated in place by the transitions above
+        task = await loader.get_task(session, input.task_id)
+        ready_set = await get_ready_set(session, task.project_id, learner_id)
+        graph = ready_set.graph
+
+        if result.auto_closed:
+            auto_closed_list = []
+            for aid in result.auto_closed:
+                auto_task = graph.tasks[graph.index[aid]] if aid in graph.index else None
+                if auto_task:
+                    auto_closed_list.append(
+                        AutoClosedTask(
+                            id=auto_task.id,
+                            title=auto_task.title,
+                            task_type=auto_task.task_type,
                         )
-
-                # Update message to include auto-closed tasks
-                closed_names = ", ".join([t.title for t in auto_closed_list])
-                message = f"Validation successful, task complete! Also completed: {closed_names}"
-
-            # Get ready tasks so tutor knows what's next (avoid extra get_ready call)
-            task = await get_task(session, input.task_id)
-            ready_tasks = await get_ready_work(
-                session,
-                project_id=task.project_id,
-                learner_id=learner_id,
-                limit=5,
-            )
-            ready_tasks_list = []
-            for ready_task in ready_tasks:
-                ready_progress = await get_or_create_progress(session, ready_task.id, learner_id)
-                ready_children = await get_children(session, ready_task.id)
-                # Include content and summary for epics and tasks (not subtasks)
-                include_content = ready_task.task_type in ("epic", "task")
-                ready_tasks_list.append(
-                    TaskSummaryOutput(
-                        id=ready_task.id,
-                        title=ready_task.title,
-                        status=ready_progress.status,
-                        task_type=ready_task.task_type,
-                        priority=ready_task.priority,
-                        has_children=len(ready_children) > 0,
-                        parent_id=ready_task.parent_id,
-                        description=ready_task.description if include_content else None,
-                        content=ready_task.content if include_content else None,
-                        summary=ready_task.summary if include_content else None,
                     )
+
+            # Update message to include auto-closed tasks
+            closed_names = ", ".join([t.title for t in auto_closed_list])
+            message = f"Validation successful, task complete! Also completed: {closed_names}"
+
+        ready_tasks_list = []
+        for ready_task in ready_set.ready(limit=5):
+            # Include content and summary for epics and tasks (not subtasks)
+            include_content = ready_task.task_type in ("epic", "task")
+            ready_tasks_list.append(
+                TaskSummaryOutput(
+                    id=ready_task.id,
+                    title=ready_task.title,
+                    status=ready_set.status_of(ready_task.id),
+                    task_type=ready_task.task_type,
+                    priority=ready_task.priority,
+                    has_children=graph.has_children(ready_task.id),
+                    parent_id=ready_task.parent_id,
+                    description=ready_task.description if include_content else None,
+                    content=ready_task.content if include_content else None,
+                    summary=ready_task.summary if include_content else None,
                 )
-        except InvalidStatusTransitionError as e:
-            # Task can't be closed yet (e.g., has open subtasks)
-            # Provide clear feedback about WHY it can't close
-            message = f"Validation passed, but task cannot close yet: {e}. Complete subtasks first."
+            )
+    elif validation.passed:
+        # Task can't be closed yet (e.g., has open subtasks)
+        # Provide clear feedback about WHY it can't close
+        message = (
+            f"Validation passed, but task cannot close yet: {result.close_error}. "
+            "Complete subtasks first."
+        )
     else:
         message = f"Validation failed: {validation.error_message}"
 
@@ -0,0 +1,156 @@
+"""
+Tests for checkpoint retention (prune_checkpoints).
+
+The checkpoint tables are created in the test database with the layout of
+LangGraph's Postgres checkpointer.
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from ltt.models import LearnerModel
+from ltt.services.checkpoint_retention import prune_checkpoints
+from ltt.utils.ids import PREFIX_LEARNER, generate_entity_id
+from sqlalchemy import text
+
+CHECKPOINT_DDL = [
+    """CREATE TABLE checkpoints (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        checkpoint_id TEXT NOT NULL,
+        parent_checkpoint_id TEXT,
+        type TEXT,
+        checkpoint JSONB NOT NULL,
+        metadata JSONB NOT NULL DEFAULT '{}',
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+    )""",
+    """CREATE TABLE checkpoint_blobs (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        channel TEXT NOT NULL,
+        version TEXT NOT NULL,
+        type TEXT NOT NULL,
+        blob BYTEA,
+        PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+    )""",
+    """CREATE TABLE checkpoint_writes (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        checkpoint_id TEXT NOT NULL,
+        task_id TEXT NOT NULL,
+        idx INTEGER NOT NULL,
+        channel TEXT NOT NULL,
+        type TEXT,
+        blob BYTEA NOT NULL,
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+    )""",
+]
+
+
+@pytest_asyncio.fixture
+async def checkpoint_engine(async_engine):
+    async with async_engine.begin() as conn:
+        for statement in CHECKPOINT_DDL:
+            await conn.execute(text(statement))
+    yield async_engine
+    async with async_engine.begin() as conn:
+        await conn.execute(text("DROP TABLE checkpoints, checkpoint_blobs, checkpoint_writes"))
+
+
+async def _add_thread(engine, thread_id: str, count: int, age: timedelta) -> None:
+    """Add count checkpoints; checkpoint i has written messages version i."""
+    ts = datetime.now(UTC) - age
+    async with engine.begin() as conn:
+        for i in range(1, count + 1):
+            checkpoint = {"ts": ts.isoformat(), "channel_versions": {"messages": str(i)}}
+            await conn.execute(
+                text(
+                    "INSERT INTO checkpoints (thread_id, checkpoint_id, checkpoint)"
+                    " VALUES (:thread, :id, CAST(:checkpoint AS jsonb))"
+                ),
+                {"thread": thread_id, "id": f"cp-{i}", "checkpoint": json.dumps(checkpoint)},
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO checkpoint_blobs (thread_id, channel, version, type, blob)"
+                    " VALUES (:thread, 'messages', :version, 'msgpack', 'x')"
+                ),
+                {"thread": thread_id, "version": str(i)},
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO checkpoint_writes"
+                    " (thread_id, checkpoint_id, task_id, idx, channel, blob)"
+                    " VALUES (:thread, :id, 'task', 0, 'messages', 'x')"
+                ),
+                {"thread": thread_id, "id": f"cp-{i}"},
+            )
+
+
+async def _rows(engine, table: str, thread_id: str) -> int:
+    async with engine.connect() as conn:
+        return await conn.scalar(
+            text(f"SELECT count(*) FROM {table} WHERE thread_id = :thread"), {"thread": thread_id}
+        )
+
+
+@pytest.mark.asyncio
+async def test_keeps_latest_checkpoints_per_thread(checkpoint_engine, async_session):
+    """Test idle threads are cut to their latest checkpoints and what they reference."""
+    await _add_thread(checkpoint_engine, "idle", 5, timedelta(hours=1))
+
+    report = await prune_checkpoints(checkpoint_engine, async_session, keep_latest=2)
+
+    assert report.threads_trimmed == 1
+    assert report.checkpoints_deleted == 3
+    assert report.writes_deleted == 3
+    assert report.blobs_deleted == 3
+    assert report.bytes_deleted > 0
+    async with checkpoint_engine.connect() as conn:
+        kept = await conn.scalars(text("SELECT checkpoint_id FROM checkpoints ORDER BY 1"))
+        versions = await conn.scalars(text("SELECT version FROM checkpoint_blobs ORDER BY 1"))
+        assert list(kept) == ["cp-4", "cp-5"]
+        assert list(versions) == ["4", "5"]
+
+
+@pytest.mark.asyncio
+async def test_active_threads_are_left_alone(checkpoint_engine, async_session):
+    """Test a thread with a recent checkpoint is not trimmed."""
+    await _add_thread(checkpoint_engine, "active", 5, timedelta(seconds=5))
+
+    report = await prune_checkpoints(checkpoint_engine, async_session, keep_latest=2)
+
+    assert report.threads_trimmed == 0
+    assert await _rows(checkpoint_engine, "checkpoints", "active") == 5
+
+
+@pytest.mark.asyncio
+async def test_expired_threads_are_dropped(checkpoint_engine, async_session):
+    """Test threads not updated within the TTL lose checkpoints and their record."""
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.flush()
+    for thread_id, age in (("old", timedelta(days=60)), ("recent", timedelta(days=1))):
+        await async_session.execute(
+            text(
+                "INSERT INTO conversation_threads (thread_id, learner_id, project_id, updated_at)"
+                " VALUES (:thread, :learner, 'proj', :updated_at)"
+            ),
+            {"thread": thread_id, "learner": learner_id, "updated_at": datetime.now(UTC) - age},
+        )
+        await _add_thread(checkpoint_engine, thread_id, 1, age)
+    await async_session.commit()
+
+    report = await prune_checkpoints(
+        checkpoint_engine, async_session, keep_latest=2, thread_ttl=timedelta(days=30)
+    )
+    await async_session.commit()
+
+    assert report.threads_expired == 1
+    assert await _rows(checkpoint_engine, "checkpoints", "old") == 0
+    assert await _rows(checkpoint_engine, "checkpoint_blobs", "old") == 0
+    assert await _rows(checkpoint_engine, "checkpoints", "recent") == 1
+    remaining = await async_session.scalars(text("SELECT thread_id FROM conversation_threads"))
+    assert list(remaining) == ["recent"]
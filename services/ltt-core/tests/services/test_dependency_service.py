@@ -8,6 +8,7 @@ from ltt.models import (
     DependencyType,
     LearnerModel,
     TaskCreate,
+    TaskModel,
     TaskType,
 )
 from ltt.services.dependency_service import (
@@ -15,9 +16,12 @@ from ltt.services.dependency_service import (
     DependencyNotFoundError,
     DuplicateError,
     TaskNotFoundError,
+    add_dependencies_bulk,
     add_dependency,
     detect_cycles,
+    detect_cycles_in_catalogue,
     get_blocked_tasks,
+    get_blockers_for_tasks,
     get_blocking_tasks,
     get_dependencies,
     get_dependents,
@@ -76,6 +80,66 @@ async def test_add_duplicate_dependency(async_session):
         await add_dependency(async_session, task2.id, task1.id)
 
 
+@pytest.mark.asyncio
+async def test_add_dependencies_bulk(async_session):
+    """Test inserting a batch of dependencies in one go."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    tasks = [
+        await create_task(
+            async_session,
+            TaskCreate(title=f"Task {i}", task_type=TaskType.TASK, parent_id=project.id),
+        )
+        for i in range(4)
+    ]
+    t0, t1, t2, t3 = (t.id for t in tasks)
+
+    deps = await add_dependencies_bulk(async_session, [(t1, t0), (t2, t1), (t3, t1)])
+    await async_session.commit()
+
+    assert [(d.task_id, d.depends_on_id) for d in deps] == [(t1, t0), (t2, t1), (t3, t1)]
+    assert all(d.dependency_type == DependencyType.BLOCKS for d in deps)
+    assert {d.depends_on_id for d in await get_dependencies(async_session, t3)} == {t1}
+
+    assert await add_dependencies_bulk(async_session, []) == []
+
+
+@pytest.mark.asyncio
+async def test_add_dependencies_bulk_rejects_invalid_batch(async_session):
+    """Test that an invalid edge rejects the whole batch."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    tasks = [
+        await create_task(
+            async_session,
+            TaskCreate(title=f"Task {i}", task_type=TaskType.TASK, parent_id=project.id),
+        )
+        for i in range(3)
+    ]
+    t0, t1, t2 = (t.id for t in tasks)
+    await add_dependency(async_session, t1, t0)
+
+    # Cycle closed by an existing edge plus an earlier edge of the same batch
+    with pytest.raises(CycleError) as exc_info:
+        await add_dependencies_bulk(async_session, [(t2, t1), (t0, t2)])
+    assert exc_info.value.cycle == [t0, t2, t1, t0]
+
+    with pytest.raises(DuplicateError):
+        await add_dependencies_bulk(async_session, [(t2, t0), (t1, t0)])
+
+    with pytest.raises(DuplicateError):
+        await add_dependencies_bulk(async_session, [(t2, t0), (t2, t0)])
+
+    with pytest.raises(TaskNotFoundError):
+        await add_dependencies_bulk(async_session, [(t2, t0), (t2, "nonexistent-id")])
+
+    # Nothing from the rejected batches was written
+    assert await get_dependencies(async_session, t2) == []
+    assert [d.depends_on_id for d in await get_dependencies(async_session, t0)] == []
+
+
 @pytest.mark.asyncio
 async def test_remove_dependency(async_session):
     """Test removing a dependency."""
@@ -265,6 +329,114 @@ async def test_detect_cycles_finds_all_cycles(async_session):
     assert set(cycle) == {task_a.id, task_b.id, task_c.id}
 
 
+@pytest.mark.asyncio
+async def test_detect_cycles_deep_chain(async_session):
+    """Test that long dependency chains don't hit the recursion limit."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    chain_ids = [f"{project.id}.{i}" for i in range(1, 3001)]
+    async_session.add_all(
+        TaskModel(id=task_id, parent_id=project.id, project_id=project.id, title=task_id)
+        for task_id in chain_ids
+    )
+    await async_session.flush()
+    async_session.add_all(
+        DependencyModel(task_id=a, depends_on_id=b, dependency_type="blocks")
+        for a, b in zip(chain_ids, chain_ids[1:])
+    )
+    await async_session.commit()
+
+    assert await detect_cycles(async_session, project.id) == []
+
+    # Closing the chain turns it into one big cycle
+    async_session.add(
+        DependencyModel(task_id=chain_ids[-1], depends_on_id=chain_ids[0], dependency_type="blocks")
+    )
+    await async_session.commit()
+
+    cycles = await detect_cycles(async_session, project.id)
+    assert len(cycles) == 1
+    assert set(cycles[0]) == set(chain_ids)
+
+
+@pytest.mark.asyncio
+async def test_detect_cycles_in_catalogue(async_engine, async_session):
+    """Test validating every project with bounded concurrency."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    clean = await create_task(async_session, TaskCreate(title="Clean", task_type=TaskType.PROJECT))
+    broken = await create_task(
+        async_session, TaskCreate(title="Broken", task_type=TaskType.PROJECT)
+    )
+    clean_a = await create_task(
+        async_session, TaskCreate(title="A", task_type=TaskType.TASK, parent_id=clean.id)
+    )
+    clean_b = await create_task(
+        async_session, TaskCreate(title="B", task_type=TaskType.TASK, parent_id=clean.id)
+    )
+    broken_a = await create_task(
+        async_session, TaskCreate(title="A", task_type=TaskType.TASK, parent_id=broken.id)
+    )
+    broken_b = await create_task(
+        async_session, TaskCreate(title="B", task_type=TaskType.TASK, parent_id=broken.id)
+    )
+    await add_dependency(async_session, clean_b.id, clean_a.id)
+    async_session.add_all(
+        [
+            DependencyModel(
+                task_id=broken_a.id, depends_on_id=broken_b.id, dependency_type="blocks"
+            ),
+            DependencyModel(
+                task_id=broken_b.id, depends_on_id=broken_a.id, dependency_type="blocks"
+            ),
+        ]
+    )
+    await async_session.commit()
+
+    session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    results = await detect_cycles_in_catalogue(session_factory, max_concurrency=1)
+
+    assert list(results) == [broken.id]
+    assert set(results[broken.id][0]) == {broken_a.id, broken_b.id}
+
+
+@pytest.mark.asyncio
+async def test_detect_cycles_across_projects(async_engine, async_session):
+    """Test that a cycle through two projects is found from either project."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    first = await create_task(async_session, TaskCreate(title="First", task_type=TaskType.PROJECT))
+    second = await create_task(
+        async_session, TaskCreate(title="Second", task_type=TaskType.PROJECT)
+    )
+    first_task = await create_task(
+        async_session, TaskCreate(title="A", task_type=TaskType.TASK, parent_id=first.id)
+    )
+    second_task = await create_task(
+        async_session, TaskCreate(title="B", task_type=TaskType.TASK, parent_id=second.id)
+    )
+    async_session.add_all(
+        [
+            DependencyModel(
+                task_id=first_task.id, depends_on_id=second_task.id, dependency_type="blocks"
+            ),
+            DependencyModel(
+                task_id=second_task.id, depends_on_id=first_task.id, dependency_type="blocks"
+            ),
+        ]
+    )
+    await async_session.commit()
+
+    for project in (first, second):
+        [cycle] = await detect_cycles(async_session, project.id)
+        assert set(cycle) == {first_task.id, second_task.id}
+
+    session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    results = await detect_cycles_in_catalogue(session_factory)
+    assert set(results) == {first.id, second.id}
+
+
 @pytest.mark.asyncio
 async def test_get_blocking_tasks_per_learner(async_session):
     """Test getting blocking tasks for a specific learner."""
@@ -333,6 +505,54 @@ async def test_is_task_blocked_per_learner(async_session):
     assert len(blockers) == 1
 
 
+@pytest.mark.asyncio
+async def test_get_blockers_for_tasks(async_session):
+    """Test resolving blockers for several tasks at once."""
+    from ltt.models import TaskStatus
+
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task1 = await create_task(
+        async_session, TaskCreate(title="Task 1", task_type=TaskType.TASK, parent_id=project.id)
+    )
+    task2 = await create_task(
+        async_session, TaskCreate(title="Task 2", task_type=TaskType.TASK, parent_id=project.id)
+    )
+    task3 = await create_task(
+        async_session, TaskCreate(title="Task 3", task_type=TaskType.TASK, parent_id=project.id)
+    )
+    task4 = await create_task(
+        async_session, TaskCreate(title="Task 4", task_type=TaskType.TASK, parent_id=project.id)
+    )
+
+    # Task 2 and Task 3 depend on Task 1; Task 4 only has a 'related' link
+    await add_dependency(async_session, task2.id, task1.id)
+    await add_dependency(async_session, task3.id, task1.id)
+    await add_dependency(async_session, task4.id, task1.id, DependencyType.RELATED)
+
+    task_ids = [task1.id, task2.id, task3.id, task4.id]
+    blockers = await get_blockers_for_tasks(async_session, task_ids, learner_id)
+
+    assert set(blockers) == set(task_ids)
+    assert blockers[task1.id] == []
+    assert [t.id for t in blockers[task2.id]] == [task1.id]
+    assert [t.id for t in blockers[task3.id]] == [task1.id]
+    assert blockers[task4.id] == []
+
+    # Closing the blocker unblocks both dependents
+    await update_status(async_session, task1.id, learner_id, TaskStatus.IN_PROGRESS)
+    await update_status(async_session, task1.id, learner_id, TaskStatus.CLOSED)
+    blockers = await get_blockers_for_tasks(async_session, task_ids, learner_id)
+    assert not any(blockers.values())
+
+    assert await get_blockers_for_tasks(async_session, [], learner_id) == {}
+
+
 @pytest.mark.asyncio
 async def test_is_task_ready_per_learner(async_session):
     """Test checking if task is ready for a learner."""
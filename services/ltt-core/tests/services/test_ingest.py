@@ -804,3 +804,41 @@ async def test_dry_run_reingest_reports_conflict(async_session, tmp_path):
     result = await ingest_project_file(async_session, file_path, dry_run=True)
     assert result.project_id == "(dry-run)"
     assert any("already exists" in e for e in result.errors)
+
+
+@pytest.mark.asyncio
+async def test_ingest_refreshes_rollups_once(async_session, tmp_path, monkeypatch):
+    """Test ingest recomputes learner rollups once, not per task or objective."""
+    import ltt.services.ingest as ingest_module
+    import ltt.services.learning.objectives as objectives_module
+    import ltt.services.task_service as task_service_module
+
+    calls = []
+
+    async def record(session, project_id):
+        calls.append(project_id)
+
+    for module in (ingest_module, objectives_module, task_service_module):
+        monkeypatch.setattr(module, "refresh_project_rollups", record)
+
+    project_data = {
+        "title": "Project",
+        "epics": [
+            {
+                "title": "Epic",
+                "tasks": [
+                    {
+                        "title": f"Task {i}",
+                        "learning_objectives": [{"level": "apply", "description": "Do it"}],
+                    }
+                    for i in range(3)
+                ],
+            }
+        ],
+    }
+    file_path = tmp_path / "project.json"
+    file_path.write_text(json.dumps(project_data))
+
+    result = await ingest_project_file(async_session, file_path, use_llm_summaries=False)
+
+    assert calls == [result.project_id]
@@ -2,14 +2,18 @@
 Tests for learning progress service.
 """
 
+import asyncio
+
 import pytest
 from ltt.models import BloomLevel, LearnerModel, SubmissionType, TaskCreate, TaskStatus, TaskType
 from ltt.services.learning import attach_objective, get_bloom_distribution, get_progress
+from ltt.services.progress_rollup import compute_rollup, get_rollup, rebuild_rollups
 from ltt.services.progress_service import update_status
 from ltt.services.submission_service import create_submission
 from ltt.services.task_service import create_task
-from ltt.services.validation_service import validate_submission
+from ltt.services.validation_service import create_manual_validation, validate_submission
 from ltt.utils.ids import PREFIX_LEARNER, generate_entity_id
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 @pytest.mark.asyncio
@@ -266,3 +270,127 @@ async def test_bloom_distribution_empty_project(async_session):
     distribution = await get_bloom_distribution(async_session, learner_id, project.id)
 
     assert distribution == {}  # No objectives, empty distribution
+
+
+@pytest.mark.asyncio
+async def test_progress_rollup_maintained_incrementally(async_session):
+    """Test that transitions, validations and template changes keep the rollup exact."""
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task1 = await create_task(
+        async_session,
+        TaskCreate(title="Task 1", task_type=TaskType.TASK, parent_id=project.id),
+    )
+    task2 = await create_task(
+        async_session,
+        TaskCreate(title="Task 2", task_type=TaskType.TASK, parent_id=project.id),
+    )
+    await attach_objective(async_session, task1.id, "Learn Python basics", BloomLevel.REMEMBER)
+
+    # No changes yet: no row, progress is computed read-only
+    assert await get_rollup(async_session, learner_id, project.id) is None
+
+    await update_status(async_session, task1.id, learner_id, TaskStatus.IN_PROGRESS)
+    submission = await create_submission(
+        async_session, task1.id, learner_id, "My work", SubmissionType.TEXT
+    )
+    await validate_submission(async_session, submission.id)
+    # A second pass must not count the objective twice
+    submission = await create_submission(
+        async_session, task1.id, learner_id, "More work", SubmissionType.TEXT
+    )
+    await validate_submission(async_session, submission.id)
+    await update_status(async_session, task1.id, learner_id, TaskStatus.CLOSED)
+    await update_status(async_session, task2.id, learner_id, TaskStatus.BLOCKED)
+    await create_task(
+        async_session,
+        TaskCreate(title="Task 3", task_type=TaskType.TASK, parent_id=project.id),
+    )
+
+    rollup = await get_rollup(async_session, learner_id, project.id)
+    expected = await compute_rollup(async_session, learner_id, project.id)
+    assert rollup is not None
+    assert (
+        rollup.total_tasks,
+        rollup.completed_tasks,
+        rollup.in_progress_tasks,
+        rollup.blocked_tasks,
+        rollup.total_objectives,
+        rollup.objectives_achieved,
+    ) == (3, 1, 0, 1, 1, 1)
+    assert (
+        expected.total,
+        expected.completed,
+        expected.in_progress,
+        expected.blocked,
+        expected.total_objectives,
+        expected.objectives_achieved,
+    ) == (3, 1, 0, 1, 1, 1)
+
+    progress = await get_progress(async_session, learner_id, project.id)
+    assert progress.total_tasks == 3
+    assert progress.completed_tasks == 1
+    assert progress.objectives_achieved == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_passes_count_objectives_once(async_engine, async_session):
+    """Test that two first passing validations committed together add objectives once."""
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task = await create_task(
+        async_session, TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=project.id)
+    )
+    await attach_objective(async_session, task.id, "Write a join", BloomLevel.APPLY)
+    await update_status(async_session, task.id, learner_id, TaskStatus.IN_PROGRESS)
+    submissions = [
+        await create_submission(async_session, task.id, learner_id, content, SubmissionType.TEXT)
+        for content in ("First", "Second")
+    ]
+
+    async def review(submission_id: str):
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            return await create_manual_validation(session, submission_id, passed=True)
+
+    await asyncio.gather(*(review(submission.id) for submission in submissions))
+
+    rollup = await get_rollup(async_session, learner_id, project.id)
+    assert rollup.objectives_achieved == 1
+
+
+@pytest.mark.asyncio
+async def test_rebuild_rollups_repairs_drift(async_session):
+    """Test that rebuild_rollups recomputes a drifted rollup row."""
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task = await create_task(
+        async_session,
+        TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=project.id),
+    )
+    await update_status(async_session, task.id, learner_id, TaskStatus.IN_PROGRESS)
+
+    rollup = await get_rollup(async_session, learner_id, project.id)
+    rollup.in_progress_tasks = 7
+    rollup.completed_tasks = 3
+    await async_session.commit()
+
+    assert await rebuild_rollups(async_session, project.id) == 1
+    await async_session.commit()
+
+    progress = await get_progress(async_session, learner_id, project.id)
+    assert progress.in_progress_tasks == 1
+    assert progress.completed_tasks == 0
@@ -4,6 +4,7 @@ Tests for progress and status management service.
 
 import pytest
 from ltt.models import LearnerModel, TaskCreate, TaskStatus, TaskType
+from ltt.services import progress_service
 from ltt.services.progress_service import (
     InvalidStatusTransitionError,
     TaskNotFoundError,
@@ -11,12 +12,16 @@ from ltt.services.progress_service import (
     get_learner_tasks_by_status,
     get_or_create_progress,
     get_progress,
+    get_status,
+    get_statuses,
     reopen_task,
     start_task,
+    try_auto_close_ancestors,
     update_status,
 )
 from ltt.services.task_service import create_task
 from ltt.utils.ids import PREFIX_LEARNER, generate_entity_id
+from sqlalchemy import text
 
 
 @pytest.mark.asyncio
@@ -64,6 +69,35 @@ async def test_get_or_create_progress_existing(async_session):
     assert progress1.id == progress2.id
 
 
+@pytest.mark.asyncio
+async def test_get_statuses_is_read_only(async_session):
+    """Test that bulk status lookups default to open without inserting rows."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task1 = await create_task(
+        async_session, TaskCreate(title="Task 1", task_type=TaskType.TASK, parent_id=project.id)
+    )
+    task2 = await create_task(
+        async_session, TaskCreate(title="Task 2", task_type=TaskType.TASK, parent_id=project.id)
+    )
+
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    await start_task(async_session, task1.id, learner_id)
+
+    statuses = await get_statuses(async_session, learner_id, [task1.id, task2.id])
+    assert statuses == {task1.id: TaskStatus.IN_PROGRESS, task2.id: TaskStatus.OPEN}
+    assert await get_status(async_session, project.id, learner_id) == TaskStatus.OPEN
+    assert await get_statuses(async_session, learner_id, []) == {}
+
+    # Only the real transition created a row
+    assert await get_progress(async_session, task2.id, learner_id) is None
+    assert await get_progress(async_session, project.id, learner_id) is None
+
+
 @pytest.mark.asyncio
 async def test_start_task(async_session):
     """Test starting a task (open -> in_progress)."""
@@ -494,3 +528,181 @@ async def test_transition_in_progress_to_closed_sets_completed_at(async_session)
     assert progress.completed_at is not None
     assert progress.close_reason == "Task completed"
     assert progress.status == TaskStatus.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_concurrent_start_applies_once(async_engine, async_session):
+    """Test that racing start requests for the same task apply one transition."""
+    import asyncio
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    task = await create_task(
+        async_session, TaskCreate(title="Test Task", task_type=TaskType.PROJECT)
+    )
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def start():
+        async with session_factory() as session:
+            return await start_task(session, task.id, learner_id)
+
+    results = await asyncio.gather(start(), start(), return_exceptions=True)
+
+    # Interleaved requests both succeed; a fully serialized one is rejected as a no-op
+    started = [r for r in results if not isinstance(r, Exception)]
+    assert started
+    assert all(isinstance(r, InvalidStatusTransitionError) for r in results if r not in started)
+    assert {r.id for r in started} == {started[0].id}
+    assert all(r.status == TaskStatus.IN_PROGRESS for r in started)
+
+
+@pytest.mark.asyncio
+async def test_update_status_rejects_stale_expected_status(async_session):
+    """Test that the compare-and-set upsert does not overwrite a changed status."""
+    from ltt.services.progress_service import _apply_transition
+
+    task = await create_task(
+        async_session, TaskCreate(title="Test Task", task_type=TaskType.PROJECT)
+    )
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    await start_task(async_session, task.id, learner_id)
+
+    # A writer that still believes the task is open must not apply its change
+    stale = await _apply_transition(
+        async_session, task.id, learner_id, TaskStatus.OPEN, TaskStatus.BLOCKED, None
+    )
+    assert stale is None
+
+    progress = await get_progress(async_session, task.id, learner_id)
+    assert progress.status == TaskStatus.IN_PROGRESS
+
+
+@pytest.mark.asyncio
+async def test_try_auto_close_ancestors_closes_chain_bottom_up(async_session):
+    """Test that fully closed ancestors auto-close in one pass, nearest first."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    epic = await create_task(
+        async_session, TaskCreate(title="Epic", task_type=TaskType.EPIC, parent_id=project.id)
+    )
+    task = await create_task(
+        async_session, TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=epic.id)
+    )
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    for task_id in (project.id, epic.id, task.id):
+        await start_task(async_session, task_id, learner_id)
+    await close_task(async_session, task.id, learner_id, "Done")
+
+    closed = await try_auto_close_ancestors(async_session, task.id, learner_id)
+
+    assert closed == [epic.id, project.id]
+    statuses = await get_statuses(async_session, learner_id, [epic.id, project.id])
+    assert set(statuses.values()) == {TaskStatus.CLOSED}
+    progress = await get_progress(async_session, epic.id, learner_id)
+    assert progress.close_reason == "Auto-closed: all children complete"
+    assert progress.completed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_try_auto_close_ancestors_stops_at_open_sibling(async_session):
+    """Test that the climb stops below an ancestor with an unclosed child."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    epic = await create_task(
+        async_session, TaskCreate(title="Epic", task_type=TaskType.EPIC, parent_id=project.id)
+    )
+    await create_task(
+        async_session, TaskCreate(title="Other Epic", task_type=TaskType.EPIC, parent_id=project.id)
+    )
+    task = await create_task(
+        async_session, TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=epic.id)
+    )
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    for task_id in (project.id, epic.id, task.id):
+        await start_task(async_session, task_id, learner_id)
+    await close_task(async_session, task.id, learner_id, "Done")
+
+    closed = await try_auto_close_ancestors(async_session, task.id, learner_id)
+
+    assert closed == [epic.id]
+    assert await get_status(async_session, project.id, learner_id) == TaskStatus.IN_PROGRESS
+
+
+@pytest.mark.asyncio
+async def test_try_auto_close_ancestors_stops_at_concurrent_change(async_session, monkeypatch):
+    """Test that ancestors above one that changed after the chain was read stay open."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    epic = await create_task(
+        async_session, TaskCreate(title="Epic", task_type=TaskType.EPIC, parent_id=project.id)
+    )
+    task = await create_task(
+        async_session, TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=epic.id)
+    )
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    for task_id in (project.id, epic.id, task.id):
+        await start_task(async_session, task_id, learner_id)
+    await close_task(async_session, task.id, learner_id, "Done")
+
+    execute = async_session.execute
+
+    async def execute_then_reopen_epic(statement, *args, **kwargs):
+        result = await execute(statement, *args, **kwargs)
+        if statement is progress_service._AUTO_CLOSE_CHAIN_SQL:
+            # Another request moves the epic back to open after the chain was read
+            await execute(
+                text(
+                    "UPDATE learner_task_progress SET status = 'open'"
+                    " WHERE task_id = :task_id AND learner_id = :learner_id"
+                ),
+                {"task_id": epic.id, "learner_id": learner_id},
+            )
+        return result
+
+    monkeypatch.setattr(async_session, "execute", execute_then_reopen_epic)
+    closed = await try_auto_close_ancestors(async_session, task.id, learner_id)
+    monkeypatch.undo()
+
+    assert closed == []
+    assert await get_status(async_session, project.id, learner_id) == TaskStatus.IN_PROGRESS
+
+
+@pytest.mark.asyncio
+async def test_try_auto_close_ancestors_respects_requires_submission(async_session):
+    """Test that an ancestor requiring submission is not auto-closed."""
+    epic = await create_task(
+        async_session,
+        TaskCreate(title="Epic", task_type=TaskType.EPIC, requires_submission=True),
+    )
+    task = await create_task(
+        async_session, TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=epic.id)
+    )
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    await start_task(async_session, epic.id, learner_id)
+    await start_task(async_session, task.id, learner_id)
+    await close_task(async_session, task.id, learner_id, "Done")
+
+    assert await try_auto_close_ancestors(async_session, task.id, learner_id) == []
+    assert await get_status(async_session, epic.id, learner_id) == TaskStatus.IN_PROGRESS
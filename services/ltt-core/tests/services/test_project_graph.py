@@ -0,0 +1,130 @@
+"""
+Tests for the compiled project graph cache.
+"""
+
+import pytest
+from ltt.models import DependencyModel, LearnerModel, TaskCreate, TaskStatus, TaskType
+from ltt.services.dependency_service import add_dependency, get_ready_work, remove_dependency
+from ltt.services.progress_service import update_status
+from ltt.services.project_graph import (
+    get_project_graph,
+    invalidate_project_graph,
+)
+from ltt.services.task_service import create_task
+from ltt.utils.ids import PREFIX_LEARNER, generate_entity_id
+
+
+async def _create_learner(session) -> str:
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await session.commit()
+    return learner_id
+
+
+@pytest.mark.asyncio
+async def test_graph_is_compiled_once(async_session):
+    """Test that repeated lookups reuse the cached graph."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    await create_task(
+        async_session,
+        TaskCreate(title="Epic", task_type=TaskType.EPIC, parent_id=project.id),
+    )
+
+    graph = await get_project_graph(async_session, project.id)
+    assert await get_project_graph(async_session, project.id) is graph
+    assert len(graph.task_ids) == 2
+    assert graph.parent[graph.index[project.id]] == -1
+
+    invalidate_project_graph(project.id)
+    assert await get_project_graph(async_session, project.id) is not graph
+
+
+@pytest.mark.asyncio
+async def test_graph_invalidated_on_template_changes(async_session):
+    """Test that task and dependency mutations refresh the cached graph."""
+    learner_id = await _create_learner(async_session)
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task1 = await create_task(
+        async_session,
+        TaskCreate(title="Task 1", task_type=TaskType.TASK, parent_id=project.id),
+    )
+    task2 = await create_task(
+        async_session,
+        TaskCreate(title="Task 2", task_type=TaskType.TASK, parent_id=project.id),
+    )
+
+    ready = await get_ready_work(async_session, project.id, learner_id, task_type="task")
+    assert {t.id for t in ready} == {task1.id, task2.id}
+
+    # New dependency must be visible immediately
+    await add_dependency(async_session, task2.id, task1.id)
+    ready = await get_ready_work(async_session, project.id, learner_id, task_type="task")
+    assert [t.id for t in ready] == [task1.id]
+
+    # New task must be visible immediately
+    task3 = await create_task(
+        async_session,
+        TaskCreate(title="Task 3", task_type=TaskType.TASK, parent_id=project.id),
+    )
+    ready = await get_ready_work(async_session, project.id, learner_id, task_type="task")
+    assert {t.id for t in ready} == {task1.id, task3.id}
+
+    await remove_dependency(async_session, task2.id, task1.id)
+    ready = await get_ready_work(async_session, project.id, learner_id, task_type="task")
+    assert {t.id for t in ready} == {task1.id, task2.id, task3.id}
+
+
+@pytest.mark.asyncio
+async def test_graph_recompiled_on_writes_from_other_processes(async_session):
+    """Test that template rows written without invalidation are still picked up."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task1 = await create_task(
+        async_session,
+        TaskCreate(title="Task 1", task_type=TaskType.TASK, parent_id=project.id),
+    )
+    task2 = await create_task(
+        async_session,
+        TaskCreate(title="Task 2", task_type=TaskType.TASK, parent_id=project.id),
+    )
+    graph = await get_project_graph(async_session, project.id)
+
+    # Simulate another process adding a dependency
+    async_session.add(DependencyModel(task_id=task2.id, depends_on_id=task1.id))
+    await async_session.commit()
+
+    refreshed = await get_project_graph(async_session, project.id)
+    assert refreshed is not graph
+    assert refreshed.blockers[refreshed.index[task2.id]] == (refreshed.index[task1.id],)
+
+
+@pytest.mark.asyncio
+async def test_progress_changes_need_no_recompile(async_session):
+    """Test that learner progress is read fresh while the graph stays cached."""
+    learner_id = await _create_learner(async_session)
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task1 = await create_task(
+        async_session,
+        TaskCreate(title="Task 1", task_type=TaskType.TASK, parent_id=project.id),
+    )
+    task2 = await create_task(
+        async_session,
+        TaskCreate(title="Task 2", task_type=TaskType.TASK, parent_id=project.id),
+    )
+    await add_dependency(async_session, task2.id, task1.id)
+
+    graph = await get_project_graph(async_session, project.id)
+
+    await update_status(async_session, task1.id, learner_id, TaskStatus.IN_PROGRESS)
+    await update_status(async_session, task1.id, learner_id, TaskStatus.CLOSED)
+
+    ready = await get_ready_work(async_session, project.id, learner_id, task_type="task")
+    assert [t.id for t in ready] == [task2.id]
+    assert await get_project_graph(async_session, project.id) is graph
@@ -0,0 +1,106 @@
+"""
+Tests for whole-project template snapshots.
+"""
+
+import pytest
+from ltt.models import BloomLevel, TaskCreate, TaskModel, TaskType
+from ltt.services.dependency_service import add_dependency
+from ltt.services.learning import attach_objective
+from ltt.services.project_snapshot import load_project_snapshot
+from ltt.services.task_service import create_task, get_ancestors, get_children
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def _create_project(session):
+    project = await create_task(session, TaskCreate(title="Project", task_type=TaskType.PROJECT))
+    epics = [
+        await create_task(
+            session, TaskCreate(title=f"Epic {n}", task_type=TaskType.EPIC, parent_id=project.id)
+        )
+        for n in range(1, 12)
+    ]
+    task = await create_task(
+        session, TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=epics[0].id)
+    )
+    subtask = await create_task(
+        session, TaskCreate(title="Subtask", task_type=TaskType.SUBTASK, parent_id=task.id)
+    )
+    return project, epics, task, subtask
+
+
+@pytest.mark.asyncio
+async def test_snapshot_matches_hierarchy(async_session):
+    """Test that the snapshot mirrors tasks, children, ancestors and dependencies."""
+    project, epics, task, subtask = await _create_project(async_session)
+    await add_dependency(async_session, epics[1].id, epics[0].id)
+    await attach_objective(async_session, task.id, "Write a query", BloomLevel.APPLY)
+
+    snapshot = await load_project_snapshot(async_session, project.id)
+
+    assert snapshot.project.id == project.id
+    assert len(snapshot.tasks) == 14
+
+    # Siblings keep creation order (epic 10 and 11 after epic 9)
+    assert [t.id for t in snapshot.children_of(project.id)] == [e.id for e in epics]
+    assert [t.id for t in snapshot.walk()][:4] == [project.id, epics[0].id, task.id, subtask.id]
+
+    expected = [t.id for t in await get_ancestors(async_session, subtask.id)]
+    assert [t.id for t in snapshot.ancestors_of(subtask.id)] == expected
+    expected = {t.id for t in await get_children(async_session, task.id)}
+    assert {t.id for t in snapshot.children_of(task.id)} == expected
+
+    [dep] = snapshot.dependencies_of(epics[1].id)
+    assert dep.depends_on_id == epics[0].id
+    assert dep.depends_on_title == "Epic 1"
+
+    [objective] = snapshot.objectives_of(task.id)
+    assert objective.level == "apply"
+
+    assert snapshot.get(task.id).to_task().task_type == TaskType.TASK
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_cached_and_invalidated(async_session):
+    """Test that the snapshot is reused until the template changes."""
+    project, epics, task, _ = await _create_project(async_session)
+
+    snapshot = await load_project_snapshot(async_session, project.id)
+    assert await load_project_snapshot(async_session, project.id) is snapshot
+
+    await attach_objective(async_session, task.id, "Explain joins", BloomLevel.UNDERSTAND)
+    refreshed = await load_project_snapshot(async_session, project.id)
+    assert refreshed is not snapshot
+    assert len(refreshed.objectives_of(task.id)) == 1
+
+    await create_task(
+        async_session, TaskCreate(title="Task 2", task_type=TaskType.TASK, parent_id=epics[0].id)
+    )
+    refreshed_again = await load_project_snapshot(async_session, project.id)
+    assert len(refreshed_again.children_of(epics[0].id)) == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reloaded_on_edits_from_other_processes(async_engine, async_session):
+    """Test that template edits committed without invalidation are still picked up."""
+    project, _, task, _ = await _create_project(async_session)
+    snapshot = await load_project_snapshot(async_session, project.id)
+
+    # Simulate another process editing the task
+    async with AsyncSession(async_engine) as other:
+        other_task = await other.get(TaskModel, task.id)
+        other_task.acceptance_criteria = "Every table has been queried."
+        await other.commit()
+
+    refreshed = await load_project_snapshot(async_session, project.id)
+    assert refreshed is not snapshot
+    assert refreshed.get(task.id).acceptance_criteria == "Every table has been queried."
+
+
+@pytest.mark.asyncio
+async def test_snapshot_of_missing_project(async_session):
+    """Test that an unknown project yields an empty, uncached snapshot."""
+    snapshot = await load_project_snapshot(async_session, "proj-missing")
+
+    assert snapshot.project is None
+    assert snapshot.tasks == ()
+    assert snapshot.children_of("proj-missing") == []
@@ -0,0 +1,174 @@
+"""
+Tests for the incremental ready-set engine.
+"""
+
+import pytest
+from ltt.models import LearnerModel, LearnerTaskProgressModel, TaskCreate, TaskStatus, TaskType
+from ltt.services.dependency_service import add_dependency, get_ready_work
+from ltt.services.progress_service import apply_status, close_task, reopen_task, start_task
+from ltt.services.ready_set import advance_progress_revision, get_ready_set, get_ready_tasks
+from ltt.services.task_service import create_task
+from ltt.utils.ids import PREFIX_LEARNER, PREFIX_LEARNER_TASK_PROGRESS, generate_entity_id
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def _create_learner(session) -> str:
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await session.commit()
+    return learner_id
+
+
+async def _create_chain(session):
+    """Project with epic1 -> epic2 (blocks), each epic having one task."""
+    project = await create_task(session, TaskCreate(title="Project", task_type=TaskType.PROJECT))
+    epic1 = await create_task(
+        session, TaskCreate(title="Epic 1", task_type=TaskType.EPIC, parent_id=project.id)
+    )
+    epic2 = await create_task(
+        session, TaskCreate(title="Epic 2", task_type=TaskType.EPIC, parent_id=project.id)
+    )
+    task1 = await create_task(
+        session, TaskCreate(title="Task 1", task_type=TaskType.TASK, parent_id=epic1.id)
+    )
+    task2 = await create_task(
+        session, TaskCreate(title="Task 2", task_type=TaskType.TASK, parent_id=epic2.id)
+    )
+    await add_dependency(session, epic2.id, epic1.id)
+    return project, epic1, epic2, task1, task2
+
+
+@pytest.mark.asyncio
+async def test_ready_set_matches_get_ready_work(async_session):
+    """Test that the ready set follows transitions like a full recomputation."""
+    learner_id = await _create_learner(async_session)
+    project, epic1, epic2, task1, task2 = await _create_chain(async_session)
+
+    async def assert_consistent():
+        expected = await get_ready_work(async_session, project.id, learner_id, limit=20)
+        actual = await get_ready_tasks(async_session, project.id, learner_id, limit=20)
+        assert [t.id for t in actual] == [t.id for t in expected]
+        return [t.id for t in actual]
+
+    ready_set = await get_ready_set(async_session, project.id, learner_id)
+    ready = await assert_consistent()
+    assert task2.id not in ready
+
+    await start_task(async_session, task1.id, learner_id)
+    assert (await assert_consistent())[0] == task1.id
+
+    await close_task(async_session, task1.id, learner_id, "done")
+    await start_task(async_session, epic1.id, learner_id)
+    await close_task(async_session, epic1.id, learner_id, "done")
+    ready = await assert_consistent()
+    assert task2.id in ready
+    assert epic2.id in ready
+
+    # Reopening the blocker blocks the whole epic subtree again
+    await reopen_task(async_session, epic1.id, learner_id)
+    ready = await assert_consistent()
+    assert task2.id not in ready
+    assert epic2.id not in ready
+
+    # Same in-memory state was updated incrementally throughout
+    assert await get_ready_set(async_session, project.id, learner_id) is ready_set
+
+
+@pytest.mark.asyncio
+async def test_ready_set_rebuilds_on_external_write(async_session):
+    """Test that progress written outside progress_service is picked up."""
+    learner_id = await _create_learner(async_session)
+    project, epic1, epic2, task1, task2 = await _create_chain(async_session)
+
+    ready = await get_ready_tasks(async_session, project.id, learner_id, task_type="epic")
+    assert [t.id for t in ready] == [epic1.id]
+
+    # Simulate another process closing the blocker
+    await advance_progress_revision(async_session, learner_id)
+    async_session.add(
+        LearnerTaskProgressModel(
+            id=generate_entity_id(PREFIX_LEARNER_TASK_PROGRESS),
+            task_id=epic1.id,
+            learner_id=learner_id,
+            status=TaskStatus.CLOSED.value,
+        )
+    )
+    await async_session.commit()
+
+    ready = await get_ready_tasks(async_session, project.id, learner_id, task_type="epic")
+    assert [t.id for t in ready] == [epic2.id]
+
+
+@pytest.mark.asyncio
+async def test_ready_set_rebuilds_on_external_write_before_own(async_session):
+    """Test that an own transition does not hide another process's earlier write."""
+    learner_id = await _create_learner(async_session)
+    project, epic1, epic2, task1, task2 = await _create_chain(async_session)
+
+    ready = await get_ready_tasks(async_session, project.id, learner_id, task_type="epic")
+    assert [t.id for t in ready] == [epic1.id]
+
+    # Another process closes the blocker, then this process starts the project
+    await advance_progress_revision(async_session, learner_id)
+    async_session.add(
+        LearnerTaskProgressModel(
+            id=generate_entity_id(PREFIX_LEARNER_TASK_PROGRESS),
+            task_id=epic1.id,
+            learner_id=learner_id,
+            status=TaskStatus.CLOSED.value,
+        )
+    )
+    await async_session.commit()
+    await start_task(async_session, project.id, learner_id)
+
+    ready = await get_ready_tasks(async_session, project.id, learner_id, task_type="epic")
+    assert [t.id for t in ready] == [epic2.id]
+
+
+@pytest.mark.asyncio
+async def test_ready_set_sees_write_committed_after_read(async_engine, async_session):
+    """Test a write that started before a read but committed after it is picked up."""
+    learner_id = await _create_learner(async_session)
+    project, epic1, epic2, task1, task2 = await _create_chain(async_session)
+    await start_task(async_session, task2.id, learner_id)
+
+    async with AsyncSession(async_engine) as other:
+        # Another process's transaction starts, fixing its now()
+        await other.execute(text("SELECT now()"))
+
+        await start_task(async_session, task1.id, learner_id)
+        ready_set = await get_ready_set(async_session, project.id, learner_id)
+        assert ready_set.status_of(task2.id) == TaskStatus.IN_PROGRESS.value
+
+        # Its update keeps the row count and carries an older updated_at
+        await apply_status(other, task2.id, learner_id, TaskStatus.OPEN)
+        await other.commit()
+
+    ready_set = await get_ready_set(async_session, project.id, learner_id)
+    assert ready_set.status_of(task2.id) == TaskStatus.OPEN.value
+
+
+@pytest.mark.asyncio
+async def test_ready_set_tracks_external_blocker(async_session):
+    """Test that a blocker in another project updates the dependent project's ready set."""
+    learner_id = await _create_learner(async_session)
+    other = await create_task(async_session, TaskCreate(title="Other", task_type=TaskType.PROJECT))
+    prereq = await create_task(
+        async_session, TaskCreate(title="Prereq", task_type=TaskType.TASK, parent_id=other.id)
+    )
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task = await create_task(
+        async_session, TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=project.id)
+    )
+    await add_dependency(async_session, task.id, prereq.id)
+
+    assert await get_ready_tasks(async_session, project.id, learner_id, task_type="task") == []
+
+    await start_task(async_session, prereq.id, learner_id)
+    await close_task(async_session, prereq.id, learner_id, "done")
+
+    ready = await get_ready_tasks(async_session, project.id, learner_id, task_type="task")
+    assert [t.id for t in ready] == [task.id]
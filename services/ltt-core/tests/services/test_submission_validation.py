@@ -9,6 +9,7 @@ from ltt.models import (
     TaskCreate,
     TaskStatus,
     TaskType,
+    ValidationModel,
     ValidatorType,
 )
 from ltt.services.progress_service import InvalidStatusTransitionError, update_status
@@ -21,17 +22,26 @@ from ltt.services.submission_service import (
     get_latest_submission,
     get_submission,
     get_submissions,
+    submit_and_validate,
 )
 from ltt.services.task_service import create_task
 from ltt.services.validation_service import (
     ValidationNotFoundError,
     can_close_task,
+    clear_verdict_cache,
     create_manual_validation,
     get_latest_validation,
     get_validation,
     get_validations,
     validate_submission,
 )
+from ltt.services.validators import (
+    SQLResultValidator,
+    Validator,
+    ValidatorInfrastructureError,
+    register_validator,
+    unregister_validator,
+)
 from ltt.utils.ids import PREFIX_LEARNER, generate_entity_id
 
 # ============================================================================
@@ -247,6 +257,65 @@ async def test_get_attempt_count(async_session):
     assert count == 2
 
 
+@pytest.mark.asyncio
+async def test_concurrent_submissions_get_distinct_attempt_numbers(async_engine, async_session):
+    """Test that racing submissions are numbered by the progress row counter."""
+    import asyncio
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+
+    session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def submit(content):
+        async with session_factory() as session:
+            return await create_submission(
+                session, project.id, learner_id, content, SubmissionType.TEXT
+            )
+
+    submissions = await asyncio.gather(*(submit(f"Attempt {i}") for i in range(4)))
+
+    assert sorted(s.attempt_number for s in submissions) == [1, 2, 3, 4]
+    assert await get_attempt_count(async_session, project.id, learner_id) == 4
+
+
+@pytest.mark.asyncio
+async def test_progress_row_tracks_latest_validation(async_session):
+    """Test that validations keep the latest-validation pointer current."""
+    from ltt.services.progress_service import get_progress
+
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+
+    failed = await create_submission(async_session, project.id, learner_id, " ", SubmissionType.TEXT)
+    await validate_submission(async_session, failed.id)
+
+    progress = await get_progress(async_session, project.id, learner_id)
+    assert progress.attempt_count == 1
+    assert progress.latest_submission_id == failed.id
+    assert progress.latest_validation_passed is False
+
+    passed = await create_submission(async_session, project.id, learner_id, "Done", SubmissionType.TEXT)
+    await validate_submission(async_session, passed.id)
+
+    progress = await get_progress(async_session, project.id, learner_id)
+    assert progress.attempt_count == 2
+    assert progress.latest_submission_id == passed.id
+    assert progress.latest_validation_passed is True
+
+
 # ============================================================================
 # Validation Service Tests
 # ============================================================================
@@ -577,6 +646,49 @@ async def test_validation_stores_grade_on_pass(async_session):
     assert validation.feedback == "Passed: non-empty submission"
 
 
+@pytest.mark.asyncio
+async def test_sql_check_stores_its_own_pass_feedback(async_session, tmp_path):
+    """Test that a passing result-set check is not reported as a non-empty check."""
+    dataset = tmp_path / "dataset.sql"
+    dataset.write_text(
+        "CREATE TABLE employee (id INTEGER PRIMARY KEY, name TEXT, town TEXT);"
+        " INSERT INTO employee VALUES (1, 'Amara', 'Sokoto'), (2, 'Chidi', 'Harare');"
+    )
+    register_validator(SQLResultValidator(dataset_path=str(dataset)), subtask_type="sql_checked")
+    clear_verdict_cache()
+
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    subtask = await create_task(
+        async_session,
+        TaskCreate(
+            title="Sokoto staff",
+            task_type=TaskType.SUBTASK,
+            parent_id=project.id,
+            subtask_type="sql_checked",
+            checks=[{"query": "SELECT name FROM employee WHERE town = 'Sokoto'"}],
+        ),
+    )
+    try:
+        result = await submit_and_validate(
+            async_session,
+            subtask.id,
+            learner_id,
+            "SELECT name FROM employee WHERE id = 1",
+            SubmissionType.SQL,
+        )
+    finally:
+        unregister_validator(subtask_type="sql_checked")
+
+    validation = await async_session.get(ValidationModel, result.validation.id)
+    assert validation.passed is True
+    assert validation.feedback == "Query results match the expected results"
+
+
 @pytest.mark.asyncio
 async def test_validation_stores_grade_on_fail(async_session):
     """Test that failing validation stores grade=0.0."""
@@ -647,3 +759,206 @@ async def test_manual_validation_defaults_grade(async_session):
     validation = await create_manual_validation(async_session, submission.id, passed=True)
     assert validation.grade == 1.0
     assert validation.grader_type == "manual"
+
+
+# ============================================================================
+# Submit Pipeline Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_submit_and_validate_closes_task_and_ancestors(async_session):
+    """Test that a passing submit closes the subtask and its ancestors in one commit."""
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task = await create_task(
+        async_session, TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=project.id)
+    )
+    subtask = await create_task(
+        async_session, TaskCreate(title="Subtask", task_type=TaskType.SUBTASK, parent_id=task.id)
+    )
+    for task_id in (project.id, task.id, subtask.id):
+        await update_status(async_session, task_id, learner_id, TaskStatus.IN_PROGRESS)
+
+    await create_submission(async_session, subtask.id, learner_id, "Draft", SubmissionType.TEXT)
+    result = await submit_and_validate(
+        async_session, subtask.id, learner_id, "Valid content", SubmissionType.TEXT
+    )
+
+    assert result.submission.attempt_number == 2
+    assert result.validation.passed is True
+    assert result.validation.submission_id == result.submission.id
+    assert result.status == TaskStatus.CLOSED
+    assert result.close_error is None
+    assert result.auto_closed == [task.id, project.id]
+
+
+@pytest.mark.asyncio
+async def test_submit_and_validate_failed_validation_keeps_status(async_session):
+    """Test that a failing submit records the attempt without closing the task."""
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    subtask = await create_task(
+        async_session, TaskCreate(title="Subtask", task_type=TaskType.SUBTASK, parent_id=project.id)
+    )
+    await update_status(async_session, subtask.id, learner_id, TaskStatus.IN_PROGRESS)
+
+    result = await submit_and_validate(
+        async_session, subtask.id, learner_id, "", SubmissionType.TEXT
+    )
+
+    assert result.validation.passed is False
+    assert result.status == TaskStatus.IN_PROGRESS
+    assert result.auto_closed == []
+    assert await get_attempt_count(async_session, subtask.id, learner_id) == 1
+
+
+@pytest.mark.asyncio
+async def test_submit_and_validate_rejects_closed_task(async_session):
+    """Test that submitting to a closed task raises without writing anything."""
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    await update_status(async_session, project.id, learner_id, TaskStatus.IN_PROGRESS)
+    await update_status(async_session, project.id, learner_id, TaskStatus.CLOSED)
+
+    with pytest.raises(InvalidStateError):
+        await submit_and_validate(
+            async_session, project.id, learner_id, "Content", SubmissionType.TEXT
+        )
+
+
+# ============================================================================
+# Verdict Reuse Tests
+# ============================================================================
+
+
+class CountingValidator(Validator):
+    """Passes content equal to "ok" and counts its runs."""
+
+    def __init__(self, deterministic: bool):
+        self.deterministic = deterministic
+        self.runs = 0
+        self.timing_out = False
+
+    async def validate(self, content, acceptance_criteria, submission_type, checks=None):
+        self.runs += 1
+        if self.timing_out:
+            raise ValidatorInfrastructureError("Validation timed out after 1s")
+        return (True, None) if content == "ok" else (False, "Expected ok")
+
+
+async def _counting_setup(async_session, deterministic: bool):
+    validator = CountingValidator(deterministic)
+    register_validator(validator, subtask_type="counted")
+    clear_verdict_cache()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    subtask = await create_task(
+        async_session,
+        TaskCreate(
+            title="Subtask", task_type=TaskType.SUBTASK, parent_id=project.id, subtask_type="counted"
+        ),
+    )
+    learner_ids = []
+    for _ in range(2):
+        learner_id = generate_entity_id(PREFIX_LEARNER)
+        async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+        learner_ids.append(learner_id)
+    await async_session.commit()
+    return validator, subtask, learner_ids
+
+
+@pytest.mark.asyncio
+async def test_resubmission_reuses_learner_verdict(async_session):
+    """Test that identical content is validated once per learner."""
+    validator, subtask, (learner_id, _) = await _counting_setup(async_session, deterministic=False)
+    try:
+        first = await create_submission(
+            async_session, subtask.id, learner_id, "wrong", SubmissionType.TEXT
+        )
+        second = await create_submission(
+            async_session, subtask.id, learner_id, "wrong\r\n", SubmissionType.TEXT
+        )
+        first_validation = await validate_submission(async_session, first.id)
+        second_validation = await validate_submission(async_session, second.id)
+    finally:
+        unregister_validator(subtask_type="counted")
+
+    assert validator.runs == 1
+    assert second_validation.id != first_validation.id
+    assert second_validation.submission_id == second.id
+    assert second_validation.passed is False
+    assert second_validation.error_message == "Expected ok"
+
+
+@pytest.mark.asyncio
+async def test_deterministic_verdict_shared_across_learners(async_session):
+    """Test that deterministic verdicts are cached per task across learners."""
+    validator, subtask, learner_ids = await _counting_setup(async_session, deterministic=True)
+    try:
+        for learner_id in learner_ids:
+            result = await submit_and_validate(
+                async_session, subtask.id, learner_id, "ok", SubmissionType.TEXT
+            )
+            assert result.validation.passed is True
+            assert result.validation.feedback == "Passed"
+    finally:
+        unregister_validator(subtask_type="counted")
+
+    assert validator.runs == 1
+
+
+@pytest.mark.asyncio
+async def test_non_deterministic_verdict_not_shared(async_session):
+    """Test that other learners' verdicts are not reused for non-deterministic validators."""
+    validator, subtask, learner_ids = await _counting_setup(async_session, deterministic=False)
+    try:
+        for learner_id in learner_ids:
+            await submit_and_validate(async_session, subtask.id, learner_id, "ok", SubmissionType.TEXT)
+    finally:
+        unregister_validator(subtask_type="counted")
+
+    assert validator.runs == 2
+
+
+@pytest.mark.asyncio
+async def test_infrastructure_error_is_not_reused(async_session):
+    """Test that a validator run without a verdict fails but is neither cached nor reused."""
+    validator, subtask, (learner_id, _) = await _counting_setup(async_session, deterministic=True)
+    validator.timing_out = True
+    try:
+        results = [
+            await submit_and_validate(
+                async_session, subtask.id, learner_id, "ok", SubmissionType.TEXT
+            )
+            for _ in range(2)
+        ]
+        validator.timing_out = False
+        retried = await submit_and_validate(
+            async_session, subtask.id, learner_id, "ok", SubmissionType.TEXT
+        )
+    finally:
+        unregister_validator(subtask_type="counted")
+
+    assert validator.runs == 3
+    for result in results:
+        assert result.validation.passed is False
+        assert result.validation.error_message == "Validation timed out after 1s"
+    assert retried.validation.passed is True
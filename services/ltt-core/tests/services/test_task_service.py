@@ -3,11 +3,19 @@ Tests for task management service.
 """
 
 import pytest
-from ltt.models import CommentCreate, TaskCreate, TaskModel, TaskType, TaskUpdate
+from ltt.models import (
+    CommentCreate,
+    TaskClosureModel,
+    TaskCreate,
+    TaskModel,
+    TaskType,
+    TaskUpdate,
+)
 from ltt.services.task_service import (
     InvalidTaskHierarchyError,
     TaskNotFoundError,
     add_comment,
+    backfill_task_closure,
     create_task,
     delete_task,
     get_ancestors,
@@ -194,6 +202,56 @@ async def test_get_ancestors(async_session):
     assert ancestors[1].title == "Project"  # Root last
 
 
+@pytest.mark.asyncio
+async def test_backfill_task_closure(async_session):
+    """Test that tasks created without closure rows are indexed by the backfill."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT), update_closure=False
+    )
+    epic = await create_task(
+        async_session,
+        TaskCreate(title="Epic", task_type=TaskType.EPIC, parent_id=project.id),
+        update_closure=False,
+    )
+    task = await create_task(
+        async_session,
+        TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=epic.id),
+        update_closure=False,
+    )
+    assert await get_ancestors(async_session, task.id) == []
+
+    await backfill_task_closure(async_session, project.id)
+    # Running it again is a no-op
+    await backfill_task_closure(async_session, project.id)
+
+    assert [a.id for a in await get_ancestors(async_session, task.id)] == [epic.id, project.id]
+    descendants = await get_children(async_session, project.id, recursive=True)
+    assert [d.id for d in descendants] == [epic.id, task.id]
+
+
+@pytest.mark.asyncio
+async def test_delete_task_removes_closure_rows(async_session):
+    """Test that deleting a subtree drops it from hierarchy lookups."""
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    epic1 = await create_task(
+        async_session, TaskCreate(title="Epic 1", task_type=TaskType.EPIC, parent_id=project.id)
+    )
+    epic2 = await create_task(
+        async_session, TaskCreate(title="Epic 2", task_type=TaskType.EPIC, parent_id=project.id)
+    )
+
+    await delete_task(async_session, epic1.id)
+
+    result = await async_session.execute(
+        select(TaskClosureModel).where(TaskClosureModel.descendant_id == epic1.id)
+    )
+    assert result.scalars().all() == []
+    descendants = await get_children(async_session, project.id, recursive=True)
+    assert [d.id for d in descendants] == [epic2.id]
+
+
 @pytest.mark.asyncio
 async def test_add_comment(async_session):
     """Test adding a comment to a task."""
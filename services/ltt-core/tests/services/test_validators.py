@@ -0,0 +1,210 @@
+"""
+Tests for the validator registry, the validator process pool and the SQL
+result-set validator.
+"""
+
+import asyncio
+import signal
+import time
+
+import pytest
+from ltt.models import SubmissionType
+from ltt.services.validators import (
+    PooledValidator,
+    SimpleValidator,
+    SQLResultValidator,
+    ValidatorInfrastructureError,
+    get_validator,
+    register_validator,
+    unregister_validator,
+)
+
+
+class EchoValidator(PooledValidator):
+    """Passes when the content equals the acceptance criteria."""
+
+    def check(self, content, acceptance_criteria, submission_type, checks=None):
+        if content == acceptance_criteria:
+            return True, None
+        return False, f"Expected {acceptance_criteria!r}"
+
+
+class SpinValidator(PooledValidator):
+    """Never finishes."""
+
+    timeout = 0.5
+
+    def check(self, content, acceptance_criteria, submission_type, checks=None):
+        while True:
+            pass
+
+
+class StuckValidator(PooledValidator):
+    """Ignores the in-worker time limit, so only the backstop can stop it."""
+
+    timeout = 0.5
+
+    def check(self, content, acceptance_criteria, submission_type, checks=None):
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+        while True:
+            pass
+
+
+class SlowValidator(PooledValidator):
+    """Passes after a few seconds."""
+
+    def check(self, content, acceptance_criteria, submission_type, checks=None):
+        time.sleep(3)
+        return True, None
+
+
+def test_get_validator_defaults_to_simple():
+    """Test that unregistered submissions use the SimpleValidator."""
+    assert isinstance(get_validator(SubmissionType.TEXT.value, "exercise"), SimpleValidator)
+
+
+def test_get_validator_prefers_most_specific_registration():
+    """Test lookup order: (type, subtask) > subtask > type."""
+    by_type = EchoValidator()
+    by_subtask = EchoValidator()
+    by_both = EchoValidator()
+    register_validator(by_type, submission_type=SubmissionType.SQL.value)
+    register_validator(by_subtask, subtask_type="exercise")
+    register_validator(by_both, SubmissionType.SQL.value, "exercise")
+    try:
+        assert get_validator(SubmissionType.SQL.value, "exercise") is by_both
+        assert get_validator(SubmissionType.CODE.value, "exercise") is by_subtask
+        assert get_validator(SubmissionType.SQL.value, "conversational") is by_type
+    finally:
+        unregister_validator(submission_type=SubmissionType.SQL.value)
+        unregister_validator(subtask_type="exercise")
+        unregister_validator(SubmissionType.SQL.value, "exercise")
+
+
+def test_get_validator_uses_sql_validator_for_sql():
+    """Test that SQL submissions use the built-in SQL result validator."""
+    assert isinstance(get_validator(SubmissionType.SQL.value, "exercise"), SQLResultValidator)
+
+
+def test_register_validator_requires_a_key():
+    """Test that a registration must name a submission or subtask type."""
+    with pytest.raises(ValueError):
+        register_validator(EchoValidator())
+
+
+@pytest.mark.asyncio
+async def test_pooled_validator_runs_in_worker():
+    """Test that a pooled validator returns its worker-side result."""
+    validator = EchoValidator()
+
+    assert await validator.validate("42", "42", "text") == (True, None)
+    assert await validator.validate("41", "42", "text") == (False, "Expected '42'")
+
+
+@pytest.mark.asyncio
+async def test_pooled_validator_times_out():
+    """Test that a runaway check raises a timeout instead of hanging."""
+    with pytest.raises(ValidatorInfrastructureError, match="timed out"):
+        await SpinValidator().validate("x", "", "code")
+
+    # The pool keeps serving later validations
+    assert await EchoValidator().validate("a", "a", "text") == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_stuck_worker_does_not_fail_other_validations():
+    """Test that killing a stuck worker leaves checks in other workers running."""
+    stuck, slow = await asyncio.gather(
+        StuckValidator().validate("x", "", "code"),
+        SlowValidator().validate("x", "", "code"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(stuck, ValidatorInfrastructureError)
+    assert slow == (True, None)
+    assert await EchoValidator().validate("a", "a", "text") == (True, None)
+
+
+# ============================================================================
+# SQL Result Validator Tests
+# ============================================================================
+
+DATASET = """
+CREATE TABLE employee (id INTEGER PRIMARY KEY, name TEXT, town TEXT, salary REAL);
+INSERT INTO employee VALUES
+    (1, 'Amara', 'Sokoto', 1200.5),
+    (2, 'Bello', 'Sokoto', 980.0),
+    (3, 'Chidi', 'Harare', 1500.25);
+"""
+
+TOWN_CHECK = {"query": "SELECT name FROM employee WHERE town = 'Sokoto'", "expect": {}}
+
+
+@pytest.fixture
+def sql_validator(tmp_path):
+    dataset = tmp_path / "dataset.sql"
+    dataset.write_text(DATASET)
+    return SQLResultValidator(dataset_path=str(dataset), max_rows=2, query_timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_sql_validator_passes_matching_result(sql_validator):
+    """Test that a different query with the same result set passes."""
+    content = "select name from employee where id in (2, 1)"
+
+    assert await sql_validator.validate(content, "", "sql", [TOWN_CHECK]) == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_sql_validator_fails_different_result(sql_validator):
+    """Test that a query with a different result set fails."""
+    content = "SELECT name FROM employee WHERE town = 'Harare'"
+
+    passed, error = await sql_validator.validate(content, "", "sql", [TOWN_CHECK])
+
+    assert passed is False
+    assert "1 rows; expected 2" in error
+
+
+@pytest.mark.asyncio
+async def test_sql_validator_respects_order_by(sql_validator):
+    """Test that row order matters only when the reference orders rows."""
+    check = {"query": "SELECT name FROM employee WHERE town = 'Sokoto' ORDER BY name DESC"}
+
+    passed, _ = await sql_validator.validate(
+        "SELECT name FROM employee WHERE town = 'Sokoto' ORDER BY name", "", "sql", [check]
+    )
+
+    assert passed is False
+
+
+@pytest.mark.asyncio
+async def test_sql_validator_applies_expectations(sql_validator):
+    """Test that expect constraints are checked without a reference match."""
+    check = {"query": "SELECT 1", "expect": {"columns": ["TOWN"], "match_reference": False}}
+
+    assert await sql_validator.validate(
+        "SELECT DISTINCT town FROM employee", "", "sql", [check]
+    ) == (True, None)
+    passed, error = await sql_validator.validate("SELECT name FROM employee LIMIT 1", "", "sql", [check])
+    assert passed is False
+    assert "columns" in error
+
+
+@pytest.mark.asyncio
+async def test_sql_validator_enforces_limits(sql_validator):
+    """Test the row cap and that the dataset is read-only."""
+    passed, error = await sql_validator.validate("SELECT * FROM employee", "", "sql", [TOWN_CHECK])
+    assert passed is False
+    assert "more than 2 rows" in error
+
+    passed, error = await sql_validator.validate("DELETE FROM employee", "", "sql", [TOWN_CHECK])
+    assert passed is False
+    assert "not authorized" in error
+
+
+@pytest.mark.asyncio
+async def test_sql_validator_without_checks_only_requires_content(sql_validator):
+    """Test that tasks without checks keep the non-empty check."""
+    assert await sql_validator.validate("SELECT nonsense", "", "sql") == (True, None)
+    assert (await sql_validator.validate("  ", "", "sql"))[0] is False
@@ -0,0 +1,161 @@
+"""
+Tests for batched tool execution (execute_tools_batch).
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from ltt.models import LearnerModel, TaskCreate, TaskType
+from ltt.services.task_service import create_task
+from ltt.tools import ToolError, execute_tools_batch
+from ltt.tools.schemas import GetCommentsOutput, TaskDetailOutput
+from ltt.utils.ids import PREFIX_LEARNER, generate_entity_id
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    """Session factory that records how many sessions are open at once."""
+    maker = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    stats = {"opened": 0, "open": 0, "max_open": 0}
+
+    @asynccontextmanager
+    async def factory():
+        stats["opened"] += 1
+        stats["open"] += 1
+        stats["max_open"] = max(stats["max_open"], stats["open"])
+        try:
+            async with maker() as session:
+                yield session
+        finally:
+            stats["open"] -= 1
+
+    factory.stats = stats
+    return factory
+
+
+async def _learner_and_task(async_session):
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task = await create_task(
+        async_session,
+        TaskCreate(
+            title="Task", task_type=TaskType.TASK, parent_id=project.id, project_id=project.id
+        ),
+    )
+    await async_session.commit()
+    return learner_id, task
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_results_in_call_order(async_session, session_factory):
+    """Test results line up with the calls."""
+    learner_id, task = await _learner_and_task(async_session)
+
+    results = await execute_tools_batch(
+        [
+            ("get_comments", {"task_id": task.id}),
+            ("show_task", {"task_id": task.id}),
+            ("no_such_tool", {}),
+        ],
+        learner_id,
+        session_factory,
+    )
+
+    assert isinstance(results[0], GetCommentsOutput)
+    assert isinstance(results[1], TaskDetailOutput)
+    assert isinstance(results[2], ToolError)
+    assert results[2].error_code == "UNKNOWN_TOOL"
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_reads_concurrently(async_session, session_factory):
+    """Test consecutive read-only calls run at once on separate sessions."""
+    learner_id, task = await _learner_and_task(async_session)
+
+    await execute_tools_batch(
+        [
+            ("show_task", {"task_id": task.id}),
+            ("get_context", {"task_id": task.id}),
+            ("get_comments", {"task_id": task.id}),
+        ],
+        learner_id,
+        session_factory,
+    )
+
+    assert session_factory.stats["max_open"] == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_reads_see_earlier_writes(async_session, session_factory):
+    """Test a read after a mutating call in the same batch sees its effect."""
+    learner_id, task = await _learner_and_task(async_session)
+
+    results = await execute_tools_batch(
+        [
+            ("show_task", {"task_id": task.id}),
+            ("start_task", {"task_id": task.id}),
+            ("show_task", {"task_id": task.id}),
+        ],
+        learner_id,
+        session_factory,
+    )
+
+    assert results[0].status == "open"
+    assert results[1].success is True
+    assert results[2].status == "in_progress"
+
+
+@pytest.mark.asyncio
+async def test_batch_writes_share_one_session(async_session, session_factory):
+    """Test mutating calls run in order on one session, past a failed call."""
+    learner_id, task = await _learner_and_task(async_session)
+
+    results = await execute_tools_batch(
+        [
+            ("start_task", {"task_id": "missing"}),
+            ("start_task", {"task_id": task.id}),
+            ("add_comment", {"task_id": task.id, "comment": "Started"}),
+        ],
+        learner_id,
+        session_factory,
+    )
+
+    assert isinstance(results[0], ToolError)
+    assert results[1].success is True
+    assert results[2].text == "Started"
+    assert session_factory.stats["opened"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_isolates_failing_calls(async_session, async_engine):
+    """Test a call whose session cannot be opened fails alone."""
+    learner_id, task = await _learner_and_task(async_session)
+    maker = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    opened = 0
+
+    @asynccontextmanager
+    async def flaky_factory():
+        nonlocal opened
+        opened += 1
+        if opened == 2:
+            raise ConnectionError("connection refused")
+        async with maker() as session:
+            yield session
+
+    results = await execute_tools_batch(
+        [
+            ("show_task", {"task_id": task.id}),
+            ("get_comments", {"task_id": task.id}),
+            ("start_task", {"task_id": task.id}),
+        ],
+        learner_id,
+        flaky_factory,
+    )
+
+    assert sum(isinstance(r, ToolError) and r.error_code == "INTERNAL_ERROR" for r in results) == 1
+    assert results[2].success is True
@@ -0,0 +1,123 @@
+"""
+Tests for tool call instrumentation.
+"""
+
+import pytest
+from ltt.models import LearnerModel, TaskCreate, TaskType
+from ltt.services.task_service import create_task
+from ltt.tools import (
+    ToolError,
+    add_tool_metrics_sink,
+    execute_tool,
+    remove_tool_metrics_sink,
+)
+from ltt.tools.metrics import ToolCallMetrics, ToolLatencyHistogram
+from ltt.utils.ids import PREFIX_LEARNER, generate_entity_id
+
+
+@pytest.fixture
+def recorded():
+    calls = []
+    add_tool_metrics_sink(calls.append)
+    yield calls
+    remove_tool_metrics_sink(calls.append)
+
+
+async def _learner_and_task(async_session):
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task = await create_task(
+        async_session,
+        TaskCreate(
+            title="Task", task_type=TaskType.TASK, parent_id=project.id, project_id=project.id
+        ),
+    )
+    return learner_id, task
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_reports_metrics(async_session, recorded):
+    """Test execute_tool reports timings, statement count and payload size."""
+    learner_id, task = await _learner_and_task(async_session)
+
+    result = await execute_tool("show_task", {"task_id": task.id}, learner_id, async_session)
+
+    assert len(recorded) == 1
+    metrics = recorded[0]
+    assert metrics.tool_name == "show_task"
+    assert metrics.learner_id == learner_id
+    assert metrics.error_code is None
+    assert metrics.statements > 0
+    assert 0 < metrics.db_ms <= metrics.wall_ms
+    assert metrics.payload_bytes == len(result.model_dump_json().encode())
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_reports_error_code(async_session, recorded):
+    """Test a failed tool call is reported with its error code."""
+    learner_id, _ = await _learner_and_task(async_session)
+
+    result = await execute_tool("show_task", {"task_id": "missing"}, learner_id, async_session)
+
+    assert isinstance(result, ToolError)
+    assert recorded[0].error_code == "NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_failing_sink_does_not_fail_tool(async_session, recorded):
+    """Test a sink that raises does not affect the tool result."""
+    learner_id, task = await _learner_and_task(async_session)
+
+    def broken(metrics):
+        raise RuntimeError("sink down")
+
+    add_tool_metrics_sink(broken)
+    try:
+        result = await execute_tool("show_task", {"task_id": task.id}, learner_id, async_session)
+    finally:
+        remove_tool_metrics_sink(broken)
+
+    assert not isinstance(result, ToolError)
+    assert len(recorded) == 1
+
+
+def test_histogram_renders_prometheus_text():
+    """Test the histogram renders cumulative buckets per tool."""
+    histogram = ToolLatencyHistogram()
+    for wall_ms, statements in [(3, 1), (40, 4), (700, 30)]:
+        histogram(
+            ToolCallMetrics(
+                tool_name="get_ready",
+                learner_id="learner-1",
+                wall_ms=wall_ms,
+                db_ms=wall_ms / 2,
+                statements=statements,
+                payload_bytes=100,
+            )
+        )
+    histogram(
+        ToolCallMetrics(
+            tool_name="get_ready",
+            learner_id="learner-1",
+            wall_ms=1.0,
+            db_ms=0.0,
+            statements=0,
+            payload_bytes=50,
+            error_code="NOT_FOUND",
+        )
+    )
+
+    text = histogram.render_prometheus()
+
+    assert 'ltt_tool_call_duration_seconds_bucket{tool="get_ready",le="0.005"} 2' in text
+    assert 'ltt_tool_call_duration_seconds_bucket{tool="get_ready",le="0.05"} 3' in text
+    assert 'ltt_tool_call_duration_seconds_bucket{tool="get_ready",le="+Inf"} 4' in text
+    assert 'ltt_tool_call_duration_seconds_count{tool="get_ready"} 4' in text
+    assert 'ltt_tool_call_statements_bucket{tool="get_ready",le="5"} 3' in text
+    assert 'ltt_tool_call_payload_bytes_total{tool="get_ready"} 350' in text
+    assert 'ltt_tool_call_errors_total{tool="get_ready"} 1' in text
+    assert histogram.snapshot()["get_ready"]["count"] == 4
@@ -7,6 +7,7 @@ from ltt.models import (
     BloomLevel,
     DependencyType,
     LearnerModel,
+    LearnerTaskProgressModel,
     SubmissionType,
     TaskCreate,
     TaskStatus,
@@ -21,6 +22,7 @@ from ltt.services.validation_service import validate_submission
 from ltt.tools.navigation import get_context, get_ready, show_task
 from ltt.tools.schemas import GetContextInput, GetReadyInput, ShowTaskInput
 from ltt.utils.ids import PREFIX_LEARNER, generate_entity_id
+from sqlalchemy import func, select
 
 
 @pytest.mark.asyncio
@@ -364,3 +366,116 @@ async def test_show_task_includes_tutor_guidance(async_session):
 
     # narrative_context comes from project
     assert result.narrative_context is None  # This task doesn't have it (project does)
+
+
+@pytest.mark.asyncio
+async def test_read_tools_do_not_create_progress_rows(async_session):
+    """Test that viewing tasks does not lazily insert learner progress."""
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    epic = await create_task(
+        async_session, TaskCreate(title="Epic", task_type=TaskType.EPIC, parent_id=project.id)
+    )
+    task1 = await create_task(
+        async_session, TaskCreate(title="Task 1", task_type=TaskType.TASK, parent_id=epic.id)
+    )
+    task2 = await create_task(
+        async_session, TaskCreate(title="Task 2", task_type=TaskType.TASK, parent_id=epic.id)
+    )
+    await add_dependency(async_session, task2.id, task1.id)
+
+    detail = await show_task(ShowTaskInput(task_id=epic.id), learner_id, async_session)
+    assert [c.status for c in detail.children] == ["open", "open"]
+    await show_task(ShowTaskInput(task_id=task2.id), learner_id, async_session)
+    context = await get_context(GetContextInput(task_id=task1.id), learner_id, async_session)
+    assert context.current_task.status == "open"
+
+    result = await async_session.execute(
+        select(func.count())
+        .select_from(LearnerTaskProgressModel)
+        .where(LearnerTaskProgressModel.learner_id == learner_id)
+    )
+    assert result.scalar_one() == 0
+
+
+@pytest.mark.asyncio
+async def test_show_task_query_count_independent_of_fan_out(async_engine, async_session):
+    """Test that show_task costs the same number of queries for 2 or 6 children."""
+    from sqlalchemy import event
+
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    async def build(child_count):
+        project = await create_task(
+            async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+        )
+        for i in range(child_count):
+            task = await create_task(
+                async_session,
+                TaskCreate(title=f"Task {i}", task_type=TaskType.TASK, parent_id=project.id),
+            )
+            await create_task(
+                async_session,
+                TaskCreate(title=f"Subtask {i}", task_type=TaskType.SUBTASK, parent_id=task.id),
+            )
+        return project
+
+    small = await build(2)
+    large = await build(6)
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count)
+    try:
+        result = await show_task(ShowTaskInput(task_id=small.id), learner_id, async_session)
+        small_queries = len(statements)
+        statements.clear()
+        large_result = await show_task(ShowTaskInput(task_id=large.id), learner_id, async_session)
+        large_queries = len(statements)
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count)
+
+    assert len(result.children) == 2
+    assert len(large_result.children) == 6
+    assert all(child.has_children for child in large_result.children)
+    assert small_queries == large_queries
+
+
+@pytest.mark.asyncio
+async def test_tool_loader_scope_memoizes_across_calls(async_session):
+    """Test that tool calls in one scope reuse lookups and see status changes."""
+    from ltt.tools import tool_loader_scope
+    from ltt.tools.progress import start_task
+    from ltt.tools.schemas import StartTaskInput
+
+    learner_id = generate_entity_id(PREFIX_LEARNER)
+    async_session.add(LearnerModel(id=learner_id, learner_metadata="{}"))
+    await async_session.commit()
+
+    project = await create_task(
+        async_session, TaskCreate(title="Project", task_type=TaskType.PROJECT)
+    )
+    task = await create_task(
+        async_session, TaskCreate(title="Task", task_type=TaskType.TASK, parent_id=project.id)
+    )
+
+    with tool_loader_scope(learner_id) as loader:
+        first = await show_task(ShowTaskInput(task_id=task.id), learner_id, async_session)
+        assert first.status == "open"
+        assert task.id in loader._tasks
+
+        await start_task(StartTaskInput(task_id=task.id), learner_id, async_session)
+
+        # The status change invalidated the learner-scoped memo
+        second = await show_task(ShowTaskInput(task_id=task.id), learner_id, async_session)
+        assert second.status == "in_progress"
@@ -45,6 +45,18 @@ class Settings(BaseSettings):
     # Empty string → fall back to in-memory MemorySaver (no persistence).
     checkpoint_database_url: str = ""
 
+    # Checkpoint retention (see ltt.services.checkpoint_retention): checkpoints
+    # kept per thread, days of inactivity before a thread is dropped (0 = never),
+    # and how often the API runs the job in the background (0 = only via CLI).
+    checkpoint_keep_latest: int = 5
+    checkpoint_thread_ttl_days: int = 0
+    checkpoint_prune_interval_hours: float = 0
+
+    # When graph steps are written to the checkpointer: "sync" before the next
+    # step, "async" in the background while the next step runs, "exit" once per
+    # turn (a turn that fails midway loses its checkpoint, user message included).
+    checkpoint_durability: Literal["sync", "async", "exit"] = "async"
+
     # ── Redis ─────────────────────────────────────────────────────────────────
     # Empty string → LTI disabled; agent uses MemorySaver.
     redis_url: str = ""
@@ -77,6 +89,9 @@ class Settings(BaseSettings):
     debug: bool = False
     log_level: str = "INFO"
 
+    # Log one structured line per agent tool call (latency, SQL statements, size).
+    tool_metrics_log: bool = False
+
     # ── AI / Agent ────────────────────────────────────────────────────────────
     anthropic_api_key: str = ""
 
@@ -86,6 +101,15 @@ class Settings(BaseSettings):
     # Max conversation turns before forcing a summary checkpoint.
     max_conversation_turns: int = 50
 
+    # Turns kept verbatim when older turns are folded into the summary, and
+    # the approximate token budget for the verbatim history.
+    history_keep_turns: int = 10
+    history_token_budget: int = 12000
+
+    # Approximate token budget per tool result shown to the tutor; longer task
+    # texts are truncated with a pointer to show_task (0 = no compaction).
+    tool_output_token_budget: int = 1500
+
     # How many ready tasks to surface to the agent at once.
     ready_tasks_limit: int = 5
 
@@ -96,6 +120,24 @@ class Settings(BaseSettings):
     thinking_enabled: bool = False
     thinking_budget_tokens: int = 2000
 
+    # ── Validation ────────────────────────────────────────────────────────────
+    # Worker processes for CPU-heavy validators (SQL / code checks).
+    validator_pool_workers: int = 2
+
+    # Wall-clock limit for one pooled validation, in seconds.
+    validator_timeout_seconds: float = 10.0
+
+    # Address-space limit per validator worker process, in MB (0 = unlimited).
+    validator_memory_limit_mb: int = 512
+
+    # SQL script loaded into the in-memory SQLite database that SQL result
+    # checks run against (empty = SQL submissions only get the non-empty check).
+    sql_dataset_path: str = ""
+
+    # Per-query limits for SQL result checks.
+    sql_query_timeout_seconds: float = 2.0
+    sql_max_rows: int = 1000
+
     # ── Startup validation ────────────────────────────────────────────────────
 
     @model_validator(mode="after")